@@ -0,0 +1,12 @@
+from temporalio import activity
+
+from shared.cpu_work import hash_rounds
+
+# Synchronous, CPU-bound version of ssn_trace_activity, run by dev_server_worker/sync_worker.py
+# on a thread or process pool. It keeps the Activity name, so BackgroundCheck calls it unchanged.
+
+
+@activity.defn(name="ssn_trace_activity")
+def ssn_trace_activity(ssn) -> str:
+    hash_rounds(ssn)
+    return "pass"
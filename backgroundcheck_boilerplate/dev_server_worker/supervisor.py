@@ -0,0 +1,76 @@
+import argparse
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+
+from temporalio.client import Client
+from temporalio.worker import Worker
+
+from shared.metrics import install_metrics
+from shared.shutdown import run_until_signalled, set_graceful_shutdown
+from shared.supervisor import Supervisor, serve_health
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
+from activities.ssntraceactivity_dacx import ssn_trace_activity
+from workflows.backgroundcheck_dacx import BackgroundCheck
+
+
+async def run_worker(drain_timeout: float):
+    client = await Client.connect("localhost:7233")
+    options = worker_options()
+    set_graceful_shutdown(options, drain_timeout)
+    worker = Worker(
+        client,
+        task_queue="backgroundcheck-boilerplate-task-queue",
+        workflows=[BackgroundCheck],
+        activities=[ssn_trace_activity],
+        workflow_runner=sandbox_runner(),
+        **options,
+    )
+    await run_until_signalled(worker, drain_timeout=drain_timeout)
+
+
+def worker_process(drain_timeout: float):
+    # Each process serves its metrics on the next port, "worker-0" on the configured one
+    index = int(multiprocessing.current_process().name.rsplit("-", 1)[1])
+    install_metrics(port_offset=index)
+    asyncio.run(run_worker(drain_timeout))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run one Worker process per core for the background check Task Queue"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count(),
+        help="Worker processes to run, one per core by default",
+    )
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds each Worker has to finish in-flight tasks after SIGTERM",
+    )
+    parser.add_argument(
+        "--health-port", type=int, help="Serve aggregated health as JSON on this port"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    supervisor = Supervisor(
+        functools.partial(worker_process, args.drain_timeout),
+        args.processes,
+        drain_timeout=args.drain_timeout,
+    )
+    if args.health_port:
+        serve_health(supervisor, args.health_port)
+    supervisor.run()
+
+
+if __name__ == "__main__":
+    main()
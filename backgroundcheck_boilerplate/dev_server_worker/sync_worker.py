@@ -0,0 +1,33 @@
+import asyncio
+
+from temporalio.client import Client
+from temporalio.worker import Worker
+
+from shared.activity_executor import activity_executor
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
+from activities.ssntraceactivity_sync import ssn_trace_activity
+from workflows.backgroundcheck_dacx import BackgroundCheck
+
+
+async def main():
+    client = await Client.connect("localhost:7233")
+    options = worker_options()
+    with activity_executor(options=options) as executor_options:
+        worker = Worker(
+            client,
+            task_queue="backgroundcheck-boilerplate-task-queue",
+            workflows=[BackgroundCheck],
+            activities=[ssn_trace_activity],
+            workflow_runner=sandbox_runner(),
+            **options,
+            **executor_options,
+        )
+        await worker.run()
+
+
+if __name__ == "__main__":
+    install_metrics()
+    asyncio.run(main())
@@ -0,0 +1,37 @@
+"""
+The dev server Worker of main_dacx.py with the shared sandbox runner, Worker profile and metrics.
+
+From `backgroundcheck_boilerplate`, run:
+
+    TEMPORAL_WORKER_PROFILE=throughput poetry run python -m dev_server_worker.worker
+"""
+
+import asyncio
+
+from temporalio.client import Client
+from temporalio.worker import Worker
+
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
+from activities.ssntraceactivity_dacx import ssn_trace_activity
+from workflows.backgroundcheck_dacx import BackgroundCheck
+
+
+async def main():
+    client = await Client.connect("localhost:7233")
+    worker = Worker(
+        client,
+        task_queue="backgroundcheck-boilerplate-task-queue",
+        workflows=[BackgroundCheck],
+        activities=[ssn_trace_activity],
+        workflow_runner=sandbox_runner(),
+        **worker_options(),
+    )
+    await worker.run()
+
+
+if __name__ == "__main__":
+    install_metrics()
+    asyncio.run(main())
@@ -3,6 +3,11 @@ import asyncio
 from temporalio.client import Client
 from temporalio.worker import Worker
 
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.warmup import warm_up
+from shared.worker_profile import worker_options
+
 from backgroundcheck_replay.backgroundcheck_dacx import BackgroundCheck
 from backgroundcheck_replay.backgroundcheck_non_deterministic_code_dacx import (
     BackgroundCheckNonDeterministic,
@@ -11,6 +16,10 @@ from ssntraceactivity import ssn_trace_activity
 
 
 async def main():
+    # Pay the first Workflow task's one-time costs before polling, not on the first real task.
+    # BackgroundCheckNonDeterministic is left out, since it fails in the sandbox by design.
+    runner = sandbox_runner()
+    await warm_up({BackgroundCheck: ["555-55-5555"]}, workflow_runner=runner)
     client = await Client.connect(
         "localhost:7233", namespace="backgroundcheck_namespace"
     )
@@ -20,10 +29,13 @@ async def main():
         task_queue="backgroundcheck-boilerplate-task-queue-local",
         workflows=[BackgroundCheck, BackgroundCheckNonDeterministic],
         activities=[ssn_trace_activity],
+        workflow_runner=runner,
+        **worker_options(),
     )
 
     await worker.run()
 
 
 if __name__ == "__main__":
+    install_metrics()
     asyncio.run(main())
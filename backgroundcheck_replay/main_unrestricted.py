@@ -3,10 +3,12 @@ import dataclasses
 
 from temporalio.client import Client
 from temporalio.worker import Worker
-from temporalio.worker.workflow_sandbox import (
-    SandboxedWorkflowRunner,
-    SandboxRestrictions,
-)
+from temporalio.worker.workflow_sandbox import SandboxRestrictions
+
+from shared.metrics import install_metrics
+from shared.sandbox import SANDBOX_RESTRICTIONS, sandbox_runner
+from shared.warmup import warm_up
+from shared.worker_profile import worker_options
 
 from backgroundcheck_replay.backgroundcheck_dacx import BackgroundCheck
 from backgroundcheck_replay.backgroundcheck_non_deterministic_code_dacx import (
@@ -27,26 +29,35 @@ async def main():
     The restrictions below are to allow the random module to be used in the Workflow.
     """
     unrestricted_backgroundcheck = dataclasses.replace(
-        SandboxRestrictions.default,
+        SANDBOX_RESTRICTIONS,
         invalid_module_members=SandboxRestrictions.invalid_module_members_default.with_child_unrestricted(
             "random",
         ),
     )
     """
     The Worker will use the SandboxedWorkflowRunner to run the Workflows.
+    The first task of each Workflow is replayed at startup, so the first real task does not pay for loading them.
     """
+    runner = sandbox_runner(restrictions=unrestricted_backgroundcheck)
+    await warm_up(
+        {
+            BackgroundCheck: ["555-55-5555"],
+            BackgroundCheckNonDeterministic: ["555-55-5555"],
+        },
+        workflow_runner=runner,
+    )
     worker = Worker(
         client,
         task_queue="backgroundcheck-boilerplate-task-queue-local",
         workflows=[BackgroundCheck, BackgroundCheckNonDeterministic],
         activities=[ssn_trace_activity],
-        workflow_runner=SandboxedWorkflowRunner(
-            restrictions=unrestricted_backgroundcheck
-        ),
+        workflow_runner=runner,
+        **worker_options(),
     )
 
     await worker.run()
 
 
 if __name__ == "__main__":
+    install_metrics()
     asyncio.run(main())
@@ -3,6 +3,10 @@ import asyncio
 from temporalio.client import Client
 from temporalio.worker import Worker
 
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
 from your_workflows_dacx import LoopingWorkflow
 
 
@@ -12,9 +16,12 @@ async def main():
         client,
         task_queue="your-task-queue",
         workflows=[LoopingWorkflow],
+        workflow_runner=sandbox_runner(),
+        **worker_options(),
     )
     await worker.run()
 
 
 if __name__ == "__main__":
+    install_metrics()
     asyncio.run(main())
@@ -2,6 +2,11 @@ import asyncio
 
 from temporalio.client import Client
 from temporalio.worker import Worker
+
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
 from your_dynamic_activity_dacx import (
     GreetingWorkflow,
     default_greeting,
@@ -17,10 +22,13 @@ async def main():
         task_queue="dynamic-activity-task-queue",
         workflows=[GreetingWorkflow],
         activities=[dynamic_greeting, default_greeting],
+        workflow_runner=sandbox_runner(),
+        **worker_options(),
     )
 
     await worker.run()
 
 
 if __name__ == "__main__":
+    install_metrics()
     asyncio.run(main())
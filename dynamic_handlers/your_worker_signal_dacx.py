@@ -1,21 +1,43 @@
 import asyncio
+import logging
 
 from temporalio.client import Client
 from temporalio.worker import Worker
+
+from shared.cache_stats import cache_stats_from_env
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
 from your_dynamic_signal_dacx import GreetingWorkflow
 
 
 async def main():
-    client = await Client.connect("localhost:7233")
+    # Set TEMPORAL_CACHE_STATS_INTERVAL to log sticky cache hits, misses and evictions
+    cache_stats = cache_stats_from_env()
+    client = await Client.connect(
+        "localhost:7233", runtime=cache_stats.runtime if cache_stats else None
+    )
 
     worker = Worker(
         client,
         task_queue="dynamic-signal-task-queue",
         workflows=[GreetingWorkflow],
+        workflow_runner=sandbox_runner(),
+        **worker_options(),
     )
 
-    await worker.run()
+    log_task = None
+    if cache_stats:
+        log_task = asyncio.create_task(cache_stats.log_forever())
+    try:
+        await worker.run()
+    finally:
+        if log_task:
+            log_task.cancel()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    install_metrics()
     asyncio.run(main())
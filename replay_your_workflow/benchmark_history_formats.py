@@ -0,0 +1,83 @@
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+import google.protobuf.json_format
+from history_files import read_histories, stream_histories, write_histories
+from temporalio.api.history.v1 import History
+from temporalio.client import WorkflowHistory
+
+FORMATS = [
+    "histories.jsonl",
+    "histories.jsonl.gz",
+    "histories.binpb",
+    "histories.binpb.gz",
+]
+
+
+def _load_pretty_json(paths):
+    # What the fixtures did before these formats: json.load and from_json for each file
+    for i, path in enumerate(paths):
+        with open(path) as f:
+            data = json.load(f)
+        yield WorkflowHistory.from_json(f"history-{i}", data)
+
+
+def _time_load(load, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in load():
+            pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Compare load time and size of Workflow History file formats"
+    )
+    parser.add_argument(
+        "input", help="Any History file replay_history_from_json.py reads"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Best of this many loads")
+    args = parser.parse_args()
+
+    histories = [h async for h in stream_histories(args.input)]
+    events = sum(len(h.events) for h in histories)
+    print(f"{len(histories)} histories, {events} events")
+    print(f"{'format':<22}{'bytes':>12}{'load ms':>12}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Pretty JSON as written by `temporal workflow show --output json`, one History per file
+        json_paths = []
+        for i, history in enumerate(histories):
+            path = os.path.join(directory, f"history-{i}.json")
+            with open(path, "w") as f:
+                f.write(
+                    google.protobuf.json_format.MessageToJson(
+                        History(events=history.events)
+                    )
+                )
+            json_paths.append(path)
+        size = sum(os.path.getsize(p) for p in json_paths)
+        seconds = _time_load(lambda: _load_pretty_json(json_paths), args.repeat)
+        print(f"{'pretty json':<22}{size:>12}{seconds * 1000:>12.2f}")
+
+        for name in FORMATS:
+            path = os.path.join(directory, name)
+
+            async def source():
+                for history in histories:
+                    yield history
+
+            await write_histories(source(), path)
+            seconds = _time_load(lambda: read_histories(path), args.repeat)
+            print(f"{name:<22}{os.path.getsize(path):>12}{seconds * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
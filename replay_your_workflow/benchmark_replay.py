@@ -0,0 +1,321 @@
+"""
+Measure how long the Replayer takes for the sample Workflows and compare the results between commits.
+
+Each case replays the checked-in BackgroundCheck History or synthetic Histories from synthetic_histories.py, scaled to each requested Event count.
+Every case and size runs in a fresh process, so the peak RSS and sandbox import time are not shared between cases.
+The sandbox import time is how long a new Replayer takes to replay the smallest History of the case,
+which is dominated by importing and validating the Workflow module in the sandbox.
+
+    python benchmark_replay.py --output before.json
+    python benchmark_replay.py --output after.json --compare before.json
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+from importlib.metadata import version
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from temporalio.client import WorkflowHistory
+from temporalio.worker import Replayer
+
+from history_loader import load_histories
+from synthetic_histories import (
+    greeting_history,
+    looping_histories,
+    money_transfer_histories,
+    patched_history,
+)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Metrics where a larger value is worse, compared by --compare
+_HIGHER_IS_WORSE = ["sandbox_import_ms", "p50_ms", "p99_ms", "peak_rss_mb"]
+_LOWER_IS_WORSE = ["events_per_second"]
+
+
+def _copies(histories: List[WorkflowHistory], events: int) -> List[WorkflowHistory]:
+    # Repeat fixed-size Histories under new Workflow Ids until they add up to `events`
+    copies: List[WorkflowHistory] = []
+    total = 0
+    while total < events:
+        history = histories[len(copies) % len(histories)]
+        copies.append(
+            WorkflowHistory(f"{history.workflow_id}-{len(copies)}", history.events)
+        )
+        total += len(history.events)
+    return copies
+
+
+def _take(histories: Iterable[WorkflowHistory], events: int) -> List[WorkflowHistory]:
+    taken: List[WorkflowHistory] = []
+    total = 0
+    for history in histories:
+        if total >= events:
+            break
+        taken.append(history)
+        total += len(history.events)
+    return taken
+
+
+def _background_check(events: int) -> List[WorkflowHistory]:
+    path = os.path.join(
+        _ROOT,
+        "backgroundcheck_replay",
+        "tests",
+        "backgroundcheck_workflow_history.json",
+    )
+    return _copies(list(load_histories(path, "backgroundcheck-workflow")), events)
+
+
+def _looping(events: int) -> List[WorkflowHistory]:
+    # Each run holds one Timer in ten Events, so this is always enough runs
+    return _take(looping_histories(events), events)
+
+
+def _greeting(events: int) -> List[WorkflowHistory]:
+    # A single History that grows by four Events per Signal
+    return [greeting_history(max(0, -(-(events - 9) // 4)))]
+
+
+def _patched(events: int) -> List[WorkflowHistory]:
+    return _copies([patched_history()], events)
+
+
+def _money_transfer(events: int) -> List[WorkflowHistory]:
+    return _take(money_transfer_histories(events, retries=3), events)
+
+
+# Case name: (sample directory, Workflow module, Workflow class, History factory)
+CASES: Dict[str, Tuple[str, str, str, Callable[[int], List[WorkflowHistory]]]] = {
+    "BackgroundCheck": (
+        "backgroundcheck_replay",
+        "backgroundcheck_dacx",
+        "BackgroundCheck",
+        _background_check,
+    ),
+    "LoopingWorkflow": (
+        "continue_as_new",
+        "your_workflows_dacx",
+        "LoopingWorkflow",
+        _looping,
+    ),
+    "GreetingWorkflow": (
+        "signal_your_workflow",
+        "wf_signal_dacx",
+        "GreetingWorkflow",
+        _greeting,
+    ),
+    "MyWorkflow": (
+        "version_your_workflows",
+        "workflow_2_patched_dacx",
+        "MyWorkflow",
+        _patched,
+    ),
+    "MoneyTransferWorkflow": (
+        "workflow_failures",
+        "workflow_dacx",
+        "MoneyTransferWorkflow",
+        _money_transfer,
+    ),
+}
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    index = max(0, int(round(percent / 100 * len(sorted_values))) - 1)
+    return sorted_values[index]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / (1 << 10)
+
+
+async def _replay_case(case: str, events: int) -> Dict[str, Any]:
+    directory, module, class_name, factory = CASES[case]
+    sys.path.insert(0, os.path.join(_ROOT, directory))
+    workflow = getattr(importlib.import_module(module), class_name)
+    histories = factory(events)
+
+    # The smallest History this case produces, so the time is dominated by sandbox setup
+    start = time.perf_counter()
+    result = await Replayer(workflows=[workflow]).replay_workflow(
+        factory(1)[0], raise_on_replay_failure=False
+    )
+    sandbox_import = time.perf_counter() - start
+
+    async def source():
+        for history in histories:
+            yield history
+
+    failures = 0 if result.replay_failure is None else 1
+    timings: List[float] = []
+    replayer = Replayer(workflows=[workflow])
+    start = last = time.perf_counter()
+    async with replayer.workflow_replay_iterator(source()) as results:
+        async for result in results:
+            now = time.perf_counter()
+            timings.append(now - last)
+            last = now
+            if result.replay_failure:
+                failures += 1
+    elapsed = time.perf_counter() - start
+
+    timings.sort()
+    total_events = sum(len(h.events) for h in histories)
+    return {
+        "case": case,
+        "size": events,
+        "histories": len(histories),
+        "events": total_events,
+        "failures": failures,
+        "sandbox_import_ms": sandbox_import * 1000,
+        "seconds": elapsed,
+        "events_per_second": total_events / elapsed,
+        "p50_ms": _percentile(timings, 50) * 1000,
+        "p99_ms": _percentile(timings, 99) * 1000,
+        "max_ms": timings[-1] * 1000,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _replay_case_sync(case: str, events: int) -> Dict[str, Any]:
+    return asyncio.run(_replay_case(case, events))
+
+
+def run_case(case: str, events: int) -> Dict[str, Any]:
+    """Replay one case in a new process, so sample directories on sys.path and RSS are not shared."""
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+        return pool.submit(_replay_case_sync, case, events).result()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    baseline: Dict[str, Any], report: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Return a description of each metric that got worse by more than `threshold`."""
+    previous = {(r["case"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = previous.get((result["case"], result["size"]))
+        if old is None:
+            continue
+        for metric in _HIGHER_IS_WORSE + _LOWER_IS_WORSE:
+            before, after = old.get(metric), result.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if metric in _LOWER_IS_WORSE:
+                change = -change
+            if change > threshold:
+                regressions.append(
+                    f"{result['case']} {result['size']}: {metric}"
+                    f" {before:.2f} -> {after:.2f}"
+                )
+        if result["failures"] > old["failures"]:
+            regressions.append(
+                f"{result['case']} {result['size']}: replay failures"
+                f" {old['failures']} -> {result['failures']}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark replay of the sample Workflows"
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=sorted(CASES),
+        default=sorted(CASES),
+        help="Workflows to benchmark",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[1_000, 10_000, 100_000],
+        help="Total Events replayed per case",
+    )
+    parser.add_argument(
+        "--output", default="replay_benchmark.json", help="Where to write the report"
+    )
+    parser.add_argument("--compare", help="A previous report to check this run against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "commit": _git_commit(),
+        "temporalio": version("temporalio"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [],
+    }
+    print(
+        f"{'case':<18}{'events':>8}{'histories':>10}{'import ms':>11}"
+        f"{'events/s':>11}{'p50 ms':>11}{'p99 ms':>11}{'rss MB':>8}"
+    )
+    for case in args.cases:
+        for size in args.sizes:
+            result = run_case(case, size)
+            report["results"].append(result)
+            rss = result["peak_rss_mb"]
+            print(
+                f"{case:<18}{result['events']:>8}{result['histories']:>10}"
+                f"{result['sandbox_import_ms']:>11.1f}"
+                f"{result['events_per_second']:>11.0f}"
+                f"{result['p50_ms']:>11.2f}{result['p99_ms']:>11.2f}"
+                f"{'-' if rss is None else f'{rss:.0f}':>8}"
+            )
+            if result["failures"]:
+                print(f"  {result['failures']} histories failed to replay")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Measure the sandbox overhead of a small Workflow task with the default restrictions and with shared/sandbox.py.
+
+Each run replays the first Workflow task of a sample Workflow many times.
+Every replay is a new Workflow run, so it creates a sandbox and imports the Workflow module and
+everything it imports that is not passed through, which is the fixed cost of every small Workflow task
+that is not served from the sticky cache.
+Each case runs in a fresh process, so sample directories on sys.path are not shared.
+
+    python benchmark_sandbox.py --tasks 500
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import importlib
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+from temporalio.client import WorkflowHistory
+from temporalio.worker import Replayer
+from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner
+
+from shared.sandbox import sandbox_runner
+from shared.warmup import first_task_history
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Case name: (sample directory, Workflow module, Workflow class, Workflow arguments)
+CASES: Dict[str, Tuple[str, str, str, List[Any]]] = {
+    "YourWorkflow": ("your_app", "your_workflows_dacx", "YourWorkflow", ["World"]),
+    "YourSchedulesWorkflow": (
+        "schedule_your_workflow",
+        "your_workflows",
+        "YourSchedulesWorkflow",
+        ["World"],
+    ),
+    "ComposeGreetingWorkflow": (
+        "your_child_workflow",
+        "your_child_workflow_dacx",
+        "ComposeGreetingWorkflow",
+        [{"greeting": "Hello", "name": "World"}],
+    ),
+    "MoneyTransferWorkflow": (
+        "workflow_failures",
+        "workflow_dacx",
+        "MoneyTransferWorkflow",
+        [{"sender": "A", "receiver": "B", "amount": 100, "reference_id": "ref"}],
+    ),
+    "BackgroundCheck": (
+        "backgroundcheck_replay",
+        "backgroundcheck_dacx",
+        "BackgroundCheck",
+        ["555-55-5555"],
+    ),
+}
+
+RUNNERS = {
+    "default": SandboxedWorkflowRunner,
+    "tuned": sandbox_runner,
+}
+
+
+async def _measure(case: str, tasks: int) -> Dict[str, float]:
+    directory, module, class_name, args = CASES[case]
+    sys.path.insert(0, os.path.join(_ROOT, directory))
+    workflow = getattr(importlib.import_module(module), class_name)
+    history = first_task_history(workflow, args)
+    replayers = {
+        name: Replayer(workflows=[workflow], workflow_runner=runner())
+        for name, runner in RUNNERS.items()
+    }
+    # The first replay in a process pays one-time costs that are not per task
+    for replayer in replayers.values():
+        await replayer.replay_workflow(history)
+
+    # Alternate between the runners, so both see the same machine state
+    timings: Dict[str, List[float]] = {name: [] for name in replayers}
+    for i in range(tasks):
+        copy = WorkflowHistory(f"{history.workflow_id}-{i}", history.events)
+        for name, replayer in replayers.items():
+            start = time.perf_counter()
+            await replayer.replay_workflow(copy)
+            timings[name].append(time.perf_counter() - start)
+    return {name: statistics.median(t) * 1000 for name, t in timings.items()}
+
+
+def _measure_sync(case: str, tasks: int) -> Dict[str, float]:
+    return asyncio.run(_measure(case, tasks))
+
+
+def run_case(case: str, tasks: int) -> Dict[str, float]:
+    """Median milliseconds per first Workflow task for each runner, measured in a new process."""
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+        return pool.submit(_measure_sync, case, tasks).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-task sandbox overhead of the sample Workflows"
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=sorted(CASES),
+        default=sorted(CASES),
+        help="Workflows to benchmark",
+    )
+    parser.add_argument(
+        "--tasks", type=int, default=500, help="First Workflow tasks to replay"
+    )
+    args = parser.parse_args()
+
+    print("Median milliseconds per first Workflow task")
+    print(f"{'case':<26}{'default':>10}{'tuned':>10}{'saved':>8}")
+    for case in args.cases:
+        result = run_case(case, args.tasks)
+        saved = 1 - result["tuned"] / result["default"]
+        print(
+            f"{case:<26}{result['default']:>10.2f}{result['tuned']:>10.2f}{saved:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import argparse
+import asyncio
+
+from history_files import stream_histories, write_histories
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Convert Workflow Histories between file formats"
+    )
+    parser.add_argument("input", help="JSONL, .binpb, or single History JSON file")
+    parser.add_argument(
+        "output", help="File to write. The format is chosen from the file name."
+    )
+    args = parser.parse_args()
+
+    count = await write_histories(stream_histories(args.input), args.output)
+    print(f"{count} histories written to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+from typing import AsyncIterator, Iterator
+
+from temporalio.client import WorkflowHistory
+
+from history_files import write_histories
+from synthetic_histories import (
+    greeting_histories,
+    looping_histories,
+    money_transfer_histories,
+)
+
+
+async def _stream(
+    histories: Iterator[WorkflowHistory],
+) -> AsyncIterator[WorkflowHistory]:
+    for history in histories:
+        yield history
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Write synthetic Histories of the sample Workflows without a Temporal Server"
+    )
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument(
+        "--output",
+        default="synthetic_histories.jsonl",
+        help="File to write. The format is chosen from the file name.",
+    )
+    subparsers = parser.add_subparsers(dest="workflow", required=True)
+
+    greeting = subparsers.add_parser(
+        "greeting", help="signal_your_workflow GreetingWorkflow", parents=[output]
+    )
+    greeting.add_argument("--count", type=int, default=1, help="Number of Histories")
+    greeting.add_argument(
+        "--signals", type=int, default=1000, help="Greetings signaled to each Workflow"
+    )
+
+    looping = subparsers.add_parser(
+        "looping",
+        help="continue_as_new LoopingWorkflow, one History per run",
+        parents=[output],
+    )
+    looping.add_argument(
+        "--timers", type=int, default=1000, help="Timers fired across all runs"
+    )
+
+    money_transfer = subparsers.add_parser(
+        "money-transfer",
+        help="workflow_failures MoneyTransferWorkflow",
+        parents=[output],
+    )
+    money_transfer.add_argument(
+        "--count", type=int, default=1000, help="Number of Histories"
+    )
+    money_transfer.add_argument(
+        "--retries", type=int, default=3, help="Failed withdraw attempts before success"
+    )
+    money_transfer.add_argument(
+        "--seed", type=int, default=0, help="Seed for the transfer details"
+    )
+
+    args = parser.parse_args()
+
+    if args.workflow == "greeting":
+        histories = greeting_histories(args.count, args.signals)
+    elif args.workflow == "looping":
+        histories = looping_histories(args.timers)
+    else:
+        histories = money_transfer_histories(args.count, args.retries, args.seed)
+
+    count = await write_histories(_stream(histories), args.output)
+    print(f"{count} histories written to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,17 +1,41 @@
+import argparse
 import asyncio
-import json
 
+from history_fetcher import fetch_histories
+from history_files import write_histories
 from temporalio.client import Client
 
 
 async def main():
+    parser = argparse.ArgumentParser(description="Export Workflow Histories")
+    parser.add_argument("--query", help="List Filter for the Workflows to export")
+    parser.add_argument(
+        "--output",
+        default="histories.jsonl",
+        help="File to write, one history per line. Use .gz or .zst to compress.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="How many histories to fetch at the same time",
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Write histories as they arrive instead of in listing order",
+    )
+    args = parser.parse_args()
+
     client = await Client.connect("localhost:7233")
-    workflows = client.list_workflows()  # You can filter Workflows here
-    async for history in workflows.map_histories():
-        history_json = history.to_json()
-        with open("test_replayer_complete_history.json", "a") as f:
-            f.write(json.dumps(history_json, indent=4))
-        print("History written to file")
+    histories = fetch_histories(
+        client,
+        args.query,  # You can filter Workflows here
+        concurrency=args.concurrency,
+        ordered=not args.unordered,
+    )
+    count = await write_histories(histories, args.output)
+    print(f"{count} histories written to {args.output}")
 
 
 if __name__ == "__main__":
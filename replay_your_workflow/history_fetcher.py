@@ -0,0 +1,79 @@
+"""
+Fetch Workflow Histories with several requests in flight at once.
+
+`list_workflows().map_histories()` fetches one History at a time, so an export takes the sum of every round trip.
+`fetch_histories()` keeps up to `concurrency` fetches running while the caller consumes results.
+No more Workflows are listed until the caller takes a result, so a slow consumer applies backpressure.
+"""
+
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Deque, Optional, Set
+
+from temporalio.client import Client, WorkflowExecution, WorkflowHistory
+
+
+def fetch_histories(
+    client: Client,
+    query: Optional[str] = None,
+    *,
+    concurrency: int = 10,
+    ordered: bool = True,
+) -> AsyncIterator[WorkflowHistory]:
+    """Yield the History of every Workflow matching the List Filter.
+
+    With `ordered=True` Histories are yielded in listing order.
+    Otherwise they are yielded as soon as each fetch completes.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if ordered:
+        return _fetch_ordered(client, query, concurrency)
+    return _fetch_unordered(client, query, concurrency)
+
+
+def _start_fetch(
+    client: Client, execution: WorkflowExecution
+) -> "asyncio.Task[WorkflowHistory]":
+    handle = client.get_workflow_handle(execution.id, run_id=execution.run_id)
+    return asyncio.create_task(handle.fetch_history())
+
+
+async def _fetch_ordered(
+    client: Client, query: Optional[str], concurrency: int
+) -> AsyncIterator[WorkflowHistory]:
+    in_flight: Deque["asyncio.Task[WorkflowHistory]"] = deque()
+    try:
+        async for execution in client.list_workflows(query):
+            if len(in_flight) >= concurrency:
+                yield await in_flight.popleft()
+            in_flight.append(_start_fetch(client, execution))
+        while in_flight:
+            yield await in_flight.popleft()
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+async def _fetch_unordered(
+    client: Client, query: Optional[str], concurrency: int
+) -> AsyncIterator[WorkflowHistory]:
+    in_flight: Set["asyncio.Task[WorkflowHistory]"] = set()
+    try:
+        async for execution in client.list_workflows(query):
+            while len(in_flight) >= concurrency:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+            in_flight.add(_start_fetch(client, execution))
+        while in_flight:
+            done, in_flight = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
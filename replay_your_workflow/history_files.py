@@ -0,0 +1,165 @@
+"""
+Workflow Histories are stored as line-delimited JSON (JSONL).
+Each line holds one compact history and the Workflow Id it belongs to:
+
+    {"workflowId": "your-workflow-id", "history": {"events": [...]}}
+
+Files with `.binpb` in their name hold the same records as serialized `temporal.api.history.v1.History` protobufs.
+Each record is the Workflow Id and the History, each prefixed with its length as a 4-byte big-endian integer.
+Loading these needs no JSON parsing or base64 decoding of payloads.
+
+Files ending in `.gz` are gzip compressed.
+Files ending in `.zst` are zstd compressed, which requires the `zstandard` package.
+"""
+
+import gzip
+import json
+import struct
+from typing import IO, Any, AsyncIterable, AsyncIterator, Iterator, Optional, Tuple
+
+import google.protobuf.json_format
+from temporalio.api.history.v1 import History
+from temporalio.client import WorkflowHistory
+
+from history_loader import load_histories
+
+_LENGTH = struct.Struct(">I")
+
+
+def is_binary_history_file(path: str) -> bool:
+    return ".binpb" in path
+
+
+def open_history_file(
+    path: str, mode: str = "r", *, binary: Optional[bool] = None
+) -> IO[Any]:
+    if binary is None:
+        binary = is_binary_history_file(path)
+    if binary:
+        mode, encoding = mode + "b", None
+    else:
+        mode, encoding = mode + "t", "utf-8"
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding=encoding)
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as err:
+            raise RuntimeError(
+                "Reading or writing .zst history files requires the zstandard package"
+            ) from err
+        return zstandard.open(path, mode, encoding=encoding)
+    return open(path, mode, encoding=encoding)
+
+
+def history_to_line(history: WorkflowHistory) -> str:
+    history_dict = google.protobuf.json_format.MessageToDict(
+        History(events=history.events)
+    )
+    record = {"workflowId": history.workflow_id, "history": history_dict}
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def history_from_line(line: str) -> WorkflowHistory:
+    record = json.loads(line)
+    return WorkflowHistory.from_json(record["workflowId"], record["history"])
+
+
+def history_to_record(history: WorkflowHistory) -> bytes:
+    workflow_id = history.workflow_id.encode("utf-8")
+    data = History(events=history.events).SerializeToString()
+    return _LENGTH.pack(len(workflow_id)) + workflow_id + _LENGTH.pack(len(data)) + data
+
+
+def _read_exactly(f: IO[bytes], size: int, path: str, offset: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        # A History parsed from a prefix would replay without its last events and pass
+        raise ValueError(f"Truncated record at offset {offset} of {path}")
+    return data
+
+
+def _read_record(f: IO[bytes], path: str) -> Optional[WorkflowHistory]:
+    offset = f.tell()
+    header = f.read(_LENGTH.size)
+    if not header:
+        return None
+    if len(header) != _LENGTH.size:
+        raise ValueError(f"Truncated record at offset {offset} of {path}")
+    (id_length,) = _LENGTH.unpack(header)
+    workflow_id = _read_exactly(f, id_length, path, offset).decode("utf-8")
+    (data_length,) = _LENGTH.unpack(_read_exactly(f, _LENGTH.size, path, offset))
+    data = _read_exactly(f, data_length, path, offset)
+    return WorkflowHistory(workflow_id, History.FromString(data).events)
+
+
+def _read_records(f: IO[bytes], path: str) -> Iterator[WorkflowHistory]:
+    while True:
+        history = _read_record(f, path)
+        if history is None:
+            return
+        yield history
+
+
+async def write_histories(histories: AsyncIterable[WorkflowHistory], path: str) -> int:
+    # Only one history is held in memory at a time, regardless of how many are written.
+    to_record = history_to_record if is_binary_history_file(path) else history_to_line
+    count = 0
+    with open_history_file(path, "w") as f:
+        async for history in histories:
+            f.write(to_record(history))
+            count += 1
+    return count
+
+
+def read_histories(path: str) -> Iterator[WorkflowHistory]:
+    with open_history_file(path, "r") as f:
+        if is_binary_history_file(path):
+            yield from _read_records(f, path)
+            return
+        for line in f:
+            if line.strip():
+                yield history_from_line(line)
+
+
+def read_histories_with_offsets(path: str) -> Iterator[Tuple[int, WorkflowHistory]]:
+    """Yield each History with the byte offset of its record, for `read_history_at()`.
+
+    Offsets of compressed files are positions in the decompressed data,
+    so seeking to them is only fast for uncompressed files.
+    """
+    with open_history_file(path, "r", binary=True) as f:
+        if is_binary_history_file(path):
+            while True:
+                offset = f.tell()
+                history = _read_record(f, path)
+                if history is None:
+                    return
+                yield offset, history
+        offset = 0
+        for line in f:
+            if line.strip():
+                yield offset, history_from_line(line.decode("utf-8"))
+            offset += len(line)
+
+
+def read_history_at(path: str, offset: int) -> WorkflowHistory:
+    with open_history_file(path, "r", binary=True) as f:
+        f.seek(offset)
+        if is_binary_history_file(path):
+            history = _read_record(f, path)
+            if history is None:
+                raise ValueError(f"No History at offset {offset} of {path}")
+            return history
+        return history_from_line(f.readline().decode("utf-8"))
+
+
+async def stream_histories(path: str) -> AsyncIterator[WorkflowHistory]:
+    # For APIs such as Replayer.replay_workflows that take an async iterator.
+    # Other JSON files hold a single large History and are streamed by history_loader.
+    if ".jsonl" in path or is_binary_history_file(path):
+        histories = read_histories(path)
+    else:
+        histories = load_histories(path)
+    for history in histories:
+        yield history
@@ -0,0 +1,81 @@
+"""
+Reduce Workflow Histories to their structural skeleton and replay one representative of each.
+
+Most Histories of a Workflow Type take the same path through the code and differ only in payloads, ids and timestamps.
+The skeleton keeps what determinism depends on: the sequence of Event types, the Activity, Timer, child Workflow
+and Signal names, and the ids of `workflow.patched()` markers.
+Replaying one History per distinct skeleton covers the same code paths as replaying all of them.
+"""
+
+import hashlib
+import json
+from typing import AsyncIterator, Dict, List, Mapping
+
+from temporalio.api.common.v1 import Payloads
+from temporalio.api.enums.v1 import EventType
+from temporalio.api.history.v1 import HistoryEvent
+from temporalio.client import WorkflowHistory
+
+# Marker recorded by workflow.patched() and workflow.deprecate_patch()
+_PATCH_MARKER_NAME = "core_patch"
+
+
+def _patch_id(details: Mapping[str, Payloads]) -> str:
+    # Current SDKs write a JSON payload, older ones wrote the id as plain bytes
+    if "patch-data" in details:
+        return json.loads(details["patch-data"].payloads[0].data)["id"]
+    return details["patch_id"].payloads[0].data.decode()
+
+
+def _event_token(event: HistoryEvent) -> str:
+    name = EventType.Name(event.event_type)[len("EVENT_TYPE_") :]
+    if event.HasField("workflow_execution_started_event_attributes"):
+        attrs = event.workflow_execution_started_event_attributes
+        return f"{name}:{attrs.workflow_type.name}"
+    if event.HasField("activity_task_scheduled_event_attributes"):
+        attrs = event.activity_task_scheduled_event_attributes
+        return f"{name}:{attrs.activity_type.name}"
+    if event.HasField("start_child_workflow_execution_initiated_event_attributes"):
+        attrs = event.start_child_workflow_execution_initiated_event_attributes
+        return f"{name}:{attrs.workflow_type.name}"
+    if event.HasField("workflow_execution_signaled_event_attributes"):
+        attrs = event.workflow_execution_signaled_event_attributes
+        return f"{name}:{attrs.signal_name}"
+    if event.HasField("signal_external_workflow_execution_initiated_event_attributes"):
+        attrs = event.signal_external_workflow_execution_initiated_event_attributes
+        return f"{name}:{attrs.signal_name}"
+    if event.HasField("marker_recorded_event_attributes"):
+        attrs = event.marker_recorded_event_attributes
+        if attrs.marker_name == _PATCH_MARKER_NAME:
+            return f"{name}:{attrs.marker_name}:{_patch_id(attrs.details)}"
+        return f"{name}:{attrs.marker_name}"
+    return name
+
+
+def history_skeleton(history: WorkflowHistory) -> List[str]:
+    return [_event_token(event) for event in history.events]
+
+
+def history_fingerprint(history: WorkflowHistory) -> str:
+    return hashlib.sha256("\n".join(history_skeleton(history)).encode()).hexdigest()
+
+
+class HistoryDeduplicator:
+    """Pass through only the first `samples_per_skeleton` Histories of each skeleton."""
+
+    def __init__(self, samples_per_skeleton: int = 1) -> None:
+        self.samples_per_skeleton = samples_per_skeleton
+        self.counts: Dict[str, int] = {}
+        self.skipped = 0
+
+    async def representatives(
+        self, histories: AsyncIterator[WorkflowHistory]
+    ) -> AsyncIterator[WorkflowHistory]:
+        async for history in histories:
+            fingerprint = history_fingerprint(history)
+            seen = self.counts.get(fingerprint, 0)
+            self.counts[fingerprint] = seen + 1
+            if seen < self.samples_per_skeleton:
+                yield history
+            else:
+                self.skipped += 1
@@ -0,0 +1,229 @@
+"""
+A local SQLite index over exported History files.
+
+For each History the index records the Workflow Type, Event count, byte offset in its file,
+start and close time, whether it started a Timer, and the set of Activity Types it scheduled.
+Replay subsets can then be selected without a Temporal Server and without reading the files again.
+Files are only re-indexed when their size or modification time changes.
+"""
+
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional
+
+from google.protobuf.timestamp_pb2 import Timestamp
+from temporalio.api.enums.v1 import EventType
+from temporalio.client import WorkflowHistory
+
+from history_files import read_histories_with_offsets, read_history_at
+
+_CLOSE_EVENT_TYPES = {
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_COMPLETED,
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_FAILED,
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_TIMED_OUT,
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_CANCELED,
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_TERMINATED,
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_CONTINUED_AS_NEW,
+}
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IndexedHistory:
+    path: str
+    offset: int
+    workflow_id: str
+    run_id: str
+    workflow_type: str
+    event_count: int
+    start_time: datetime
+    close_time: Optional[datetime]
+    has_timer: bool
+
+    def load(self) -> WorkflowHistory:
+        return read_history_at(self.path, self.offset)
+
+
+def _seconds(timestamp: Timestamp) -> float:
+    return timestamp.seconds + timestamp.nanos / 1e9
+
+
+def _utc_seconds(time: datetime) -> float:
+    # Event times are UTC, so a time without a time zone is taken as UTC rather than local time
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=timezone.utc)
+    return time.timestamp()
+
+
+class HistoryIndex:
+    def __init__(self, path: str) -> None:
+        self._db = sqlite3.connect(path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime REAL NOT NULL);
+            CREATE TABLE IF NOT EXISTS histories (
+                id INTEGER PRIMARY KEY, path TEXT NOT NULL, offset INTEGER NOT NULL,
+                workflow_id TEXT NOT NULL, run_id TEXT NOT NULL,
+                workflow_type TEXT NOT NULL, event_count INTEGER NOT NULL,
+                start_time REAL NOT NULL, close_time REAL, has_timer INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS activity_types (
+                history_id INTEGER NOT NULL, activity_type TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS histories_by_type
+                ON histories (workflow_type, start_time);
+            CREATE INDEX IF NOT EXISTS activity_types_by_type
+                ON activity_types (activity_type, history_id);
+            """
+        )
+
+    def close(self) -> None:
+        self._db.close()
+
+    def add_file(self, path: str) -> bool:
+        """Index a JSONL or .binpb file, returning False if it is already up to date."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        row = self._db.execute(
+            "SELECT size, mtime FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        if row == (stat.st_size, stat.st_mtime):
+            return False
+        self._db.execute(
+            "DELETE FROM activity_types WHERE history_id IN"
+            " (SELECT id FROM histories WHERE path = ?)",
+            (path,),
+        )
+        self._db.execute("DELETE FROM histories WHERE path = ?", (path,))
+        for offset, history in read_histories_with_offsets(path):
+            if not history.events:
+                logger.warning(
+                    "Skipping empty History of %s at offset %d of %s",
+                    history.workflow_id,
+                    offset,
+                    path,
+                )
+                continue
+            self._add_history(path, offset, history)
+        self._db.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+            (path, stat.st_size, stat.st_mtime),
+        )
+        self._db.commit()
+        return True
+
+    def _add_history(self, path: str, offset: int, history: WorkflowHistory) -> None:
+        first, last = history.events[0], history.events[-1]
+        activity_types = set()
+        has_timer = False
+        for event in history.events:
+            if event.event_type == EventType.EVENT_TYPE_ACTIVITY_TASK_SCHEDULED:
+                activity_types.add(
+                    event.activity_task_scheduled_event_attributes.activity_type.name
+                )
+            elif event.event_type == EventType.EVENT_TYPE_TIMER_STARTED:
+                has_timer = True
+        cursor = self._db.execute(
+            "INSERT INTO histories VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                offset,
+                history.workflow_id,
+                history.run_id,
+                first.workflow_execution_started_event_attributes.workflow_type.name,
+                len(history.events),
+                _seconds(first.event_time),
+                _seconds(last.event_time)
+                if last.event_type in _CLOSE_EVENT_TYPES
+                else None,
+                has_timer,
+            ),
+        )
+        self._db.executemany(
+            "INSERT INTO activity_types VALUES (?, ?)",
+            [(cursor.lastrowid, name) for name in sorted(activity_types)],
+        )
+
+    def select(
+        self,
+        *,
+        workflow_type: Optional[str] = None,
+        activity_type: Optional[str] = None,
+        has_timer: Optional[bool] = None,
+        started_after: Optional[datetime] = None,
+        started_before: Optional[datetime] = None,
+        min_events: Optional[int] = None,
+        max_events: Optional[int] = None,
+    ) -> List[IndexedHistory]:
+        """Return the indexed Histories matching every given filter, oldest first.
+
+        Times without a time zone are taken as UTC.
+        """
+        clauses: List[str] = []
+        params: list = []
+        if workflow_type is not None:
+            clauses.append("workflow_type = ?")
+            params.append(workflow_type)
+        if activity_type is not None:
+            clauses.append(
+                "id IN (SELECT history_id FROM activity_types WHERE activity_type = ?)"
+            )
+            params.append(activity_type)
+        if has_timer is not None:
+            clauses.append("has_timer = ?")
+            params.append(has_timer)
+        if started_after is not None:
+            clauses.append("start_time >= ?")
+            params.append(_utc_seconds(started_after))
+        if started_before is not None:
+            clauses.append("start_time < ?")
+            params.append(_utc_seconds(started_before))
+        if min_events is not None:
+            clauses.append("event_count >= ?")
+            params.append(min_events)
+        if max_events is not None:
+            clauses.append("event_count <= ?")
+            params.append(max_events)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        rows = self._db.execute(
+            "SELECT path, offset, workflow_id, run_id, workflow_type, event_count,"
+            " start_time, close_time, has_timer FROM histories"
+            + where
+            + " ORDER BY start_time",
+            params,
+        )
+        return [
+            IndexedHistory(
+                path=row[0],
+                offset=row[1],
+                workflow_id=row[2],
+                run_id=row[3],
+                workflow_type=row[4],
+                event_count=row[5],
+                start_time=datetime.fromtimestamp(row[6], timezone.utc),
+                close_time=None
+                if row[7] is None
+                else datetime.fromtimestamp(row[7], timezone.utc),
+                has_timer=bool(row[8]),
+            )
+            for row in rows
+        ]
+
+    def activity_types(self, entry: IndexedHistory) -> List[str]:
+        rows = self._db.execute(
+            "SELECT activity_type FROM activity_types JOIN histories"
+            " ON histories.id = history_id WHERE path = ? AND offset = ?"
+            " ORDER BY activity_type",
+            (entry.path, entry.offset),
+        )
+        return [row[0] for row in rows]
+
+
+async def stream_selected(
+    entries: List[IndexedHistory],
+) -> AsyncIterator[WorkflowHistory]:
+    for entry in entries:
+        yield entry.load()
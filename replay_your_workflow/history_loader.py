@@ -0,0 +1,129 @@
+"""
+Load large JSON Workflow History files without decoding the whole document at once.
+
+`json.load` followed by `WorkflowHistory.from_json` holds every Event of the History as Python dicts.
+`load_histories()` memory-maps the file and decodes one Event at a time, converting Events to protobuf in small batches.
+
+Two layouts are supported:
+
+- A single History object, as written by `temporal workflow show --output json` or `WorkflowHistory.to_json()`.
+- One or more JSON-encoded strings of a History, as written by earlier versions of `get_workflow_history.py`.
+"""
+
+import codecs
+import json
+import mmap
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+from temporalio.api.history.v1 import HistoryEvent
+from temporalio.client import WorkflowHistory
+
+_WHITESPACE = " \t\r\n"
+_JSON_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_decoder = json.JSONDecoder()
+
+
+def load_histories(
+    path: str,
+    workflow_id: str = "replay-workflow-id",
+    *,
+    chunk_size: int = 1 << 20,
+    batch_size: int = 1000,
+) -> Iterator[WorkflowHistory]:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        first = re.search(rb"\S", m)
+        if not first:
+            return
+        if first.group() == b'"':
+            # Double-encoded: each top-level string holds a whole History document
+            for match in _JSON_STRING.finditer(m, first.start()):
+                reader = _TextReader(iter([json.loads(match.group())]))
+                yield _history(workflow_id, _iter_events(reader), batch_size)
+        else:
+            reader = _TextReader(_decode_chunks(m, chunk_size))
+            yield _history(workflow_id, _iter_events(reader), batch_size)
+
+
+def _history(
+    workflow_id: str, events: Iterator[Dict[str, Any]], batch_size: int
+) -> WorkflowHistory:
+    # from_json fixes up enum names written by older servers and the CLI, so convert small batches through it
+    converted: List[HistoryEvent] = []
+    batch: List[Dict[str, Any]] = []
+    for event in events:
+        batch.append(event)
+        if len(batch) >= batch_size:
+            converted.extend(
+                WorkflowHistory.from_json(workflow_id, {"events": batch}).events
+            )
+            batch = []
+    if batch:
+        converted.extend(
+            WorkflowHistory.from_json(workflow_id, {"events": batch}).events
+        )
+    return WorkflowHistory(workflow_id, converted)
+
+
+def _decode_chunks(data: mmap.mmap, chunk_size: int) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for start in range(0, len(data), chunk_size):
+        yield decoder.decode(data[start : start + chunk_size])
+    yield decoder.decode(b"", final=True)
+
+
+class _TextReader:
+    """A cursor over text that arrives in chunks, refilled only when a value is cut off."""
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._buffer = ""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self, skip: str = _WHITESPACE) -> Optional[str]:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in skip:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in History JSON, found {found!r}")
+        self._pos += 1
+
+    def decode(self) -> Any:
+        while True:
+            try:
+                value, self._pos = _decoder.raw_decode(self._buffer, self._pos)
+                return value
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+
+
+def _iter_events(reader: _TextReader) -> Iterator[Dict[str, Any]]:
+    reader.expect("{")
+    reader.peek()
+    if reader.decode() != "events":
+        raise ValueError("History JSON must start with an 'events' array")
+    reader.expect(":")
+    reader.expect("[")
+    while True:
+        next_char = reader.peek(_WHITESPACE + ",")
+        if next_char == "]":
+            return
+        if next_char is None:
+            raise ValueError("History JSON ended inside the 'events' array")
+        yield reader.decode()
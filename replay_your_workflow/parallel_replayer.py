@@ -0,0 +1,84 @@
+"""
+Replay Workflow Histories on every core.
+
+A single `Replayer` replays on one event loop, so it uses one core even though replay is CPU bound.
+`replay_in_processes()` shards Histories into batches, replays each batch with its own `Replayer` in a process pool,
+and merges the failures into one `WorkflowReplayResults`.
+"""
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Set, Type
+
+from temporalio.client import WorkflowHistory
+from temporalio.worker import Replayer, WorkflowReplayResults
+
+from shared.sandbox import sandbox_runner
+
+from history_files import history_from_line, history_to_line
+
+
+async def replay_in_processes(
+    histories: AsyncIterator[WorkflowHistory],
+    workflows: Sequence[Type],
+    *,
+    processes: Optional[int] = None,
+    batch_size: int = 50,
+) -> WorkflowReplayResults:
+    """Replay Histories across a pool of processes.
+
+    Workflow classes must be importable by module name in the worker processes.
+    At most two batches per process are queued at once, so memory stays bounded for any number of Histories.
+    """
+    processes = processes or os.cpu_count() or 1
+    failures: Dict[str, Exception] = {}
+    in_flight: Set["asyncio.Future[Dict[str, Exception]]"] = set()
+    loop = asyncio.get_running_loop()
+
+    # Forking a process that has already started the SDK runtime is not safe, so always spawn
+    with concurrent.futures.ProcessPoolExecutor(
+        processes, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+
+        async def wait_for_batches(limit: int) -> None:
+            nonlocal in_flight
+            while len(in_flight) > limit:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    failures.update(future.result())
+
+        batch: List[str] = []
+        async for history in histories:
+            # Histories cross the process boundary as JSON lines
+            batch.append(history_to_line(history))
+            if len(batch) >= batch_size:
+                await wait_for_batches(processes * 2 - 1)
+                in_flight.add(
+                    loop.run_in_executor(pool, _replay_batch, list(workflows), batch)
+                )
+                batch = []
+        if batch:
+            in_flight.add(
+                loop.run_in_executor(pool, _replay_batch, list(workflows), batch)
+            )
+        await wait_for_batches(0)
+
+    return WorkflowReplayResults(replay_failures=failures)
+
+
+def _replay_batch(workflows: List[Type], lines: List[str]) -> Dict[str, Exception]:
+    async def histories() -> AsyncIterator[WorkflowHistory]:
+        for line in lines:
+            yield history_from_line(line)
+
+    async def replay() -> Dict[str, Exception]:
+        results = await Replayer(
+            workflows=workflows, workflow_runner=sandbox_runner()
+        ).replay_workflows(histories(), raise_on_replay_failure=False)
+        return dict(results.replay_failures)
+
+    return asyncio.run(replay())
@@ -0,0 +1,167 @@
+"""
+Skip replaying Histories that already replayed successfully against the same Workflow code.
+
+Results are stored in a local SQLite file keyed by a hash of the Workflow code (and SDK version)
+and a hash of the History content.
+The Workflow code is the source of each Workflow's module and of the project modules it imports, directly or
+through other project modules, such as its Activities and data classes. Installed packages are left out.
+Only Histories whose key is missing get replayed, so a CI run only pays for what changed.
+Failures are never cached so that they are always reported with a fresh error.
+Once the file holds more than `max_bytes`, the least recently used entries are evicted.
+"""
+
+import hashlib
+import importlib.metadata
+import inspect
+import os
+import sqlite3
+import sys
+import sysconfig
+import time
+from types import ModuleType
+from typing import AsyncIterator, Callable, Dict, Optional, Sequence, Set, Type
+
+from temporalio.api.history.v1 import History
+from temporalio.client import WorkflowHistory
+from temporalio.worker import WorkflowReplayResults
+
+
+# Modules from these directories are the standard library or installed packages, temporalio among them
+_INSTALLED = tuple(
+    os.path.join(os.path.realpath(path), "")
+    for name, path in sysconfig.get_paths().items()
+    if name in ("stdlib", "platstdlib", "purelib", "platlib")
+)
+
+
+def _project_file(module: ModuleType) -> Optional[str]:
+    path = getattr(module, "__file__", None)
+    if not path or not path.endswith(".py"):
+        return None
+    path = os.path.realpath(path)
+    return None if path.startswith(_INSTALLED) else path
+
+
+def _imported_modules(module: ModuleType) -> Set[ModuleType]:
+    # Modules bound in the module's namespace, and the modules that its classes and functions come from
+    imported = set()
+    for value in vars(module).values():
+        if isinstance(value, ModuleType):
+            imported.add(value)
+        else:
+            name = getattr(value, "__module__", None)
+            if isinstance(name, str) and name in sys.modules:
+                imported.add(sys.modules[name])
+    return imported
+
+
+def workflow_source_files(workflows: Sequence[Type]) -> Set[str]:
+    """The source files of the Workflows' modules and of the project modules they import."""
+    files: Set[str] = set()
+    pending = [sys.modules[w.__module__] for w in workflows]
+    while pending:
+        module = pending.pop()
+        path = _project_file(module)
+        if path is None or path in files:
+            continue
+        files.add(path)
+        pending.extend(_imported_modules(module))
+    return files
+
+
+def workflow_code_hash(workflows: Sequence[Type]) -> str:
+    digest = hashlib.sha256(importlib.metadata.version("temporalio").encode())
+    for source_file in sorted(workflow_source_files(workflows)):
+        with open(source_file, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def history_hash(history: WorkflowHistory) -> str:
+    content = History(events=history.events).SerializeToString(deterministic=True)
+    return hashlib.sha256(content).hexdigest()
+
+
+class ReplayCache:
+    def __init__(
+        self,
+        path: str,
+        workflows: Sequence[Type],
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.code_hash = workflow_code_hash(workflows)
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._pending: Dict[str, str] = {}
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS replays ("
+            " code_hash TEXT NOT NULL,"
+            " history_hash TEXT NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " PRIMARY KEY (code_hash, history_hash))"
+        )
+
+    def close(self) -> None:
+        self._db.close()
+
+    async def uncached(
+        self, histories: AsyncIterator[WorkflowHistory]
+    ) -> AsyncIterator[WorkflowHistory]:
+        """Yield only the Histories that have no cached successful replay."""
+        async for history in histories:
+            key = history_hash(history)
+            updated = self._db.execute(
+                "UPDATE replays SET last_used = ? WHERE code_hash = ? AND history_hash = ?",
+                (self.clock(), self.code_hash, key),
+            )
+            if updated.rowcount:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._pending[history.run_id] = key
+                yield history
+        self._db.commit()
+
+    def record(self, results: WorkflowReplayResults) -> None:
+        """Store every History yielded by `uncached()` that did not fail to replay."""
+        now = self.clock()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO replays VALUES (?, ?, ?)",
+            [
+                (self.code_hash, key, now)
+                for run_id, key in self._pending.items()
+                if run_id not in results.replay_failures
+            ],
+        )
+        self._pending.clear()
+        self._evict()
+        self._db.commit()
+
+    def size(self) -> int:
+        """Bytes of the database pages in use."""
+        page_size = self._db.execute("PRAGMA page_size").fetchone()[0]
+        page_count = self._db.execute("PRAGMA page_count").fetchone()[0]
+        free = self._db.execute("PRAGMA freelist_count").fetchone()[0]
+        return (page_count - free) * page_size
+
+    def _evict(self) -> None:
+        # Drop the least recently used entries until the pages in use fit in max_bytes
+        while True:
+            size = self.size()
+            if size <= self.max_bytes:
+                return
+            (rows,) = self._db.execute("SELECT COUNT(*) FROM replays").fetchone()
+            if not rows:
+                return
+            # Keep the share of rows that should fit, with some room so the next runs do not evict at once
+            keep = min(rows - 1, int(rows * self.max_bytes / size * 0.9))
+            self._db.execute(
+                "DELETE FROM replays WHERE rowid IN ("
+                " SELECT rowid FROM replays ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (keep,),
+            )
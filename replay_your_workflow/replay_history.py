@@ -1,19 +1,44 @@
+import argparse
 import asyncio
 
 from temporalio.client import Client
 from temporalio.worker import Replayer
+
+from shared.sandbox import sandbox_runner
+
+from history_fetcher import fetch_histories
+from replay_cache import ReplayCache
 from your_workflow import YourWorkflow
 
 
 async def main():
+    parser = argparse.ArgumentParser(
+        description="Replay Workflow Histories from the server"
+    )
+    parser.add_argument(
+        "--cache",
+        help="SQLite file of successful replays; unchanged histories are skipped",
+    )
+    args = parser.parse_args()
+
     # Connect client
     client = await Client.connect("localhost:7233")
 
-    # Fetch the histories of the workflows to be replayed
-    workflows = client.list_workflows('WorkflowId="your-workflow-id"')
-    histories = workflows.map_histories()
-    replayer = Replayer(workflows=[YourWorkflow])
+    # Fetch the histories of the workflows to be replayed, several at a time.
+    # Histories are replayed as they arrive, so listing order does not matter.
+    histories = fetch_histories(
+        client, 'WorkflowId="your-workflow-id"', concurrency=10, ordered=False
+    )
+    cache = None
+    if args.cache:
+        cache = ReplayCache(args.cache, [YourWorkflow])
+        histories = cache.uncached(histories)
+    replayer = Replayer(workflows=[YourWorkflow], workflow_runner=sandbox_runner())
     results = await replayer.replay_workflows(histories, raise_on_replay_failure=False)
+    if cache:
+        cache.record(results)
+        cache.close()
+        print(f"{cache.hits} histories skipped, {cache.misses} replayed")
     print(results)
 
 
@@ -1,26 +1,108 @@
+import argparse
 import asyncio
-import json
+from datetime import datetime
 
-from temporalio.client import Client, WorkflowHistory
 from temporalio.worker import Replayer
-from your_workflow import YourWorkflow
 
+from shared.sandbox import sandbox_runner
 
-async def main():
-    # Connect client
-    await Client.connect("localhost:7233")
+from history_files import stream_histories
+from history_fingerprint import HistoryDeduplicator
+from history_index import HistoryIndex, stream_selected
+from parallel_replayer import replay_in_processes
+from replay_cache import ReplayCache
+from your_workflow import YourWorkflow
 
-    # Read the JSON file into memory
-    with open("test_replayer_complete_history.json", "r") as f:
-        history_json = json.load(f)
 
-        # Convert the JSON to a WorkflowHistory object
-        history = WorkflowHistory.from_json("replay-workflow-id", history_json)
+async def main():
+    parser = argparse.ArgumentParser(description="Replay exported Workflow Histories")
+    parser.add_argument(
+        "--input",
+        default="histories.jsonl",
+        help="File written by get_workflow_history.py",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="Replay across this many processes instead of on this event loop",
+    )
+    parser.add_argument(
+        "--cache",
+        help="SQLite file of successful replays; unchanged histories are skipped",
+    )
+    parser.add_argument(
+        "--index",
+        help="SQLite index of the input file, used to replay only a subset of it",
+    )
+    parser.add_argument("--workflow-type", help="Only replay this Workflow Type")
+    parser.add_argument(
+        "--activity-type", help="Only replay histories that scheduled this Activity"
+    )
+    parser.add_argument(
+        "--has-timer", action="store_true", help="Only replay histories with Timers"
+    )
+    parser.add_argument(
+        "--started-after",
+        type=datetime.fromisoformat,
+        help="Only replay histories started at or after this ISO 8601 time, UTC if no offset is given",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Only replay one history per distinct event and command skeleton",
+    )
+    parser.add_argument(
+        "--samples-per-skeleton",
+        type=int,
+        default=1,
+        help="With --dedupe, how many histories of each skeleton to replay",
+    )
+    args = parser.parse_args()
 
-        # Replay the workflow using the Replayer
-        replayer = Replayer(workflows=[YourWorkflow])
-        results = await replayer.replay_workflow(history, raise_on_replay_failure=False)
-        print(results)
+    # Read the file one history at a time and replay it using the Replayer
+    if args.index:
+        index = HistoryIndex(args.index)
+        index.add_file(args.input)
+        selected = index.select(
+            workflow_type=args.workflow_type,
+            activity_type=args.activity_type,
+            has_timer=True if args.has_timer else None,
+            started_after=args.started_after,
+        )
+        index.close()
+        print(f"{len(selected)} histories selected from the index")
+        histories = stream_selected(selected)
+    else:
+        histories = stream_histories(args.input)
+    deduplicator = None
+    if args.dedupe:
+        deduplicator = HistoryDeduplicator(args.samples_per_skeleton)
+        histories = deduplicator.representatives(histories)
+    cache = None
+    if args.cache:
+        cache = ReplayCache(args.cache, [YourWorkflow])
+        histories = cache.uncached(histories)
+    if args.processes:
+        results = await replay_in_processes(
+            histories, [YourWorkflow], processes=args.processes
+        )
+    else:
+        replayer = Replayer(workflows=[YourWorkflow], workflow_runner=sandbox_runner())
+        results = await replayer.replay_workflows(
+            histories, raise_on_replay_failure=False
+        )
+    if deduplicator:
+        print(
+            f"{len(deduplicator.counts)} distinct skeletons, "
+            f"{deduplicator.skipped} duplicate histories skipped"
+        )
+    if cache:
+        cache.record(results)
+        cache.close()
+        print(f"{cache.hits} histories skipped, {cache.misses} replayed")
+    for run_id, failure in results.replay_failures.items():
+        print(f"Replay failed for run {run_id}: {failure}")
+    print(f"{len(results.replay_failures)} replay failures")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,341 @@
+"""
+Build valid Event Histories for the sample Workflows without a Temporal Server.
+
+Each builder emits the same Events a Worker running the sample code would produce,
+so the results replay cleanly with `Replayer` and can be made as large as needed.
+Run ids, timestamps and payloads are derived from the arguments, so the same arguments always give the same History.
+The `*_histories()` functions yield one History at a time, so `generate_histories.py` can stream any number of them to disk.
+"""
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from google.protobuf.duration_pb2 import Duration
+from google.protobuf.timestamp_pb2 import Timestamp
+from temporalio.api.common.v1 import Payloads, WorkflowType
+from temporalio.api.enums.v1 import EventType, RetryState
+from temporalio.api.failure.v1 import ApplicationFailureInfo, Failure
+from temporalio.api.history.v1 import HistoryEvent
+from temporalio.api.taskqueue.v1 import TaskQueue
+from temporalio.client import WorkflowHistory
+from temporalio.converter import DataConverter
+
+_START_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_EVENT_INTERVAL = timedelta(milliseconds=10)
+
+
+def _payloads(*values: Any) -> Payloads:
+    return Payloads(
+        payloads=DataConverter.default.payload_converter.to_payloads(values)
+    )
+
+
+def _application_failure(message: str, failure_type: str) -> Failure:
+    return Failure(
+        message=message,
+        source="PythonSDK",
+        application_failure_info=ApplicationFailureInfo(type=failure_type),
+    )
+
+
+def _duration(seconds: float) -> Duration:
+    duration = Duration()
+    duration.FromTimedelta(timedelta(seconds=seconds))
+    return duration
+
+
+def synthetic_run_id(workflow_id: str, run: int = 0) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{workflow_id}/{run}"))
+
+
+class HistoryBuilder:
+    """Appends Events with consecutive ids and timestamps."""
+
+    def __init__(
+        self,
+        workflow_type: str,
+        *args: Any,
+        workflow_id: str,
+        run_id: Optional[str] = None,
+        task_queue: str = "synthetic-task-queue",
+    ) -> None:
+        self.workflow_id = workflow_id
+        self.task_queue = task_queue
+        self.events: List[HistoryEvent] = []
+        started = self._add(EventType.EVENT_TYPE_WORKFLOW_EXECUTION_STARTED)
+        attrs = started.workflow_execution_started_event_attributes
+        attrs.workflow_type.name = workflow_type
+        attrs.task_queue.name = task_queue
+        if args:
+            attrs.input.CopyFrom(_payloads(*args))
+        attrs.workflow_task_timeout.CopyFrom(_duration(10))
+        attrs.original_execution_run_id = run_id or synthetic_run_id(workflow_id)
+        attrs.first_execution_run_id = attrs.original_execution_run_id
+        attrs.attempt = 1
+
+    def _add(self, event_type: "EventType.ValueType") -> HistoryEvent:
+        event_id = len(self.events) + 1
+        event_time = Timestamp()
+        event_time.FromDatetime(_START_TIME + _EVENT_INTERVAL * event_id)
+        event = HistoryEvent(
+            event_id=event_id, event_time=event_time, event_type=event_type
+        )
+        self.events.append(event)
+        return event
+
+    def workflow_task(self) -> int:
+        """Add a completed Workflow Task and return the id of its completed Event."""
+        scheduled = self._add(EventType.EVENT_TYPE_WORKFLOW_TASK_SCHEDULED)
+        scheduled.workflow_task_scheduled_event_attributes.task_queue.name = (
+            self.task_queue
+        )
+        scheduled.workflow_task_scheduled_event_attributes.start_to_close_timeout.CopyFrom(
+            _duration(10)
+        )
+        scheduled.workflow_task_scheduled_event_attributes.attempt = 1
+        started = self._add(EventType.EVENT_TYPE_WORKFLOW_TASK_STARTED)
+        started.workflow_task_started_event_attributes.scheduled_event_id = (
+            scheduled.event_id
+        )
+        completed = self._add(EventType.EVENT_TYPE_WORKFLOW_TASK_COMPLETED)
+        attrs = completed.workflow_task_completed_event_attributes
+        attrs.scheduled_event_id = scheduled.event_id
+        attrs.started_event_id = started.event_id
+        return completed.event_id
+
+    def signal(self, name: str, *args: Any) -> None:
+        event = self._add(EventType.EVENT_TYPE_WORKFLOW_EXECUTION_SIGNALED)
+        event.workflow_execution_signaled_event_attributes.signal_name = name
+        if args:
+            event.workflow_execution_signaled_event_attributes.input.CopyFrom(
+                _payloads(*args)
+            )
+
+    def timer(self, timer_id: str, seconds: float, task_completed_id: int) -> None:
+        started = self._add(EventType.EVENT_TYPE_TIMER_STARTED)
+        attrs = started.timer_started_event_attributes
+        attrs.timer_id = timer_id
+        attrs.start_to_fire_timeout.CopyFrom(_duration(seconds))
+        attrs.workflow_task_completed_event_id = task_completed_id
+        fired = self._add(EventType.EVENT_TYPE_TIMER_FIRED)
+        fired.timer_fired_event_attributes.timer_id = timer_id
+        fired.timer_fired_event_attributes.started_event_id = started.event_id
+
+    def patch_marker(self, patch_id: str, task_completed_id: int) -> None:
+        event = self._add(EventType.EVENT_TYPE_MARKER_RECORDED)
+        attrs = event.marker_recorded_event_attributes
+        attrs.marker_name = "core_patch"
+        attrs.details["patch-data"].CopyFrom(
+            _payloads({"id": patch_id, "deprecated": False})
+        )
+        attrs.workflow_task_completed_event_id = task_completed_id
+
+    def activity(
+        self,
+        activity_id: str,
+        activity_type: str,
+        *args: Any,
+        task_completed_id: int,
+        attempt: int = 1,
+        last_failure: Optional[Failure] = None,
+        result: Any = None,
+        failure: Optional[Failure] = None,
+        retry_state: "RetryState.ValueType" = RetryState.RETRY_STATE_MAXIMUM_ATTEMPTS_REACHED,
+    ) -> None:
+        """Add an Activity that completed with `result`, or failed with `failure` if given.
+
+        Retries are not recorded as Events: the Started Event carries the final attempt number
+        and the failure of the attempt before it.
+        """
+        scheduled = self._add(EventType.EVENT_TYPE_ACTIVITY_TASK_SCHEDULED)
+        attrs = scheduled.activity_task_scheduled_event_attributes
+        attrs.activity_id = activity_id
+        attrs.activity_type.name = activity_type
+        attrs.task_queue.name = self.task_queue
+        if args:
+            attrs.input.CopyFrom(_payloads(*args))
+        attrs.schedule_to_close_timeout.CopyFrom(_duration(300))
+        attrs.workflow_task_completed_event_id = task_completed_id
+        started = self._add(EventType.EVENT_TYPE_ACTIVITY_TASK_STARTED)
+        started_attrs = started.activity_task_started_event_attributes
+        started_attrs.scheduled_event_id = scheduled.event_id
+        started_attrs.attempt = attempt
+        if last_failure is not None:
+            started_attrs.last_failure.CopyFrom(last_failure)
+        if failure is not None:
+            failed = self._add(EventType.EVENT_TYPE_ACTIVITY_TASK_FAILED)
+            failed_attrs = failed.activity_task_failed_event_attributes
+            failed_attrs.failure.CopyFrom(failure)
+            failed_attrs.scheduled_event_id = scheduled.event_id
+            failed_attrs.started_event_id = started.event_id
+            failed_attrs.retry_state = retry_state
+            return
+        completed = self._add(EventType.EVENT_TYPE_ACTIVITY_TASK_COMPLETED)
+        completed_attrs = completed.activity_task_completed_event_attributes
+        completed_attrs.result.CopyFrom(_payloads(result))
+        completed_attrs.scheduled_event_id = scheduled.event_id
+        completed_attrs.started_event_id = started.event_id
+
+    def complete(self, result: Any, task_completed_id: int) -> WorkflowHistory:
+        event = self._add(EventType.EVENT_TYPE_WORKFLOW_EXECUTION_COMPLETED)
+        attrs = event.workflow_execution_completed_event_attributes
+        attrs.result.CopyFrom(_payloads(result))
+        attrs.workflow_task_completed_event_id = task_completed_id
+        return WorkflowHistory(self.workflow_id, self.events)
+
+    def continue_as_new(
+        self, *args: Any, new_run_id: str, task_completed_id: int
+    ) -> WorkflowHistory:
+        started = self.events[0].workflow_execution_started_event_attributes
+        event = self._add(EventType.EVENT_TYPE_WORKFLOW_EXECUTION_CONTINUED_AS_NEW)
+        attrs = event.workflow_execution_continued_as_new_event_attributes
+        attrs.new_execution_run_id = new_run_id
+        attrs.workflow_type.CopyFrom(WorkflowType(name=started.workflow_type.name))
+        attrs.task_queue.CopyFrom(TaskQueue(name=self.task_queue))
+        attrs.input.CopyFrom(_payloads(*args))
+        attrs.workflow_task_timeout.CopyFrom(_duration(10))
+        attrs.workflow_task_completed_event_id = task_completed_id
+        return WorkflowHistory(self.workflow_id, self.events)
+
+
+def greeting_histories(
+    count: int, signals: int, workflow_id: str = "greeting-workflow"
+) -> Iterator[WorkflowHistory]:
+    for i in range(count):
+        yield greeting_history(signals, f"{workflow_id}-{i}")
+
+
+def greeting_history(
+    signals: int, workflow_id: str = "greeting-workflow"
+) -> WorkflowHistory:
+    """signal_your_workflow GreetingWorkflow receiving `signals` greetings, one per Workflow Task, then exit."""
+    builder = HistoryBuilder("GreetingWorkflow", workflow_id=workflow_id)
+    builder.workflow_task()
+    for i in range(signals):
+        builder.signal("submit_greeting", f"User {i}")
+        builder.workflow_task()
+    builder.signal("exit")
+    task_completed_id = builder.workflow_task()
+    return builder.complete(
+        [f"Hello, User {i}" for i in range(signals)], task_completed_id
+    )
+
+
+def looping_history(
+    iteration: int, workflow_id: str = "looping-workflow"
+) -> WorkflowHistory:
+    """One run of continue_as_new LoopingWorkflow: a 10 second Timer then Continue-As-New, or completion at iteration 5."""
+    builder = HistoryBuilder(
+        "LoopingWorkflow",
+        iteration,
+        workflow_id=workflow_id,
+        run_id=synthetic_run_id(workflow_id, iteration),
+    )
+    if iteration >= 5:
+        return builder.complete(None, builder.workflow_task())
+    builder.timer("1", 10, builder.workflow_task())
+    return builder.continue_as_new(
+        iteration + 1,
+        new_run_id=synthetic_run_id(workflow_id, iteration + 1),
+        task_completed_id=builder.workflow_task(),
+    )
+
+
+def looping_histories(
+    timers: int, workflow_id: str = "looping-workflow"
+) -> Iterator[WorkflowHistory]:
+    """Continue-As-New chains of LoopingWorkflow runs that fire `timers` Timers in total.
+
+    The sample sleeps once per run and completes after five runs, so each chain holds at most five Timers.
+    """
+    chain = 0
+    while timers > 0:
+        chain_id = f"{workflow_id}-{chain}"
+        for iteration in range(min(timers, 5)):
+            yield looping_history(iteration, chain_id)
+        if timers >= 5:
+            yield looping_history(5, chain_id)
+        timers -= 5
+        chain += 1
+
+
+def patched_history(workflow_id: str = "patched-workflow") -> WorkflowHistory:
+    """version_your_workflows MyWorkflow from workflow_2_patched_dacx taking the patched branch."""
+    builder = HistoryBuilder("MyWorkflow", workflow_id=workflow_id)
+    task_completed_id = builder.workflow_task()
+    builder.patch_marker("my-patch", task_completed_id)
+    builder.activity(
+        "1",
+        "post_patch_activity",
+        task_completed_id=task_completed_id,
+        result="post-patch",
+    )
+    return builder.complete(None, builder.workflow_task())
+
+
+def money_transfer_details(seed: int, index: int) -> Dict[str, Any]:
+    """The fields of workflow_failures MoneyTransfer, the same for the same seed and index."""
+    rng = random.Random(f"{seed}:{index}")
+    return {
+        "sender": f"{rng.randint(10, 99)}-{rng.randint(100, 999)}",
+        "receiver": f"{rng.randint(10, 99)}-{rng.randint(100, 999)}",
+        "amount": rng.randint(1, 10_000),
+        "reference_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+    }
+
+
+def money_transfer_history(
+    details: Dict[str, Any], retries: int, workflow_id: str = "money-transfer"
+) -> WorkflowHistory:
+    """workflow_failures MoneyTransferWorkflow whose withdrawal succeeds after `retries` failed attempts.
+
+    The deposit Activity in the sample always raises, so the transfer ends with a refund.
+    """
+    builder = HistoryBuilder(
+        "MoneyTransferWorkflow",
+        details,
+        workflow_id=workflow_id,
+        task_queue="money-transfer",
+    )
+    builder.activity(
+        "1",
+        "withdraw",
+        details,
+        task_completed_id=builder.workflow_task(),
+        attempt=retries + 1,
+        last_failure=_application_failure("Connection reset", "ConnectionError")
+        if retries
+        else None,
+        result=details,
+    )
+    builder.activity(
+        "2",
+        "deposit",
+        details,
+        task_completed_id=builder.workflow_task(),
+        failure=_application_failure("This deposit has failed.", "Exception"),
+        retry_state=RetryState.RETRY_STATE_NON_RETRYABLE_FAILURE,
+    )
+    builder.activity(
+        "3",
+        "refund",
+        details,
+        task_completed_id=builder.workflow_task(),
+        result=details,
+    )
+    fields = ", ".join(f"{name}={value!r}" for name, value in details.items())
+    return builder.complete(
+        f"Transfer failed. Money returned to sender: MoneyTransfer({fields})",
+        builder.workflow_task(),
+    )
+
+
+def money_transfer_histories(
+    count: int, retries: int, seed: int = 0, workflow_id: str = "money-transfer"
+) -> Iterator[WorkflowHistory]:
+    for i in range(count):
+        yield money_transfer_history(
+            money_transfer_details(seed, i), retries, f"{workflow_id}-{i}"
+        )
@@ -0,0 +1,31 @@
+import pytest
+
+from benchmark_replay import CASES, compare, run_case
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_case_histories_replay(case):
+    result = run_case(case, 100)
+    assert result["failures"] == 0
+    assert result["events"] >= 100
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "results": [
+            {"case": "MyWorkflow", "size": 1000, "failures": 0, "p50_ms": 10.0},
+        ]
+    }
+    slower = {
+        "results": [
+            {
+                "case": "MyWorkflow",
+                "size": 1000,
+                "failures": 0,
+                "p50_ms": 12.0,
+                "events_per_second": 100.0,
+            }
+        ]
+    }
+    assert compare(baseline, slower, 0.1) == ["MyWorkflow 1000: p50_ms 10.00 -> 12.00"]
+    assert compare(baseline, slower, 0.5) == []
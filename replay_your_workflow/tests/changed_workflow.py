@@ -0,0 +1,13 @@
+import asyncio
+
+from temporalio import workflow
+
+
+@workflow.defn(name="YourWorkflow")
+class YourChangedWorkflow:
+    """YourWorkflow with a Timer added, so it no longer replays the checked-in History."""
+
+    @workflow.run
+    async def run(self, name: str) -> str:
+        await asyncio.sleep(10)
+        return name
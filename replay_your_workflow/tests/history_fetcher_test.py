@@ -0,0 +1,60 @@
+import asyncio
+import random
+from dataclasses import dataclass
+
+import pytest
+from temporalio.client import WorkflowHistory
+
+from history_fetcher import fetch_histories
+
+
+@dataclass
+class _Execution:
+    id: str
+    run_id: str
+
+
+class _FakeClient:
+    """Stands in for the listing and fetch calls fetch_histories makes."""
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _list(self):
+        for i in range(self.count):
+            yield _Execution(f"workflow-{i}", f"run-{i}")
+
+    def list_workflows(self, query):
+        return self._list()
+
+    def get_workflow_handle(self, workflow_id, *, run_id):
+        client = self
+
+        class _Handle:
+            async def fetch_history(self):
+                client.in_flight += 1
+                client.max_in_flight = max(client.max_in_flight, client.in_flight)
+                await asyncio.sleep(random.random() / 100)
+                client.in_flight -= 1
+                return WorkflowHistory(workflow_id, [])
+
+        return _Handle()
+
+
+@pytest.mark.asyncio
+async def test_fetch_histories_ordered():
+    client = _FakeClient(50)
+    ids = [h.workflow_id async for h in fetch_histories(client, concurrency=5)]
+    assert ids == [f"workflow-{i}" for i in range(50)]
+    assert client.max_in_flight == 5
+
+
+@pytest.mark.asyncio
+async def test_fetch_histories_unordered():
+    client = _FakeClient(50)
+    histories = fetch_histories(client, concurrency=5, ordered=False)
+    ids = [h.workflow_id async for h in histories]
+    assert sorted(ids) == sorted(f"workflow-{i}" for i in range(50))
+    assert client.max_in_flight == 5
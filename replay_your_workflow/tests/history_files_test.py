@@ -0,0 +1,70 @@
+import os
+
+import pytest
+from temporalio.worker import Replayer
+
+from history_files import read_histories, stream_histories, write_histories
+from your_workflow import YourWorkflow
+
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), "your_workflow_history.jsonl")
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "histories.jsonl",
+        "histories.jsonl.gz",
+        "histories.binpb",
+        "histories.binpb.gz",
+    ],
+)
+@pytest.mark.asyncio
+async def test_write_and_read_histories(tmp_path, file_name):
+    history = next(read_histories(HISTORY_FILE))
+    path = str(tmp_path / file_name)
+
+    async def histories():
+        for _ in range(3):
+            yield history
+
+    assert 3 == await write_histories(histories(), path)
+    read_back = list(read_histories(path))
+    assert [h.run_id for h in read_back] == [history.run_id] * 3
+    assert read_back[0].events == history.events
+
+
+@pytest.mark.asyncio
+async def test_replay_exported_history():
+    results = await Replayer(workflows=[YourWorkflow]).replay_workflows(
+        stream_histories(HISTORY_FILE)
+    )
+    assert not results.replay_failures
+
+
+@pytest.mark.asyncio
+async def test_replay_binary_history(tmp_path):
+    path = str(tmp_path / "history.binpb")
+    await write_histories(stream_histories(HISTORY_FILE), path)
+    results = await Replayer(workflows=[YourWorkflow]).replay_workflows(
+        stream_histories(path)
+    )
+    assert not results.replay_failures
+
+
+# Bytes of the second record that are left: part of a length, part of the Workflow Id, part of the History
+@pytest.mark.parametrize("kept", [2, 6, 60])
+@pytest.mark.asyncio
+async def test_truncated_binary_record(tmp_path, kept):
+    path = str(tmp_path / "histories.binpb")
+    history = next(read_histories(HISTORY_FILE))
+
+    async def histories():
+        for _ in range(2):
+            yield history
+
+    await write_histories(histories(), path)
+    record_size = os.path.getsize(path) // 2
+    with open(path, "r+b") as f:
+        f.truncate(record_size + kept)
+    with pytest.raises(ValueError, match=f"Truncated record at offset {record_size} of "):
+        list(read_histories(path))
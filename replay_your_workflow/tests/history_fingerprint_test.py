@@ -0,0 +1,58 @@
+import json
+import os
+
+import pytest
+from temporalio.api.common.v1 import Payload
+from temporalio.api.enums.v1 import EventType
+from temporalio.api.history.v1 import HistoryEvent
+from temporalio.client import WorkflowHistory
+
+from history_files import read_histories
+from history_fingerprint import HistoryDeduplicator, history_fingerprint
+
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), "your_workflow_history.jsonl")
+
+
+def _with_patch_marker(history: WorkflowHistory, patch_id: str) -> WorkflowHistory:
+    marker = HistoryEvent(event_type=EventType.EVENT_TYPE_MARKER_RECORDED)
+    marker.marker_recorded_event_attributes.marker_name = "core_patch"
+    marker.marker_recorded_event_attributes.details["patch-data"].payloads.append(
+        Payload(data=json.dumps({"id": patch_id, "deprecated": False}).encode())
+    )
+    return WorkflowHistory(history.workflow_id, [*history.events[:4], marker])
+
+
+def test_fingerprint_ignores_payloads_and_ids():
+    history = next(read_histories(HISTORY_FILE))
+    started = HistoryEvent()
+    started.CopyFrom(history.events[0])
+    attrs = started.workflow_execution_started_event_attributes
+    attrs.input.Clear()
+    attrs.original_execution_run_id = "another-run-id"
+    other = WorkflowHistory("other-workflow-id", [started, *history.events[1:]])
+    assert history_fingerprint(history) == history_fingerprint(other)
+
+
+def test_fingerprint_includes_patch_ids():
+    history = next(read_histories(HISTORY_FILE))
+    assert history_fingerprint(
+        _with_patch_marker(history, "my-patch")
+    ) != history_fingerprint(_with_patch_marker(history, "other-patch"))
+
+
+@pytest.mark.parametrize("samples", [1, 2])
+@pytest.mark.asyncio
+async def test_deduplicator_keeps_samples_per_skeleton(samples):
+    history = next(read_histories(HISTORY_FILE))
+    patched = _with_patch_marker(history, "my-patch")
+
+    async def histories():
+        for _ in range(5):
+            yield history
+            yield patched
+
+    deduplicator = HistoryDeduplicator(samples)
+    kept = [h async for h in deduplicator.representatives(histories())]
+    assert len(kept) == 2 * samples
+    assert len(deduplicator.counts) == 2
+    assert deduplicator.skipped == 10 - 2 * samples
@@ -0,0 +1,74 @@
+import logging
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from history_files import read_histories, write_histories
+from history_index import HistoryIndex
+from temporalio.client import WorkflowHistory
+
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), "your_workflow_history.jsonl")
+
+
+@pytest.mark.parametrize("file_name", ["histories.jsonl", "histories.binpb"])
+@pytest.mark.asyncio
+async def test_index_selects_histories(tmp_path, file_name):
+    history = next(read_histories(HISTORY_FILE))
+    path = str(tmp_path / file_name)
+
+    async def histories():
+        for _ in range(3):
+            yield history
+
+    await write_histories(histories(), path)
+    index = HistoryIndex(str(tmp_path / "index.sqlite"))
+    assert index.add_file(path)
+    assert not index.add_file(path)
+
+    selected = index.select(workflow_type="YourWorkflow", activity_type="your_activity")
+    assert len(selected) == 3
+    assert len({entry.offset for entry in selected}) == 3
+    assert selected[2].load().events == history.events
+    assert selected[0].event_count == len(history.events)
+    assert selected[0].close_time is not None
+    assert index.activity_types(selected[0]) == ["your_activity"]
+
+    assert not index.select(has_timer=True)
+    assert not index.select(workflow_type="BackgroundCheck")
+    assert not index.select(started_after=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+
+@pytest.mark.asyncio
+async def test_naive_times_are_utc(tmp_path):
+    history = next(read_histories(HISTORY_FILE))
+    started = history.events[0].event_time.ToDatetime()
+    path = str(tmp_path / "histories.binpb")
+
+    async def histories():
+        yield history
+
+    await write_histories(histories(), path)
+    index = HistoryIndex(str(tmp_path / "index.sqlite"))
+    index.add_file(path)
+    assert started.tzinfo is None
+    assert index.select(started_after=started)
+    assert not index.select(started_before=started)
+    assert index.select(started_after=started.replace(tzinfo=timezone.utc))
+
+
+@pytest.mark.asyncio
+async def test_empty_histories_are_skipped(tmp_path, caplog):
+    history = next(read_histories(HISTORY_FILE))
+    path = str(tmp_path / "histories.binpb")
+
+    async def histories():
+        yield WorkflowHistory("empty", [])
+        yield history
+
+    await write_histories(histories(), path)
+    index = HistoryIndex(str(tmp_path / "index.sqlite"))
+    with caplog.at_level(logging.WARNING):
+        index.add_file(path)
+    assert [entry.workflow_id for entry in index.select()] == [history.workflow_id]
+    assert "Skipping empty History of empty" in caplog.text
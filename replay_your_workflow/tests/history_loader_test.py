@@ -0,0 +1,41 @@
+import json
+import os
+
+import google.protobuf.json_format
+import pytest
+from temporalio.api.history.v1 import History
+
+from history_files import read_histories
+from history_loader import load_histories
+
+HERE = os.path.dirname(__file__)
+HISTORY_FILE = os.path.join(HERE, "your_workflow_history.jsonl")
+LEGACY_HISTORY_FILE = os.path.join(HERE, "..", "test_replayer_complete_history.json")
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1 << 20])
+def test_load_history_file(tmp_path, chunk_size):
+    history = next(read_histories(HISTORY_FILE))
+    path = tmp_path / "history.json"
+    path.write_text(
+        google.protobuf.json_format.MessageToJson(History(events=history.events))
+    )
+    loaded = list(load_histories(str(path), "replay-workflow", chunk_size=chunk_size))
+    assert len(loaded) == 1
+    assert loaded[0].events == history.events
+
+
+def test_load_double_encoded_histories():
+    with open(LEGACY_HISTORY_FILE) as f:
+        text = f.read()
+    decoder = json.JSONDecoder()
+    expected = []
+    pos = 0
+    while text[pos:].strip():
+        pos += len(text[pos:]) - len(text[pos:].lstrip())
+        history_json, pos = decoder.raw_decode(text, pos)
+        expected.append(len(json.loads(history_json)["events"]))
+
+    loaded = list(load_histories(LEGACY_HISTORY_FILE, batch_size=10))
+    assert [len(h.events) for h in loaded] == expected
+    assert len(loaded) > 1
@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+from history_files import read_histories
+from parallel_replayer import replay_in_processes
+from tests.changed_workflow import YourChangedWorkflow
+from your_workflow import YourWorkflow
+
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), "your_workflow_history.jsonl")
+
+
+async def _histories(count: int):
+    history = next(read_histories(HISTORY_FILE))
+    for _ in range(count):
+        yield history
+
+
+@pytest.mark.asyncio
+async def test_replay_in_processes():
+    results = await replay_in_processes(
+        _histories(6), [YourWorkflow], processes=2, batch_size=2
+    )
+    assert not results.replay_failures
+
+
+@pytest.mark.asyncio
+async def test_replay_in_processes_reports_failures():
+    results = await replay_in_processes(
+        _histories(2), [YourChangedWorkflow], processes=2, batch_size=1
+    )
+    history = next(read_histories(HISTORY_FILE))
+    assert list(results.replay_failures) == [history.run_id]
@@ -0,0 +1,94 @@
+import itertools
+import os
+from typing import List
+
+import pytest
+from temporalio.api.history.v1 import History
+from temporalio.client import WorkflowHistory
+from temporalio.worker import Replayer, WorkflowReplayResults
+
+from history_files import read_histories, stream_histories
+from replay_cache import ReplayCache, workflow_source_files
+from tests.changed_workflow import YourChangedWorkflow
+from your_workflow import YourWorkflow
+
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), "your_workflow_history.jsonl")
+
+
+async def _replay(cache: ReplayCache, workflow) -> int:
+    replayed = 0
+
+    async def counted(histories):
+        nonlocal replayed
+        async for history in histories:
+            replayed += 1
+            yield history
+
+    results = await Replayer(workflows=[workflow]).replay_workflows(
+        counted(cache.uncached(stream_histories(HISTORY_FILE))),
+        raise_on_replay_failure=False,
+    )
+    cache.record(results)
+    return replayed
+
+
+@pytest.mark.asyncio
+async def test_replay_cache_skips_unchanged_histories(tmp_path):
+    path = str(tmp_path / "replay_cache.sqlite")
+    assert 1 == await _replay(ReplayCache(path, [YourWorkflow]), YourWorkflow)
+    assert 0 == await _replay(ReplayCache(path, [YourWorkflow]), YourWorkflow)
+
+
+@pytest.mark.asyncio
+async def test_replay_cache_does_not_store_failures(tmp_path):
+    path = str(tmp_path / "replay_cache.sqlite")
+    cache = ReplayCache(path, [YourChangedWorkflow])
+    assert cache.code_hash != ReplayCache(path, [YourWorkflow]).code_hash
+    assert 1 == await _replay(cache, YourChangedWorkflow)
+    assert 1 == await _replay(cache, YourChangedWorkflow)
+
+
+def _variants(count: int):
+    # Copies of the exported history with their own Run Id, so each has its own cache key
+    history = next(read_histories(HISTORY_FILE))
+    variants = []
+    for i in range(count):
+        copy = History(events=history.events)
+        started = copy.events[0].workflow_execution_started_event_attributes
+        started.original_execution_run_id = f"run-{i}"
+        variants.append(WorkflowHistory(history.workflow_id, copy.events))
+    return variants
+
+
+async def _check(cache: ReplayCache, histories) -> List[str]:
+    async def stream():
+        for history in histories:
+            yield history
+
+    missed = [history.run_id async for history in cache.uncached(stream())]
+    cache.record(WorkflowReplayResults(replay_failures={}))
+    return missed
+
+
+@pytest.mark.asyncio
+async def test_replay_cache_evicts_least_recently_used(tmp_path):
+    clock = itertools.count()
+    cache = ReplayCache(
+        str(tmp_path / "replay_cache.sqlite"),
+        [YourWorkflow],
+        max_bytes=32 * 1024,
+        clock=lambda: next(clock),
+    )
+    first, *others = _variants(400)
+    assert ["run-0"] == await _check(cache, [first])
+    for other in others:
+        # Using the first each time keeps it the most recently used
+        assert [other.run_id] == await _check(cache, [first, other])
+    assert cache.size() <= 32 * 1024
+    assert [] == await _check(cache, [first, others[-1]])
+    assert ["run-1"] == await _check(cache, [others[0]])
+
+
+def test_code_hash_covers_imported_modules():
+    files = {os.path.basename(path) for path in workflow_source_files([YourWorkflow])}
+    assert files == {"your_workflow.py", "your_activities.py", "your_dataobject.py"}
@@ -0,0 +1,55 @@
+from temporalio.api.enums.v1 import EventType
+
+from history_files import history_to_line
+from synthetic_histories import (
+    greeting_histories,
+    looping_histories,
+    money_transfer_histories,
+)
+
+
+def _count(histories, event_type):
+    return sum(
+        1
+        for history in histories
+        for event in history.events
+        if event.event_type == event_type
+    )
+
+
+def test_histories_are_deterministic():
+    def lines(seed):
+        return [
+            history_to_line(h)
+            for h in [
+                *greeting_histories(2, 5),
+                *looping_histories(7),
+                *money_transfer_histories(3, retries=2, seed=seed),
+            ]
+        ]
+
+    assert lines(seed=1) == lines(seed=1)
+    assert lines(seed=1) != lines(seed=2)
+
+
+def test_looping_histories_fire_requested_timers():
+    histories = list(looping_histories(12))
+    assert _count(histories, EventType.EVENT_TYPE_TIMER_FIRED) == 12
+    # Two full chains of five runs plus a completing run each, then two runs of a third chain
+    assert len(histories) == 14
+    assert {h.workflow_id for h in histories} == {
+        "looping-workflow-0",
+        "looping-workflow-1",
+        "looping-workflow-2",
+    }
+
+
+def test_money_transfer_records_retries():
+    history = next(money_transfer_histories(1, retries=4))
+    started = [
+        e.activity_task_started_event_attributes
+        for e in history.events
+        if e.event_type == EventType.EVENT_TYPE_ACTIVITY_TASK_STARTED
+    ]
+    assert [s.attempt for s in started] == [5, 1, 1]
+    assert started[0].last_failure.application_failure_info.type == "ConnectionError"
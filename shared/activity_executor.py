@@ -0,0 +1,76 @@
+"""
+Run synchronous Activities on a thread pool or a process pool.
+
+Synchronous Activities need an `activity_executor` on the Worker.
+A `ThreadPoolExecutor` suits Activities that block on I/O, but pure-Python CPU work still holds the GIL.
+A `ProcessPoolExecutor` runs CPU-bound Activities in parallel on every core.
+Heartbeats and cancellation from other processes go through a `SharedStateManager`,
+and every Worker in the process shares one, so only one `multiprocessing` manager process is started.
+
+Choose the executor with `TEMPORAL_ACTIVITY_EXECUTOR=thread` (the default) or `process`.
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from temporalio.worker import SharedStateManager
+
+EXECUTOR_ENV = "TEMPORAL_ACTIVITY_EXECUTOR"
+EXECUTOR_KINDS = ["thread", "process"]
+
+_heartbeat_manager: Optional[SharedStateManager] = None
+
+
+def heartbeat_manager() -> SharedStateManager:
+    """The process-wide manager that relays heartbeats and cancellation to pool processes."""
+    global _heartbeat_manager
+    if _heartbeat_manager is None:
+        manager = multiprocessing.get_context("spawn").Manager()
+        _heartbeat_manager = SharedStateManager.create_from_multiprocessing(manager)
+    return _heartbeat_manager
+
+
+@contextmanager
+def activity_executor(
+    kind: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    options: Optional[Mapping[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield `Worker()` keyword arguments for an executor, and shut the executor down afterwards.
+
+    `options` are the Worker's other options, such as those from `worker_options()`.
+    The pool has one worker per Activity slot. If the slots are not set there,
+    they are set to the pool size, so the Worker never accepts more Activities than it can run.
+    """
+    if options is None:
+        options = {}
+    if kind is None:
+        kind = os.environ.get(EXECUTOR_ENV, "thread")
+    if kind not in EXECUTOR_KINDS:
+        raise ValueError(
+            f"Unknown Activity executor {kind!r}, expected one of {EXECUTOR_KINDS}"
+        )
+    if max_workers is None:
+        max_workers = options.get("max_concurrent_activities") or (
+            os.cpu_count() if kind == "process" else 100
+        )
+
+    executor_options: Dict[str, Any] = {}
+    if kind == "thread":
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+    else:
+        # Forking a process that already runs the SDK's Rust runtime is unsafe, so always spawn
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        executor_options["shared_state_manager"] = heartbeat_manager()
+    executor_options["activity_executor"] = executor
+    if "max_concurrent_activities" not in options:
+        executor_options["max_concurrent_activities"] = max_workers
+    try:
+        yield executor_options
+    finally:
+        executor.shutdown(wait=True)
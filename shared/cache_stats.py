@@ -0,0 +1,122 @@
+"""
+Sticky cache counters for Workers, read from the SDK's own metrics.
+
+A Worker keeps up to `max_cached_workflows` Workflows in memory between tasks.
+A task for a Workflow that is not cached (a miss) replays the Workflow's whole History first,
+so a long-running Workflow that receives many Signals gets slower as its History grows.
+`CacheStats` counts hits, misses and evictions so the cache can be sized for the load:
+
+    cache_stats = CacheStats()
+    client = await Client.connect("localhost:7233", runtime=cache_stats.runtime)
+    # ... run Workers with this client ...
+    cache_stats.update()
+    print(cache_stats.snapshot())
+
+Sample Workers turn this on with `TEMPORAL_CACHE_STATS_INTERVAL`, the number of seconds between log lines.
+A runtime has a single metrics exporter, so it cannot be combined with `TEMPORAL_METRICS_ADDRESS`,
+whose Prometheus metrics include the sticky cache size and hit and miss counters.
+Reading metrics in process requires temporalio 1.5 or later.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from temporalio.runtime import Runtime, TelemetryConfig
+
+from shared.metrics import ADDRESS_ENV
+
+try:
+    from temporalio.runtime import MetricBuffer
+except ImportError:  # temporalio < 1.5
+    MetricBuffer = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_ENV = "TEMPORAL_CACHE_STATS_INTERVAL"
+
+# Core SDK metric names, without the "temporal_" prefix
+HIT_METRIC = "sticky_cache_hit"
+MISS_METRIC = "sticky_cache_miss"
+EVICTION_METRIC = "sticky_cache_total_forced_eviction"
+SIZE_METRIC = "sticky_cache_size"
+
+
+class CacheStats:
+    def __init__(self, interval: float = 60.0, buffer_size: int = 100_000) -> None:
+        if MetricBuffer is None:
+            raise RuntimeError("Sticky cache stats require temporalio 1.5 or later")
+        self.interval = interval
+        self.buffer = MetricBuffer(buffer_size)
+        # Clients and Workers must use this runtime for their metrics to be counted
+        self.runtime = Runtime(telemetry=TelemetryConfig(metrics=self.buffer))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+
+    def record(self, updates: Iterable[Any]) -> None:
+        for update in updates:
+            name = update.metric.name
+            if name.startswith("temporal_"):
+                name = name[len("temporal_") :]
+            if name == HIT_METRIC:
+                self.hits += int(update.value)
+            elif name == MISS_METRIC:
+                self.misses += int(update.value)
+            elif name == EVICTION_METRIC:
+                self.evictions += int(update.value)
+            elif name == SIZE_METRIC:
+                self.size = int(update.value)
+
+    def update(self) -> None:
+        """Add the metric updates recorded since the last call."""
+        self.record(self.buffer.retrieve_updates())
+
+    def reset(self) -> None:
+        self.update()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 1.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+    async def log_forever(self) -> None:
+        """Log the counters every `interval` seconds, draining the metric buffer as it goes."""
+        while True:
+            await asyncio.sleep(self.interval)
+            self.update()
+            logger.info(
+                "Sticky cache: %(hits)d hits, %(misses)d misses, %(evictions)d evictions, "
+                "%(size)d cached, hit ratio %(hit_ratio).2f",
+                self.snapshot(),
+            )
+
+
+def cache_stats_from_env(
+    environ: Optional[Mapping[str, str]] = None,
+) -> Optional[CacheStats]:
+    """A `CacheStats` if `TEMPORAL_CACHE_STATS_INTERVAL` is set, otherwise None."""
+    if environ is None:
+        environ = os.environ
+    interval = environ.get(INTERVAL_ENV)
+    if not interval:
+        return None
+    if environ.get(ADDRESS_ENV):
+        # The Client would use the buffer's runtime, and the Prometheus one would serve nothing
+        raise ValueError(
+            f"{INTERVAL_ENV} and {ADDRESS_ENV} cannot both be set: "
+            f"unset {INTERVAL_ENV} and read the sticky cache metrics from Prometheus"
+        )
+    return CacheStats(interval=float(interval))
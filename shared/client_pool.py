@@ -0,0 +1,122 @@
+"""
+Reuse Client connections within a process.
+
+`Client.connect()` opens a new connection, with a TLS handshake when TLS is used, every time it is called.
+`get_client()` connects once for each target, Namespace and TLS identity, and returns the same Client after that,
+so a long-lived service pays for the connection once instead of on every request:
+
+    client = await get_client("localhost:7233")
+    client = await get_client(
+        "your-namespace.a1b2c.tmprl.cloud:7233",
+        namespace="your-namespace.a1b2c",
+        tls=TLSFiles("client-cert.pem", "client-private-key.pem"),
+    )
+
+The TLS identity is the set of PEM files. Their contents are read once and read again only when the files change,
+and the next `get_client()` after a certificate is rotated on disk connects with the new one.
+Clients that already hold the old connection keep working until the old certificate expires.
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from temporalio.client import Client, TLSConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TLSFiles:
+    """Paths of the PEM files of a TLS identity."""
+
+    client_cert: str
+    client_private_key: str
+    server_root_ca_cert: Optional[str] = None
+    domain: Optional[str] = None
+
+    def _paths(self) -> Tuple[str, ...]:
+        return tuple(
+            path
+            for path in (
+                self.client_cert,
+                self.client_private_key,
+                self.server_root_ca_cert,
+            )
+            if path
+        )
+
+    def version(self) -> Tuple[Tuple[int, int], ...]:
+        """Modification time and size of each file, which change when a certificate is rotated."""
+        return tuple(
+            (stat.st_mtime_ns, stat.st_size)
+            for stat in (os.stat(path) for path in self._paths())
+        )
+
+    def load(self) -> TLSConfig:
+        def read(path: Optional[str]) -> Optional[bytes]:
+            if not path:
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+
+        return TLSConfig(
+            client_cert=read(self.client_cert),
+            client_private_key=read(self.client_private_key),
+            server_root_ca_cert=read(self.server_root_ca_cert),
+            domain=self.domain,
+        )
+
+
+_Key = Tuple[str, str, Optional[TLSFiles]]
+_Version = Optional[Tuple[Tuple[int, int], ...]]
+
+
+class ClientPool:
+    """Clients by target, Namespace and TLS identity."""
+
+    def __init__(self) -> None:
+        self._clients: Dict[_Key, Tuple[_Version, "asyncio.Future[Client]"]] = {}
+
+    async def get(
+        self, target: str, namespace: str = "default", tls: Optional[TLSFiles] = None
+    ) -> Client:
+        key = (target, namespace, tls)
+        version = tls.version() if tls else None
+        cached = self._clients.get(key)
+        if cached is None or cached[0] != version:
+            if cached is not None:
+                logger.info("TLS files for %s changed, connecting again", target)
+            # Callers that ask while the connection is being made wait for the same one
+            cached = (version, asyncio.ensure_future(self._connect(*key)))
+            self._clients[key] = cached
+        connecting = cached[1]
+        if connecting.done() and not connecting.exception():
+            return connecting.result()
+        try:
+            # A caller that is cancelled does not cancel the connection for the others
+            return await asyncio.shield(connecting)
+        except Exception:
+            # Connect again on the next call
+            if self._clients.get(key) is cached:
+                del self._clients[key]
+            raise
+
+    async def _connect(
+        self, target: str, namespace: str, tls: Optional[TLSFiles]
+    ) -> Client:
+        return await Client.connect(
+            target, namespace=namespace, tls=tls.load() if tls else False
+        )
+
+
+_pool = ClientPool()
+
+
+async def get_client(
+    target: str, namespace: str = "default", tls: Optional[TLSFiles] = None
+) -> Client:
+    """A Client of this process's pool, connected on first use."""
+    return await _pool.get(target, namespace, tls)
@@ -0,0 +1,30 @@
+"""
+Stand-in CPU-bound work for the synchronous sample Activities.
+
+The sample Activities return immediately, so they cannot show the difference between Activity executors.
+The synchronous variants call `hash_rounds()` first, which holds the GIL the way pure-Python work does.
+Set `SAMPLE_ACTIVITY_CPU_ROUNDS` to change how long each call takes.
+"""
+
+import hashlib
+import os
+from typing import Optional
+
+from temporalio import activity
+
+ROUNDS_ENV = "SAMPLE_ACTIVITY_CPU_ROUNDS"
+DEFAULT_ROUNDS = 100_000
+
+
+def hash_rounds(
+    data: str, rounds: Optional[int] = None, heartbeat_every: int = 10_000
+) -> str:
+    """Hash `data` repeatedly, heartbeating progress when called from an Activity."""
+    if rounds is None:
+        rounds = int(os.environ.get(ROUNDS_ENV, DEFAULT_ROUNDS))
+    digest = data.encode()
+    for i in range(rounds):
+        digest = hashlib.sha256(digest).digest()
+        if heartbeat_every and i % heartbeat_every == 0 and activity.in_activity():
+            activity.heartbeat(i)
+    return digest.hex()
@@ -0,0 +1,110 @@
+"""
+Latency percentiles in constant memory, for benchmarks that record millions of values.
+
+`LatencyHistogram` keeps counts in log-linear buckets like an HDR histogram:
+every value is recorded in microseconds with its top `significant_bits` bits, so a percentile is off by less
+than one part in 2^(significant_bits - 1) (0.8% by default), however many values are recorded.
+
+    histogram = LatencyHistogram()
+    histogram.record(time.perf_counter() - start)
+    print(histogram.percentile(99) * 1000, "ms")
+
+`hgrm()` writes the percentile distribution in the format of HdrHistogram's `outputPercentileDistribution`,
+which the HdrHistogram plotter and other HDR tools read.
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, Tuple
+
+
+class LatencyHistogram:
+    def __init__(self, significant_bits: int = 8) -> None:
+        self.significant_bits = significant_bits
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.max = 0.0
+        # (shift, mantissa): count, where the bucket holds microseconds from mantissa << shift
+        self._counts: Dict[Tuple[int, int], int] = defaultdict(int)
+
+    def _bucket(self, seconds: float) -> Tuple[int, int]:
+        micros = max(0, int(seconds * 1_000_000))
+        shift = max(0, micros.bit_length() - self.significant_bits)
+        return shift, micros >> shift
+
+    def record(self, seconds: float) -> None:
+        self._counts[self._bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.total_squares += seconds * seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.significant_bits != self.significant_bits:
+            raise ValueError("Histograms with different precision cannot be merged")
+        for bucket, count in other._counts.items():
+            self._counts[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        if not self.count:
+            return 0.0
+        return math.sqrt(max(0.0, self.total_squares / self.count - self.mean**2))
+
+    def percentile(self, percent: float) -> float:
+        """The value in seconds that `percent` percent of the recorded values are at or below."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(percent / 100 * self.count))
+        seen = 0
+        # Buckets sort by value: a larger shift always holds larger values
+        for (shift, mantissa), count in sorted(self._counts.items()):
+            seen += count
+            if seen >= rank:
+                # The highest value of the bucket, but never above the largest recorded
+                upper = ((mantissa + 1) << shift) - 1
+                return min(upper / 1_000_000, self.max)
+        return self.max
+
+    def percentiles(
+        self, percents: Iterable[float] = (50, 90, 99, 99.9)
+    ) -> Dict[str, float]:
+        """Milliseconds at each of `percents`, keyed like "p99", plus the maximum."""
+        summary = {
+            f"p{percent:g}": self.percentile(percent) * 1000 for percent in percents
+        }
+        summary["max"] = self.max * 1000
+        return summary
+
+    def hgrm(self) -> str:
+        """The percentile distribution in milliseconds, one line per bucket."""
+        lines = [
+            f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>14}",
+            "",
+        ]
+        seen = 0
+        for (shift, mantissa), count in sorted(self._counts.items()):
+            seen += count
+            value = min((((mantissa + 1) << shift) - 1) / 1_000, self.max * 1000)
+            fraction = seen / self.count
+            inverse = f"{1 / (1 - fraction):14.2f}" if fraction < 1 else f"{'inf':>14}"
+            lines.append(f"{value:12.3f} {fraction:14.12f} {seen:10d} {inverse}")
+        lines.append(
+            f"#[Mean    = {self.mean * 1000:12.3f}, StdDeviation   = {self.stddev * 1000:12.3f}]"
+        )
+        lines.append(
+            f"#[Max     = {self.max * 1000:12.3f}, Total count    = {self.count:12d}]"
+        )
+        lines.append(
+            f"#[Buckets = {len(self._counts):12d}, SubBuckets     = {1 << self.significant_bits:12d}]"
+        )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,406 @@
+"""
+Drive sample Workflows at a target rate or concurrency and report their latency.
+
+    python -m shared.load_generator YourWorkflow --rate 50 --duration 60
+    python -m shared.load_generator BackgroundCheck --concurrency 20 --duration 60
+    python -m shared.load_generator MoneyTransferWorkflow --rate 20 --target localhost:7233
+
+- Open loop (`--rate`) starts Workflows on a fixed schedule, whether or not earlier ones have finished,
+  like independent users. Latency is measured from when each start was due, so a slow server is not hidden
+  by starting fewer Workflows (coordinated omission).
+- Closed loop (`--concurrency`) keeps a number of Workflows running, starting a new one when one completes,
+  like a fixed pool of callers. Throughput is then what the Workers sustain.
+
+Without `--target` a local dev server is started together with the sample's Workers from `shared.worker_host`.
+With `--target` the Workers must already be running, unless `--start-workers` is given.
+
+It reports throughput and percentiles of the start call, end-to-end Workflow latency, and the schedule-to-start
+latency of Workflow and Activity tasks, read from the History of a sample of the Workflows after the run.
+`--hgrm DIR` also writes each histogram as an HdrHistogram percentile distribution.
+The first `--warmup` seconds of load are not measured.
+A Workflow without a result after `--result-timeout` seconds is counted as timed out, and the run stops
+if the Worker process it started exits.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import signal
+import subprocess
+import sys
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from temporalio.api.enums.v1 import EventType
+from temporalio.client import Client, WorkflowFailureError, WorkflowHandle
+from temporalio.service import RPCError
+from temporalio.testing import WorkflowEnvironment
+
+from shared.client_pool import get_client
+from shared.latency import LatencyHistogram
+from shared.worker_host import ROOT
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    workflow: str
+    task_queue: str
+    # Group of shared.worker_host that runs the Workflow
+    group: str
+    argument: Callable[[int], Any]
+
+
+# Workflows are started by name, so their modules, which clash between samples, are never imported here
+SCENARIOS: Dict[str, Scenario] = {
+    "YourWorkflow": Scenario(
+        "YourWorkflow", "your-task-queue", "default", lambda i: f"load-{i}"
+    ),
+    "BackgroundCheck": Scenario(
+        "BackgroundCheck",
+        "backgroundcheck-boilerplate-task-queue",
+        "backgroundcheck",
+        lambda i: f"555-55-{i % 10000:04d}",
+    ),
+    "MoneyTransferWorkflow": Scenario(
+        "MoneyTransferWorkflow",
+        "money-transfer",
+        "money-transfer",
+        lambda i: {
+            "sender": "85-150",
+            "receiver": "43-812",
+            "amount": 250,
+            "reference_id": str(uuid.uuid4()),
+        },
+    ),
+}
+
+METRICS = [
+    "start",
+    "end_to_end",
+    "workflow_schedule_to_start",
+    "activity_schedule_to_start",
+]
+
+
+class LoadGenerator:
+    def __init__(
+        self,
+        client: Client,
+        scenario: Scenario,
+        warmup: float = 5.0,
+        history_sample: int = 500,
+        result_timeout: float = 60.0,
+    ) -> None:
+        self.client = client
+        self.scenario = scenario
+        self.warmup = warmup
+        self.history_sample = history_sample
+        self.result_timeout = result_timeout
+        self.histograms = {metric: LatencyHistogram() for metric in METRICS}
+        self.counts = {"completed": 0, "failed": 0, "timed_out": 0, "skipped": 0}
+        self._run_id = uuid.uuid4().hex[:8]
+        self._measured_from = 0.0
+        self._sampled: List[WorkflowHandle] = []
+
+    async def _execute(self, index: int, due: float) -> None:
+        loop = asyncio.get_running_loop()
+        measured = due >= self._measured_from
+        try:
+            called = loop.time()
+            handle = await self.client.start_workflow(
+                self.scenario.workflow,
+                self.scenario.argument(index),
+                id=f"load-{self.scenario.workflow}-{self._run_id}-{index}",
+                task_queue=self.scenario.task_queue,
+            )
+            started = loop.time()
+            # Without a timeout, a Workflow that no Worker runs would hold its caller forever
+            await asyncio.wait_for(handle.result(), self.result_timeout)
+        except (WorkflowFailureError, RPCError) as err:
+            if measured:
+                self.counts["failed"] += 1
+            logger.warning("Workflow %d failed: %s", index, err)
+            return
+        except asyncio.TimeoutError:
+            if measured:
+                self.counts["timed_out"] += 1
+            logger.warning(
+                "Workflow %d had no result after %.0fs", index, self.result_timeout
+            )
+            return
+        if not measured:
+            return
+        self.counts["completed"] += 1
+        self.histograms["start"].record(started - called)
+        self.histograms["end_to_end"].record(loop.time() - due)
+        # Reservoir sample of the measured Workflows, to read their Histories after the run
+        if len(self._sampled) < self.history_sample:
+            self._sampled.append(handle)
+        else:
+            slot = random.randrange(self.counts["completed"])
+            if slot < self.history_sample:
+                self._sampled[slot] = handle
+
+    async def open_loop(
+        self, rate: float, duration: float, max_in_flight: int = 10_000
+    ) -> float:
+        """Start `rate` Workflows a second for `duration` seconds, and return the measured seconds."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self._measured_from = start + self.warmup
+        end = self._measured_from + duration
+        in_flight: set = set()
+        index = 0
+        while True:
+            due = start + index / rate
+            if due >= end:
+                break
+            await asyncio.sleep(max(0.0, due - loop.time()))
+            if len(in_flight) >= max_in_flight:
+                # Count what could not be started rather than slowing the schedule down
+                if due >= self._measured_from:
+                    self.counts["skipped"] += 1
+            else:
+                task = asyncio.create_task(self._execute(index, due))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            index += 1
+        await asyncio.gather(*in_flight)
+        return duration
+
+    async def closed_loop(self, concurrency: int, duration: float) -> float:
+        """Keep `concurrency` Workflows running for `duration` seconds, and return the measured seconds."""
+        loop = asyncio.get_running_loop()
+        self._measured_from = loop.time() + self.warmup
+        end = self._measured_from + duration
+        counter = iter(range(sys.maxsize))
+
+        async def caller() -> None:
+            while loop.time() < end:
+                await self._execute(next(counter), loop.time())
+
+        await asyncio.gather(*(caller() for _ in range(concurrency)))
+        return duration
+
+    async def read_histories(self, concurrency: int = 20) -> None:
+        """Record the schedule-to-start latency of every task in the sampled Histories."""
+        limit = asyncio.Semaphore(concurrency)
+
+        async def read(handle: WorkflowHandle) -> None:
+            async with limit:
+                history = await handle.fetch_history()
+            scheduled: Dict[int, float] = {}
+            for event in history.events:
+                at = event.event_time.seconds + event.event_time.nanos / 1e9
+                if event.event_type in (
+                    EventType.EVENT_TYPE_WORKFLOW_TASK_SCHEDULED,
+                    EventType.EVENT_TYPE_ACTIVITY_TASK_SCHEDULED,
+                ):
+                    scheduled[event.event_id] = at
+                elif event.event_type == EventType.EVENT_TYPE_WORKFLOW_TASK_STARTED:
+                    scheduled_id = (
+                        event.workflow_task_started_event_attributes.scheduled_event_id
+                    )
+                    self.histograms["workflow_schedule_to_start"].record(
+                        at - scheduled[scheduled_id]
+                    )
+                elif event.event_type == EventType.EVENT_TYPE_ACTIVITY_TASK_STARTED:
+                    scheduled_id = (
+                        event.activity_task_started_event_attributes.scheduled_event_id
+                    )
+                    self.histograms["activity_schedule_to_start"].record(
+                        at - scheduled[scheduled_id]
+                    )
+
+        await asyncio.gather(*(read(handle) for handle in self._sampled))
+
+    def report(self, seconds: float) -> Dict[str, Any]:
+        return {
+            "workflow": self.scenario.workflow,
+            "seconds": seconds,
+            **self.counts,
+            "throughput": self.counts["completed"] / seconds if seconds else 0.0,
+            "latency_ms": {
+                metric: histogram.percentiles()
+                for metric, histogram in self.histograms.items()
+            },
+        }
+
+
+def start_workers(scenario: Scenario, target: str, namespace: str) -> subprocess.Popen:
+    """Run the scenario's Task Queue with shared.worker_host in a new process."""
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "shared.worker_host",
+            "--group",
+            scenario.group,
+            "--task-queues",
+            scenario.task_queue,
+            "--target",
+            target,
+            "--namespace",
+            namespace,
+        ],
+        cwd=ROOT,
+    )
+
+
+async def watch_workers(process: subprocess.Popen, interval: float = 1.0) -> None:
+    """Raise once the Worker process has exited."""
+    while process.poll() is None:
+        await asyncio.sleep(interval)
+    raise RuntimeError(f"Worker process exited with code {process.returncode}")
+
+
+async def run_with_workers(
+    load: Awaitable[T], workers: Optional[subprocess.Popen], interval: float = 1.0
+) -> T:
+    """Await `load`, cancelling it and raising if the Worker process exits first."""
+    task = asyncio.ensure_future(load)
+    if workers is None:
+        return await task
+    watcher = asyncio.create_task(watch_workers(workers, interval))
+    await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    if task.done():
+        watcher.cancel()
+        return task.result()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    return watcher.result()
+
+
+def stop_workers(process: subprocess.Popen, timeout: float = 30.0) -> None:
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{report['workflow']}: {report['completed']} completed, {report['failed']} failed, "
+        f"{report['timed_out']} timed out, {report['skipped']} skipped in {report['seconds']:.0f}s, "
+        f"{report['throughput']:.1f} Workflows/s"
+    )
+    print(f"{'ms':<28}{'p50':>10}{'p90':>10}{'p99':>10}{'p99.9':>10}{'max':>10}")
+    for metric, summary in report["latency_ms"].items():
+        print(
+            f"{metric:<28}"
+            + "".join(
+                f"{summary[key]:>10.1f}"
+                for key in ("p50", "p90", "p99", "p99.9", "max")
+            )
+        )
+
+
+def write_outputs(
+    report: Dict[str, Any],
+    histograms: Dict[str, LatencyHistogram],
+    json_path: Optional[str],
+    hgrm_dir: Optional[str],
+) -> None:
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(report, f, indent=2)
+    if hgrm_dir:
+        os.makedirs(hgrm_dir, exist_ok=True)
+        for metric, histogram in histograms.items():
+            with open(os.path.join(hgrm_dir, f"{metric}.hgrm"), "w") as f:
+                f.write(histogram.hgrm())
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Drive a sample Workflow at a target rate or concurrency"
+    )
+    parser.add_argument("workflow", choices=sorted(SCENARIOS))
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument(
+        "--rate", type=float, help="Open loop: Workflows started a second"
+    )
+    mode.add_argument(
+        "--concurrency", type=int, help="Closed loop: Workflows running at once"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60.0, help="Seconds of measured load"
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=5.0, help="Seconds of load before measuring"
+    )
+    parser.add_argument(
+        "--target",
+        help="Temporal Server to use. By default a local dev server is started.",
+    )
+    parser.add_argument("--namespace", default="default")
+    parser.add_argument(
+        "--start-workers",
+        action="store_true",
+        help="Start the Workers with --target too",
+    )
+    parser.add_argument(
+        "--history-sample",
+        type=int,
+        default=500,
+        help="Workflows whose History is read for schedule-to-start latency",
+    )
+    parser.add_argument(
+        "--result-timeout",
+        type=float,
+        default=60.0,
+        help="Seconds to wait for each Workflow result before counting it as timed out",
+    )
+    parser.add_argument("--json", help="Write the report to this file")
+    parser.add_argument("--hgrm", help="Write each histogram as DIR/<metric>.hgrm")
+    args = parser.parse_args()
+    scenario = SCENARIOS[args.workflow]
+
+    if args.target:
+        env = WorkflowEnvironment.from_client(
+            await get_client(args.target, args.namespace)
+        )
+    else:
+        env = await WorkflowEnvironment.start_local(namespace=args.namespace)
+    target = env.client.service_client.config.target_host
+    workers = (
+        start_workers(scenario, target, args.namespace)
+        if args.start_workers or not args.target
+        else None
+    )
+    try:
+        generator = LoadGenerator(
+            env.client,
+            scenario,
+            args.warmup,
+            args.history_sample,
+            args.result_timeout,
+        )
+        if args.rate:
+            load = generator.open_loop(args.rate, args.duration)
+        else:
+            load = generator.closed_loop(args.concurrency, args.duration)
+        seconds = await run_with_workers(load, workers)
+        await generator.read_histories()
+    finally:
+        if workers:
+            stop_workers(workers)
+        await env.shutdown()
+
+    report = generator.report(seconds)
+    print_report(report)
+    write_outputs(report, generator.histograms, args.json, args.hgrm)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+"""
+Opt-in Prometheus metrics for the sample Workers.
+
+Set `TEMPORAL_METRICS_ADDRESS` to a `host:port` and every sample Worker serves its metrics at `http://host:port/metrics`:
+
+    TEMPORAL_METRICS_ADDRESS=127.0.0.1:9464 python run_worker_dacx.py
+
+The SDK's own metrics include Workflow and Activity task schedule-to-start latency, poll counts,
+available slots and sticky cache size, labelled by namespace and Task Queue.
+`worker_options()` also adds `LatencyInterceptor`, which records how long each Activity and Workflow run took,
+labelled by Activity or Workflow type and outcome.
+
+`install_metrics()` must run before the first Client connects, because the Client and its Workers
+use the runtime that is the default when the Client is created.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, List, Mapping, Optional, Type
+
+from temporalio import activity, workflow
+from temporalio.exceptions import FailureError
+from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
+from temporalio.worker import (
+    ActivityInboundInterceptor,
+    ExecuteActivityInput,
+    ExecuteWorkflowInput,
+    Interceptor,
+    WorkflowInboundInterceptor,
+    WorkflowInterceptorClassInput,
+)
+
+logger = logging.getLogger(__name__)
+
+ADDRESS_ENV = "TEMPORAL_METRICS_ADDRESS"
+
+ACTIVITY_DURATION = "activity_duration"
+WORKFLOW_DURATION = "workflow_duration"
+
+
+def metrics_address(environ: Optional[Mapping[str, str]] = None) -> Optional[str]:
+    if environ is None:
+        environ = os.environ
+    return environ.get(ADDRESS_ENV) or None
+
+
+def install_metrics(
+    environ: Optional[Mapping[str, str]] = None, port_offset: int = 0
+) -> Optional[str]:
+    """Serve Prometheus metrics on `TEMPORAL_METRICS_ADDRESS`, if set, and return the address used.
+
+    Processes that share the variable, such as those of a supervisor, pass a different `port_offset` each.
+    """
+    address = metrics_address(environ)
+    if address is None:
+        return None
+    host, _, port = address.rpartition(":")
+    address = f"{host}:{int(port) + port_offset}"
+    Runtime.set_default(
+        Runtime(
+            telemetry=TelemetryConfig(metrics=PrometheusConfig(bind_address=address))
+        )
+    )
+    logger.info("Serving metrics on http://%s/metrics", address)
+    return address
+
+
+class LatencyInterceptor(Interceptor):
+    """Record the duration of every Activity attempt and Workflow run as a histogram."""
+
+    def intercept_activity(
+        self, next: ActivityInboundInterceptor
+    ) -> ActivityInboundInterceptor:
+        return _ActivityLatencyInterceptor(next)
+
+    def workflow_interceptor_class(
+        self, input: WorkflowInterceptorClassInput
+    ) -> Optional[Type[WorkflowInboundInterceptor]]:
+        return _WorkflowLatencyInterceptor
+
+
+def metrics_interceptors(
+    environ: Optional[Mapping[str, str]] = None,
+) -> List[Interceptor]:
+    """The Worker interceptors to use when metrics are enabled."""
+    if metrics_address(environ) is None:
+        return []
+    if not hasattr(activity, "metric_meter"):
+        logger.warning(
+            "Activity and Workflow durations require temporalio 1.5 or later"
+        )
+        return []
+    return [LatencyInterceptor()]
+
+
+class _ActivityLatencyInterceptor(ActivityInboundInterceptor):
+    async def execute_activity(self, input: ExecuteActivityInput) -> Any:
+        start = time.monotonic()
+        outcome = "failed"
+        try:
+            result = await super().execute_activity(input)
+            outcome = "completed"
+            return result
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            try:
+                # Labelled with the namespace, Task Queue and Activity type
+                meter = activity.metric_meter()
+            except RuntimeError:
+                # Sync Activities run in a process pool have no meter
+                meter = None
+            if meter is not None:
+                meter.create_histogram(
+                    ACTIVITY_DURATION, "Duration of Activity attempts", "ms"
+                ).record(
+                    int((time.monotonic() - start) * 1000),
+                    {"outcome": outcome},
+                )
+
+
+class _WorkflowLatencyInterceptor(WorkflowInboundInterceptor):
+    async def execute_workflow(self, input: ExecuteWorkflowInput) -> Any:
+        try:
+            result = await super().execute_workflow(input)
+        except workflow.ContinueAsNewError:
+            self._record("continued_as_new")
+            raise
+        except FailureError:
+            self._record("failed")
+            raise
+        self._record("completed")
+        return result
+
+    def _record(self, outcome: str) -> None:
+        # Workflow time is deterministic, and the meter does not record while replaying
+        workflow.metric_meter().create_histogram(
+            WORKFLOW_DURATION, "Duration of Workflow runs", "ms"
+        ).record(
+            int((workflow.now() - workflow.info().start_time).total_seconds() * 1000),
+            {"outcome": outcome},
+        )
@@ -0,0 +1,94 @@
+"""
+Await the results of many Workflows at once, in the order they complete.
+
+`await handle.result()` for one Workflow Id after another takes as long as all of the waits added together.
+`gather_results()` keeps up to `concurrency` of them waiting at once and yields each result as soon as it
+is available, so a slow or still-running Workflow does not hold up the ones after it:
+
+    async for result in gather_results(client, workflow_ids, concurrency=500, timeout=30):
+        print(result.workflow_id, result.status, result.result)
+
+A Workflow that fails, is not found, or does not complete within `timeout` seconds is yielded with its
+status and error rather than raising, so one bad Id does not stop the rest.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Optional, Set, Union
+
+from temporalio.client import Client, WorkflowFailureError
+from temporalio.service import RPCError
+
+
+@dataclass(frozen=True)
+class WorkflowResult:
+    workflow_id: str
+    # "completed", "failed", "timed_out" or "error"
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    # Seconds from when the result was first awaited
+    seconds: float = 0.0
+
+
+async def _result(
+    client: Client, workflow_id: str, timeout: Optional[float]
+) -> WorkflowResult:
+    start = time.perf_counter()
+
+    def finished(status: str, **kwargs: Any) -> WorkflowResult:
+        return WorkflowResult(
+            workflow_id, status, seconds=time.perf_counter() - start, **kwargs
+        )
+
+    handle = client.get_workflow_handle(workflow_id)
+    try:
+        result = await asyncio.wait_for(handle.result(), timeout)
+    except asyncio.TimeoutError:
+        return finished("timed_out", error=f"No result within {timeout}s")
+    except WorkflowFailureError as err:
+        return finished("failed", error=str(err.cause or err))
+    except RPCError as err:
+        return finished("error", error=str(err))
+    return finished("completed", result=result)
+
+
+async def _ids(
+    workflow_ids: Union[Iterable[str], AsyncIterable[str]],
+) -> AsyncIterator[str]:
+    if isinstance(workflow_ids, AsyncIterable):
+        async for workflow_id in workflow_ids:
+            yield workflow_id
+    else:
+        for workflow_id in workflow_ids:
+            yield workflow_id
+
+
+async def gather_results(
+    client: Client,
+    workflow_ids: Union[Iterable[str], AsyncIterable[str]],
+    concurrency: int = 100,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[WorkflowResult]:
+    """Yield the result of each Workflow in `workflow_ids` as it completes, awaiting `concurrency` at once."""
+    in_flight: Set["asyncio.Task[WorkflowResult]"] = set()
+    try:
+        async for workflow_id in _ids(workflow_ids):
+            while len(in_flight) >= concurrency:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+            in_flight.add(asyncio.create_task(_result(client, workflow_id, timeout)))
+        while in_flight:
+            done, in_flight = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        # Stop waiting when the caller stops reading
+        for task in in_flight:
+            task.cancel()
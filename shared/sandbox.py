@@ -0,0 +1,57 @@
+"""
+Workflow sandbox configuration shared by every sample Worker and Replayer.
+
+The sandbox imports a Workflow's module again for every Workflow run, together with every module it imports
+that is not passed through from the host. The default restrictions pass through the standard library and `temporalio`.
+`SANDBOX_RESTRICTIONS` also passes through the samples' dataclass and Activity modules and protobuf,
+which are deterministic and have no side effects on import, so each run only re-imports the Workflow module itself.
+
+    worker = Worker(client, ..., workflow_runner=sandbox_runner())
+    replayer = Replayer(workflows=[...], workflow_runner=sandbox_runner())
+
+Passed through modules are shared by all Workflow runs in the process, so never pass through a module with
+state that Workflows change.
+"""
+
+import importlib
+
+from temporalio.worker.workflow_sandbox import (
+    SandboxedWorkflowRunner,
+    SandboxRestrictions,
+)
+
+PASSTHROUGH_MODULES = (
+    # Dataclasses used as Workflow and Activity inputs and results
+    "dataobject",
+    "your_dataobject",
+    "your_dataobject_dacx",
+    "data_obj",
+    # Activity definitions, which Workflows reference but never call
+    "activities",
+    "your_activities",
+    "your_activities_dacx",
+    "ssntraceactivity",
+    # Protobuf message classes, slow to import and only built at import time.
+    # Newer SDKs pass this through by default.
+    "google.protobuf",
+)
+
+SANDBOX_RESTRICTIONS = SandboxRestrictions.default.with_passthrough_modules(
+    *PASSTHROUGH_MODULES
+)
+
+
+def sandbox_runner(
+    *modules: str, restrictions: SandboxRestrictions = SANDBOX_RESTRICTIONS
+) -> SandboxedWorkflowRunner:
+    """A sandboxed runner with `restrictions` that also passes through `modules`.
+
+    `modules` are imported now, so passing them through is a `sys.modules` lookup on the first Workflow task.
+    """
+    for module in modules:
+        importlib.import_module(module)
+    return SandboxedWorkflowRunner(
+        restrictions=restrictions.with_passthrough_modules(*modules)
+        if modules
+        else restrictions
+    )
@@ -0,0 +1,86 @@
+"""
+Run Workers until the process is asked to stop, then drain them.
+
+On SIGINT or SIGTERM each Worker stops polling for new tasks and waits for the tasks it already has to finish.
+Supervisors and container runtimes send SIGTERM before they kill a process,
+so in-flight Workflow and Activity tasks are completed instead of timing out on the server.
+
+Activities still running after the Worker's `graceful_shutdown_timeout` are cancelled.
+`drain_timeout` bounds the whole drain, in case an Activity ignores cancellation.
+Give Workers a `graceful_shutdown_timeout` a little below it with `set_graceful_shutdown()`,
+so Activities are drained and then cancelled in time to report it before the drain gives up:
+
+    options = worker_options()
+    set_graceful_shutdown(options, drain_timeout)
+"""
+
+import asyncio
+import logging
+import signal
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from temporalio.worker import Worker
+
+logger = logging.getLogger(__name__)
+
+STOP_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+# Part of the drain timeout that Activities may keep running before they are cancelled
+GRACEFUL_SHUTDOWN_SHARE = 0.8
+
+
+def set_graceful_shutdown(options: Dict[str, Any], drain_timeout: float) -> None:
+    """Let in-flight Activities run for most of `drain_timeout`, unless the Worker options already set a time."""
+    options.setdefault(
+        "graceful_shutdown_timeout",
+        timedelta(seconds=drain_timeout * GRACEFUL_SHUTDOWN_SHARE),
+    )
+
+
+async def run_until_signalled(
+    *workers: Worker, drain_timeout: Optional[float] = None
+) -> None:
+    """Run `workers` until SIGINT or SIGTERM, or until one of them fails, then drain the rest."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in STOP_SIGNALS:
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Windows event loops have no signal handlers, Ctrl+C still raises KeyboardInterrupt
+            pass
+    runs = [asyncio.create_task(worker.run()) for worker in workers]
+    stopped = asyncio.create_task(stop.wait())
+    try:
+        await asyncio.wait([*runs, stopped], return_when=asyncio.FIRST_COMPLETED)
+        failed = [run for run in runs if run.done()]
+        running = [worker for worker, run in zip(workers, runs) if not run.done()]
+        if running:
+            if failed:
+                logger.warning("A Worker stopped, draining the others")
+            else:
+                logger.info("Stop requested, draining in-flight tasks")
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(worker.shutdown() for worker in running)),
+                    drain_timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Tasks still running after %ss, exiting anyway", drain_timeout
+                )
+        for run in failed:
+            # The Worker failed on its own, so report why
+            run.result()
+        logger.info("Worker stopped")
+    finally:
+        stopped.cancel()
+        for run in runs:
+            if not run.done():
+                run.cancel()
+        for sig in STOP_SIGNALS:
+            try:
+                loop.remove_signal_handler(sig)
+            except NotImplementedError:
+                pass
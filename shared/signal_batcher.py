@@ -0,0 +1,98 @@
+"""
+Coalesce many small Signals to one Workflow into fewer Signals that each carry a list.
+
+Every Signal adds an event to the Workflow's History and usually a Workflow Task, so a producer that Signals
+thousands of times a second makes the Workflow do thousands of Workflow Tasks a second.
+`SignalBatcher` buffers the items for up to `max_delay` seconds or `max_items` items, whichever comes first,
+and sends them with one Signal whose handler takes a list:
+
+    async with SignalBatcher(handle, GreetingWorkflow.submit_greetings) as batcher:
+        for name in names:
+            await batcher.add(name)
+
+Batches are sent one at a time in the order the items were added, so the Workflow sees the items in order.
+`add()` waits while a full batch is being sent, which holds back producers that outrun the server.
+An error sending a batch is raised from the next `add()` or `flush()`.
+The batch that failed is put back at the front of the buffer, so nothing is lost and a later `flush()` sends it again in order.
+"""
+
+import asyncio
+from typing import Any, Generic, List, Optional, TypeVar
+
+from temporalio.client import WorkflowHandle
+
+T = TypeVar("T")
+
+
+class SignalBatcher(Generic[T]):
+    def __init__(
+        self,
+        handle: WorkflowHandle,
+        signal: Any,
+        max_items: int = 100,
+        max_delay: float = 0.005,
+    ) -> None:
+        self.handle = handle
+        self.signal = signal
+        self.max_items = max_items
+        self.max_delay = max_delay
+        self.signals_sent = 0
+        self._items: List[T] = []
+        self._sending = asyncio.Lock()
+        self._timer: Optional["asyncio.Task[None]"] = None
+        self._error: Optional[BaseException] = None
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    async def _send_batch(self) -> None:
+        # Taking the batch under the lock keeps batches in the order their items were added
+        async with self._sending:
+            if not self._items:
+                return
+            batch = self._items[: self.max_items]
+            del self._items[: self.max_items]
+            try:
+                await self.handle.signal(self.signal, batch)
+            except BaseException:
+                # Ahead of the items added while it was being sent
+                self._items[:0] = batch
+                raise
+            self.signals_sent += 1
+
+    async def _send_after_delay(self) -> None:
+        await asyncio.sleep(self.max_delay)
+        self._timer = None
+        try:
+            while self._items:
+                await self._send_batch()
+        except Exception as err:
+            self._error = err
+
+    async def add(self, item: T) -> None:
+        self._raise_error()
+        self._items.append(item)
+        if len(self._items) >= self.max_items:
+            await self._send_batch()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._send_after_delay())
+
+    async def flush(self) -> None:
+        """Send every buffered item now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._items:
+            await self._send_batch()
+        # Wait for a batch the timer is still sending
+        async with self._sending:
+            pass
+        self._raise_error()
+
+    async def __aenter__(self) -> "SignalBatcher[T]":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.flush()
@@ -0,0 +1,175 @@
+"""
+Run one Worker per core for the same Task Queue and keep them running.
+
+A Python Worker processes Workflow tasks on one core because of the GIL.
+`Supervisor` starts a number of Worker processes, restarts any that exit, and reports their health.
+On SIGTERM or SIGINT it sends SIGTERM to every Worker process, so each drains its in-flight tasks,
+and kills the ones still running after `drain_timeout` seconds.
+
+Worker processes are started with the spawn method, so `target` must be a module-level function.
+"""
+
+import json
+import logging
+import multiprocessing
+import multiprocessing.connection
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Slot:
+    index: int
+    process: Optional[multiprocessing.process.BaseProcess] = None
+    started_at: float = 0.0
+    restarts: int = 0
+    last_exit_code: Optional[int] = None
+    backoff: float = 0.0
+    restart_at: float = 0.0
+
+
+class Supervisor:
+    def __init__(
+        self,
+        target: Callable[[], None],
+        processes: int,
+        *,
+        drain_timeout: float = 30.0,
+        restart_backoff: float = 1.0,
+        max_restart_backoff: float = 60.0,
+        min_uptime: float = 10.0,
+    ) -> None:
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+        self.target = target
+        self.drain_timeout = drain_timeout
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        # A process that exits sooner than this after starting doubles its restart backoff
+        self.min_uptime = min_uptime
+        self._context = multiprocessing.get_context("spawn")
+        self._slots = [_Slot(i) for i in range(processes)]
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    def stop(self, *_: Any) -> None:
+        self._stopping.set()
+
+    def _start(self, slot: _Slot) -> None:
+        process = self._context.Process(
+            target=self.target, name=f"worker-{slot.index}", daemon=False
+        )
+        process.start()
+        slot.process = process
+        slot.started_at = time.monotonic()
+        logger.info("Started worker %d as pid %d", slot.index, process.pid)
+
+    def _reap(self, slot: _Slot, now: float) -> None:
+        process = slot.process
+        if process is None or process.is_alive():
+            return
+        slot.last_exit_code = process.exitcode
+        slot.process = None
+        if now - slot.started_at < self.min_uptime:
+            slot.backoff = min(
+                max(slot.backoff * 2, self.restart_backoff), self.max_restart_backoff
+            )
+        else:
+            slot.backoff = self.restart_backoff
+        slot.restart_at = now + slot.backoff
+        logger.warning(
+            "Worker %d (pid %d) exited with code %s, restarting in %.1fs",
+            slot.index,
+            process.pid,
+            process.exitcode,
+            slot.backoff,
+        )
+
+    def run(self, install_signal_handlers: bool = True) -> None:
+        """Supervise the Worker processes until `stop()` is called or a stop signal arrives."""
+        if install_signal_handlers:
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+        with self._lock:
+            for slot in self._slots:
+                self._start(slot)
+        while not self._stopping.is_set():
+            sentinels = [s.process.sentinel for s in self._slots if s.process]
+            multiprocessing.connection.wait(sentinels, timeout=0.5)
+            now = time.monotonic()
+            with self._lock:
+                for slot in self._slots:
+                    self._reap(slot, now)
+                    if (
+                        slot.process is None
+                        and now >= slot.restart_at
+                        and not self._stopping.is_set()
+                    ):
+                        slot.restarts += 1
+                        self._start(slot)
+        self._drain()
+
+    def _drain(self) -> None:
+        with self._lock:
+            running = [s.process for s in self._slots if s.process]
+        logger.info("Draining %d workers", len(running))
+        for process in running:
+            process.terminate()
+        deadline = time.monotonic() + self.drain_timeout
+        for process in running:
+            process.join(max(0.0, deadline - time.monotonic()))
+        for process in running:
+            if process.is_alive():
+                logger.warning("Killing worker pid %d after drain timeout", process.pid)
+                process.kill()
+                process.join()
+
+    def health(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            workers = [
+                {
+                    "index": slot.index,
+                    "pid": slot.process.pid if slot.process else None,
+                    "alive": bool(slot.process and slot.process.is_alive()),
+                    "uptime_seconds": now - slot.started_at if slot.process else 0.0,
+                    "restarts": slot.restarts,
+                    "last_exit_code": slot.last_exit_code,
+                }
+                for slot in self._slots
+            ]
+        alive = sum(1 for w in workers if w["alive"])
+        return {
+            "status": "ok" if alive == len(workers) else "degraded",
+            "processes": len(workers),
+            "alive": alive,
+            "restarts": sum(w["restarts"] for w in workers),
+            "workers": workers,
+        }
+
+
+def serve_health(supervisor: Supervisor, port: int) -> ThreadingHTTPServer:
+    """Serve `supervisor.health()` as JSON on any path, with status 503 unless every Worker is alive."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            health = supervisor.health()
+            body = json.dumps(health).encode()
+            self.send_response(200 if health["status"] == "ok" else 503)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
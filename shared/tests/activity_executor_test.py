@@ -0,0 +1,42 @@
+import concurrent.futures
+
+import pytest
+from temporalio.testing import ActivityEnvironment
+
+from shared.activity_executor import activity_executor
+from shared.cpu_work import hash_rounds
+
+
+def test_hash_rounds_heartbeats_in_activity():
+    heartbeats = []
+    env = ActivityEnvironment()
+    env.on_heartbeat = lambda *details: heartbeats.append(details[0])
+    result = env.run(hash_rounds, "ssn", 25, 10)
+    assert result == hash_rounds("ssn", 25)
+    assert heartbeats == [0, 10, 20]
+
+
+def test_thread_executor_sizes_activity_slots():
+    with activity_executor("thread", 4) as options:
+        assert isinstance(
+            options["activity_executor"], concurrent.futures.ThreadPoolExecutor
+        )
+        assert options["max_concurrent_activities"] == 4
+        assert "shared_state_manager" not in options
+
+
+def test_process_executor_runs_work_in_other_processes():
+    with activity_executor(
+        "process", options={"max_concurrent_activities": 2}
+    ) as options:
+        # Slots set by the profile are left to the profile
+        assert "max_concurrent_activities" not in options
+        assert options["shared_state_manager"] is not None
+        future = options["activity_executor"].submit(hash_rounds, "ssn", 100)
+        assert future.result() == hash_rounds("ssn", 100)
+
+
+def test_unknown_executor_is_rejected():
+    with pytest.raises(ValueError, match="fibers"):
+        with activity_executor("fibers"):
+            pass
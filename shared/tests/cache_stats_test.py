@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+import pytest
+
+from shared.cache_stats import CacheStats, cache_stats_from_env
+
+
+def _update(name, value):
+    return SimpleNamespace(metric=SimpleNamespace(name=name), value=value)
+
+
+def test_record_counts_sticky_cache_metrics():
+    stats = CacheStats()
+    stats.record(
+        [
+            _update("temporal_sticky_cache_hit", 3),
+            _update("temporal_sticky_cache_miss", 1),
+            _update("sticky_cache_hit", 5),
+            _update("temporal_sticky_cache_total_forced_eviction", 2),
+            _update("temporal_sticky_cache_size", 7),
+            _update("temporal_sticky_cache_size", 6),
+            _update("temporal_workflow_completed", 1),
+        ]
+    )
+    assert stats.snapshot() == {
+        "hits": 8,
+        "misses": 1,
+        "evictions": 2,
+        "size": 6,
+        "hit_ratio": 0.8889,
+    }
+
+
+def test_reset_keeps_cache_size():
+    stats = CacheStats()
+    stats.record([_update("sticky_cache_miss", 4), _update("sticky_cache_size", 3)])
+    stats.reset()
+    assert stats.snapshot()["misses"] == 0
+    assert stats.size == 3
+    assert stats.hit_ratio == 1.0
+
+
+def test_from_env_is_opt_in():
+    assert cache_stats_from_env({}) is None
+    stats = cache_stats_from_env({"TEMPORAL_CACHE_STATS_INTERVAL": "15"})
+    assert stats is not None
+    assert stats.interval == 15
+
+
+def test_from_env_rejects_prometheus_metrics():
+    environ = {
+        "TEMPORAL_CACHE_STATS_INTERVAL": "15",
+        "TEMPORAL_METRICS_ADDRESS": "127.0.0.1:9464",
+    }
+    with pytest.raises(ValueError, match="cannot both be set"):
+        cache_stats_from_env(environ)
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from shared.client_pool import ClientPool, TLSFiles
+
+
+class _CountingPool(ClientPool):
+    def __init__(self, fail: int = 0) -> None:
+        super().__init__()
+        self.connects = []
+        self.fail = fail
+
+    async def _connect(self, target, namespace, tls):
+        self.connects.append((target, namespace, tls.load() if tls else None))
+        await asyncio.sleep(0.01)
+        if self.fail:
+            self.fail -= 1
+            raise RuntimeError("connection refused")
+        return object()
+
+
+@pytest.fixture
+def tls_files(tmp_path):
+    cert, key = tmp_path / "client.pem", tmp_path / "client.key"
+    cert.write_bytes(b"cert-1")
+    key.write_bytes(b"key-1")
+    return TLSFiles(str(cert), str(key))
+
+
+@pytest.mark.asyncio
+async def test_clients_are_reused_per_target_and_namespace():
+    pool = _CountingPool()
+    clients = await asyncio.gather(*(pool.get("localhost:7233") for _ in range(10)))
+    assert len({id(client) for client in clients}) == 1
+    assert await pool.get("localhost:7233") is clients[0]
+    assert await pool.get("localhost:7233", "other") is not clients[0]
+    assert len(pool.connects) == 2
+
+
+@pytest.mark.asyncio
+async def test_rotated_certificate_connects_again(tls_files):
+    pool = _CountingPool()
+    first = await pool.get("cloud:7233", "ns", tls_files)
+    assert await pool.get("cloud:7233", "ns", tls_files) is first
+
+    with open(tls_files.client_cert, "wb") as f:
+        f.write(b"cert-2, longer")
+    rotated = await pool.get("cloud:7233", "ns", tls_files)
+    assert rotated is not first
+    assert [tls.client_cert for _, _, tls in pool.connects] == [
+        b"cert-1",
+        b"cert-2, longer",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_connection_is_retried():
+    pool = _CountingPool(fail=1)
+    with pytest.raises(RuntimeError):
+        await pool.get("localhost:7233")
+    assert await pool.get("localhost:7233") is not None
+    assert len(pool.connects) == 2
+
+
+def test_missing_certificate_fails(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        TLSFiles(str(tmp_path / "missing.pem"), str(tmp_path / "missing.key")).version()
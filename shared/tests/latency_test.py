@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from shared.latency import LatencyHistogram
+
+
+def test_percentiles_are_within_precision():
+    values = [random.uniform(0.0005, 2.0) for _ in range(20_000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    values.sort()
+    for percent in (50, 90, 99, 99.9):
+        exact = values[max(0, round(percent / 100 * len(values)) - 1)]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=1 / 128)
+    assert histogram.percentile(100) == values[-1]
+    assert histogram.count == len(values)
+    assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for micros in (1, 2, 3, 4):
+        histogram.record(micros / 1_000_000)
+    assert histogram.percentile(50) == pytest.approx(2 / 1_000_000)
+    assert histogram.percentile(0) == pytest.approx(1 / 1_000_000)
+
+
+def test_merge_and_summary():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(0.010)
+    second.record(0.030)
+    first.merge(second)
+    summary = first.percentiles([50])
+    assert summary["p50"] == pytest.approx(10, rel=1 / 128)
+    assert summary["max"] == pytest.approx(30)
+    assert LatencyHistogram().percentiles() == {
+        "p50": 0.0,
+        "p90": 0.0,
+        "p99": 0.0,
+        "p99.9": 0.0,
+        "max": 0.0,
+    }
+    with pytest.raises(ValueError):
+        first.merge(LatencyHistogram(significant_bits=4))
+
+
+def test_hgrm_ends_at_max():
+    histogram = LatencyHistogram()
+    for millis in (1, 2, 4, 8):
+        histogram.record(millis / 1000)
+    lines = histogram.hgrm().splitlines()
+    assert lines[0].split() == ["Value", "Percentile", "TotalCount", "1/(1-Percentile)"]
+    assert lines[-4].split()[:3] == ["8.000", "1.000000000000", "4"]
+    assert lines[-2].startswith(
+        "#[Max     =        8.000, Total count    =            4]"
+    )
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+from temporalio.api.enums.v1 import EventType
+from temporalio.api.history.v1 import History, HistoryEvent
+
+from shared.load_generator import SCENARIOS, LoadGenerator, run_with_workers
+
+
+def _event(event_id, event_type, seconds, scheduled_event_id=0):
+    event = HistoryEvent(event_id=event_id, event_type=event_type)
+    event.event_time.FromNanoseconds(int(seconds * 1e9))
+    if event_type == EventType.EVENT_TYPE_WORKFLOW_TASK_STARTED:
+        event.workflow_task_started_event_attributes.scheduled_event_id = (
+            scheduled_event_id
+        )
+    elif event_type == EventType.EVENT_TYPE_ACTIVITY_TASK_STARTED:
+        event.activity_task_started_event_attributes.scheduled_event_id = (
+            scheduled_event_id
+        )
+    return event
+
+
+class _FakeHandle:
+    def __init__(self, seconds=0.02):
+        self.seconds = seconds
+
+    async def result(self):
+        await asyncio.sleep(self.seconds)
+
+    async def fetch_history(self):
+        return History(
+            events=[
+                _event(2, EventType.EVENT_TYPE_WORKFLOW_TASK_SCHEDULED, 100.0),
+                _event(3, EventType.EVENT_TYPE_WORKFLOW_TASK_STARTED, 100.010, 2),
+                _event(5, EventType.EVENT_TYPE_ACTIVITY_TASK_SCHEDULED, 100.020),
+                _event(6, EventType.EVENT_TYPE_ACTIVITY_TASK_STARTED, 100.050, 5),
+            ]
+        )
+
+
+class _FakeClient:
+    def __init__(self, seconds=0.02):
+        self.seconds = seconds
+        self.running = 0
+        self.peak = 0
+        self.started = 0
+
+    async def start_workflow(self, workflow, argument, id, task_queue):
+        self.started += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        handle = _FakeHandle(self.seconds)
+        original = handle.result
+
+        async def result():
+            try:
+                await original()
+            finally:
+                self.running -= 1
+
+        handle.result = result
+        return handle
+
+
+@pytest.mark.asyncio
+async def test_open_loop_keeps_the_schedule():
+    client = _FakeClient()
+    generator = LoadGenerator(client, SCENARIOS["YourWorkflow"], warmup=0.1)
+    await generator.open_loop(rate=200, duration=0.5)
+    # 0.6s at 200/s, of which the last 0.5s are measured
+    assert client.started == pytest.approx(120, abs=2)
+    assert generator.counts["completed"] == pytest.approx(100, abs=2)
+    assert generator.histograms["end_to_end"].percentile(50) >= 0.02
+
+
+@pytest.mark.asyncio
+async def test_closed_loop_bounds_concurrency_and_reads_histories():
+    client = _FakeClient()
+    generator = LoadGenerator(
+        client, SCENARIOS["MoneyTransferWorkflow"], warmup=0, history_sample=5
+    )
+    await generator.closed_loop(concurrency=4, duration=0.3)
+    assert client.peak == 4
+    assert generator.counts["completed"] >= 40
+    assert len(generator._sampled) == 5
+
+    await generator.read_histories()
+    workflow_tasks = generator.histograms["workflow_schedule_to_start"]
+    assert workflow_tasks.count == 5
+    assert workflow_tasks.percentile(50) == pytest.approx(0.010, rel=0.01)
+    assert generator.histograms["activity_schedule_to_start"].percentile(
+        50
+    ) == pytest.approx(0.030, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_results_time_out():
+    client = _FakeClient(seconds=10)
+    generator = LoadGenerator(
+        client, SCENARIOS["YourWorkflow"], warmup=0, result_timeout=0.05
+    )
+    await generator.closed_loop(concurrency=2, duration=0.12)
+    assert generator.counts["completed"] == 0
+    assert generator.counts["timed_out"] >= 4
+    assert client.running == 0
+
+
+class _ExitingProcess:
+    def __init__(self, polls):
+        self.polls = polls
+        self.returncode = None
+
+    def poll(self):
+        self.polls -= 1
+        if self.polls <= 0:
+            self.returncode = 1
+        return self.returncode
+
+
+@pytest.mark.asyncio
+async def test_run_stops_when_workers_exit():
+    client = _FakeClient(seconds=10)
+    generator = LoadGenerator(client, SCENARIOS["YourWorkflow"])
+    load = generator.closed_loop(concurrency=2, duration=60)
+    with pytest.raises(RuntimeError, match="Worker process exited with code 1"):
+        await asyncio.wait_for(
+            run_with_workers(load, _ExitingProcess(polls=3), interval=0.01), 5
+        )
+    assert client.running == 0
@@ -0,0 +1,32 @@
+from temporalio.runtime import Runtime
+
+from shared.metrics import (
+    LatencyInterceptor,
+    install_metrics,
+    metrics_address,
+    metrics_interceptors,
+)
+from shared.worker_profile import worker_options
+
+ENV = {"TEMPORAL_METRICS_ADDRESS": "127.0.0.1:9464"}
+
+
+def test_metrics_are_off_by_default():
+    assert metrics_address({}) is None
+    assert metrics_address({"TEMPORAL_METRICS_ADDRESS": ""}) is None
+    assert install_metrics({}) is None
+    assert metrics_interceptors({}) == []
+    assert "interceptors" not in worker_options(environ={})
+
+
+def test_install_metrics_offsets_port(monkeypatch):
+    installed = []
+    monkeypatch.setattr(Runtime, "set_default", installed.append)
+    assert install_metrics(ENV) == "127.0.0.1:9464"
+    assert install_metrics(ENV, port_offset=2) == "127.0.0.1:9466"
+    assert len(installed) == 2
+
+
+def test_worker_options_add_latency_interceptor():
+    (interceptor,) = worker_options(environ=ENV)["interceptors"]
+    assert isinstance(interceptor, LatencyInterceptor)
@@ -0,0 +1,70 @@
+import asyncio
+
+from temporalio.client import WorkflowFailureError
+from temporalio.exceptions import ApplicationError
+
+from shared.results import gather_results
+
+
+class _FakeHandle:
+    def __init__(self, client, workflow_id):
+        self.client = client
+        self.workflow_id = workflow_id
+
+    async def result(self):
+        self.client.waiting += 1
+        self.client.peak = max(self.client.peak, self.client.waiting)
+        try:
+            delay = self.client.delays[self.workflow_id]
+            await asyncio.sleep(delay)
+            if self.workflow_id == "fails":
+                raise WorkflowFailureError(cause=ApplicationError("boom"))
+            return f"result of {self.workflow_id}"
+        finally:
+            self.client.waiting -= 1
+
+
+class _FakeClient:
+    def __init__(self, delays):
+        self.delays = delays
+        self.waiting = 0
+        self.peak = 0
+
+    def get_workflow_handle(self, workflow_id):
+        return _FakeHandle(self, workflow_id)
+
+
+async def _collect(client, ids, **kwargs):
+    return [result async for result in gather_results(client, ids, **kwargs)]
+
+
+async def test_results_in_completion_order():
+    client = _FakeClient({"slow": 0.2, "fast": 0.01, "medium": 0.05})
+    results = await _collect(client, ["slow", "fast", "medium"], concurrency=3)
+    assert [result.workflow_id for result in results] == ["fast", "medium", "slow"]
+    assert results[0].status == "completed"
+    assert results[0].result == "result of fast"
+
+
+async def test_concurrency_limit():
+    client = _FakeClient({str(i): 0.01 for i in range(50)})
+    results = await _collect(client, [str(i) for i in range(50)], concurrency=5)
+    assert len(results) == 50
+    assert client.peak == 5
+
+
+async def test_timeout_and_failure_do_not_stop_the_rest():
+    client = _FakeClient({"hangs": 10, "fails": 0, "ok": 0.01})
+    results = await _collect(client, ["hangs", "fails", "ok"], timeout=0.1)
+    statuses = {result.workflow_id: result.status for result in results}
+    assert statuses == {"hangs": "timed_out", "fails": "failed", "ok": "completed"}
+    assert "boom" in next(r.error for r in results if r.workflow_id == "fails")
+
+
+async def test_stopping_early_cancels_the_rest():
+    client = _FakeClient({"fast": 0, "hangs": 10})
+    results = gather_results(client, ["fast", "hangs"])
+    assert (await results.__anext__()).workflow_id == "fast"
+    await results.aclose()
+    await asyncio.sleep(0)
+    assert client.waiting == 0
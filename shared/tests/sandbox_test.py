@@ -0,0 +1,18 @@
+import sys
+
+from shared.sandbox import PASSTHROUGH_MODULES, SANDBOX_RESTRICTIONS, sandbox_runner
+
+
+def test_runner_passes_through_sample_modules():
+    runner = sandbox_runner()
+    assert runner.restrictions is SANDBOX_RESTRICTIONS
+    assert set(PASSTHROUGH_MODULES) <= runner.restrictions.passthrough_modules
+    assert "temporalio" in runner.restrictions.passthrough_modules
+
+
+def test_runner_preloads_extra_modules():
+    sys.modules.pop("shared.cpu_work", None)
+    runner = sandbox_runner("shared.cpu_work")
+    assert "shared.cpu_work" in sys.modules
+    assert "shared.cpu_work" in runner.restrictions.passthrough_modules
+    assert set(PASSTHROUGH_MODULES) <= runner.restrictions.passthrough_modules
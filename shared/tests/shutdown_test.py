@@ -0,0 +1,72 @@
+import asyncio
+import os
+import signal
+from datetime import timedelta
+
+import pytest
+
+from shared.shutdown import run_until_signalled, set_graceful_shutdown
+
+
+class _FakeWorker:
+    def __init__(self, shutdown_seconds: float = 0) -> None:
+        self.shutdown_seconds = shutdown_seconds
+        self.shutdown_started = False
+        self._stopped = asyncio.Event()
+
+    async def run(self) -> None:
+        await self._stopped.wait()
+
+    async def shutdown(self) -> None:
+        self.shutdown_started = True
+        await asyncio.sleep(self.shutdown_seconds)
+        self._stopped.set()
+
+
+@pytest.mark.asyncio
+async def test_sigterm_drains_worker():
+    worker = _FakeWorker(shutdown_seconds=0.1)
+    asyncio.get_running_loop().call_later(0.1, os.kill, os.getpid(), signal.SIGTERM)
+    await asyncio.wait_for(run_until_signalled(worker), 5)
+    assert worker.shutdown_started
+    assert worker._stopped.is_set()
+
+
+@pytest.mark.asyncio
+async def test_drain_timeout_bounds_shutdown():
+    worker = _FakeWorker(shutdown_seconds=60)
+    asyncio.get_running_loop().call_later(0.1, os.kill, os.getpid(), signal.SIGTERM)
+    await asyncio.wait_for(run_until_signalled(worker, drain_timeout=0.2), 5)
+    assert worker.shutdown_started
+    assert not worker._stopped.is_set()
+
+
+class _FailingWorker(_FakeWorker):
+    async def run(self) -> None:
+        raise RuntimeError("poller failed")
+
+
+@pytest.mark.asyncio
+async def test_sigterm_drains_every_worker():
+    workers = [_FakeWorker(shutdown_seconds=0.1) for _ in range(3)]
+    asyncio.get_running_loop().call_later(0.1, os.kill, os.getpid(), signal.SIGTERM)
+    await asyncio.wait_for(run_until_signalled(*workers), 5)
+    assert all(worker._stopped.is_set() for worker in workers)
+
+
+@pytest.mark.asyncio
+async def test_failed_worker_drains_the_others():
+    worker = _FakeWorker()
+    with pytest.raises(RuntimeError, match="poller failed"):
+        await asyncio.wait_for(run_until_signalled(worker, _FailingWorker()), 5)
+    assert worker._stopped.is_set()
+
+
+def test_graceful_shutdown_is_below_drain_timeout():
+    options = {}
+    set_graceful_shutdown(options, 30)
+    assert options["graceful_shutdown_timeout"] == timedelta(seconds=24)
+    # A time set by the Worker profile is kept
+    options = {"graceful_shutdown_timeout": timedelta(seconds=5)}
+    set_graceful_shutdown(options, 30)
+    assert options["graceful_shutdown_timeout"] == timedelta(seconds=5)
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from shared.signal_batcher import SignalBatcher
+
+
+class _FakeHandle:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def signal(self, signal, batch):
+        await asyncio.sleep(0.001)
+        if self.fail:
+            raise RuntimeError("signal failed")
+        self.batches.append((signal, batch))
+
+
+async def test_full_batches_are_sent_in_order():
+    handle = _FakeHandle()
+    async with SignalBatcher(handle, "submit", max_items=10, max_delay=60) as batcher:
+        for i in range(25):
+            await batcher.add(i)
+    assert [len(batch) for _, batch in handle.batches] == [10, 10, 5]
+    assert [item for _, batch in handle.batches for item in batch] == list(range(25))
+    assert batcher.signals_sent == 3
+
+
+async def test_partial_batch_is_sent_after_delay():
+    handle = _FakeHandle()
+    batcher = SignalBatcher(handle, "submit", max_items=100, max_delay=0.01)
+    await batcher.add("a")
+    await batcher.add("b")
+    assert handle.batches == []
+    await asyncio.sleep(0.05)
+    assert handle.batches == [("submit", ["a", "b"])]
+
+
+async def test_concurrent_producers_keep_order():
+    handle = _FakeHandle()
+    batcher = SignalBatcher(handle, "submit", max_items=7, max_delay=0.002)
+
+    async def produce(producer):
+        for i in range(50):
+            await batcher.add((producer, i))
+            if i % 9 == 0:
+                await asyncio.sleep(0.003)
+
+    await asyncio.gather(*(produce(producer) for producer in range(4)))
+    await batcher.flush()
+    items = [item for _, batch in handle.batches for item in batch]
+    assert len(items) == 200
+    for producer in range(4):
+        assert [i for p, i in items if p == producer] == list(range(50))
+
+
+async def test_error_from_timer_is_raised_on_flush():
+    batcher = SignalBatcher(_FakeHandle(fail=True), "submit", max_delay=0.001)
+    await batcher.add("a")
+    await asyncio.sleep(0.02)
+    with pytest.raises(RuntimeError):
+        await batcher.flush()
+
+
+async def test_failed_batch_is_sent_again_in_order():
+    handle = _FakeHandle(fail=True)
+    batcher = SignalBatcher(handle, "submit", max_items=3, max_delay=60)
+    await batcher.add("a")
+    await batcher.add("b")
+    with pytest.raises(RuntimeError):
+        await batcher.add("c")
+    handle.fail = False
+    await batcher.add("d")
+    await batcher.flush()
+    assert handle.batches == [("submit", ["a", "b", "c"]), ("submit", ["d"])]
@@ -0,0 +1,69 @@
+import json
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from shared.supervisor import Supervisor, serve_health
+
+
+def _sleep_forever():
+    while True:
+        time.sleep(1)
+
+
+def _crash():
+    sys.exit(3)
+
+
+def _wait_for(condition, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.1)
+
+
+def _run_in_thread(supervisor):
+    thread = threading.Thread(
+        target=supervisor.run, kwargs={"install_signal_handlers": False}
+    )
+    thread.start()
+    return thread
+
+
+def test_supervisor_drains_workers_on_stop():
+    supervisor = Supervisor(_sleep_forever, 2, drain_timeout=5)
+    server = serve_health(supervisor, 0)
+    thread = _run_in_thread(supervisor)
+    try:
+        _wait_for(lambda: supervisor.health()["alive"] == 2)
+        url = f"http://127.0.0.1:{server.server_address[1]}/healthz"
+        with urllib.request.urlopen(url) as response:
+            assert json.load(response)["status"] == "ok"
+    finally:
+        supervisor.stop()
+        thread.join()
+        server.shutdown()
+    health = supervisor.health()
+    assert health["alive"] == 0
+    assert health["restarts"] == 0
+
+
+def test_supervisor_restarts_crashed_workers():
+    supervisor = Supervisor(_crash, 1, restart_backoff=0.1, max_restart_backoff=0.2)
+    server = serve_health(supervisor, 0)
+    thread = _run_in_thread(supervisor)
+    try:
+        _wait_for(lambda: supervisor.health()["restarts"] >= 2)
+        assert supervisor.health()["workers"][0]["last_exit_code"] == 3
+        url = f"http://127.0.0.1:{server.server_address[1]}/healthz"
+        try:
+            urllib.request.urlopen(url)
+        except urllib.error.HTTPError as err:
+            # Unhealthy whenever the crashed Worker has not been restarted yet
+            assert err.code == 503
+    finally:
+        supervisor.stop()
+        thread.join()
+        server.shutdown()
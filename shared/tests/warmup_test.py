@@ -0,0 +1,45 @@
+import logging
+
+import temporalio.workflow
+from temporalio import workflow
+
+from shared.sandbox import sandbox_runner
+from shared.warmup import first_task_history, warm_up
+
+
+@workflow.defn
+class GreetWorkflow:
+    @workflow.run
+    async def run(self, name: str) -> str:
+        return f"Hello, {name}!"
+
+
+async def test_warm_up_replays_first_task(caplog):
+    runner = sandbox_runner("shared.cpu_work")
+    with caplog.at_level(logging.WARNING, logger="shared.warmup"):
+        seconds = await warm_up({GreetWorkflow: ["World"]}, workflow_runner=runner)
+    assert seconds > 0
+    assert not caplog.records
+
+
+def test_first_task_history_has_workflow_input():
+    history = first_task_history(GreetWorkflow, ["World"])
+    started = history.events[0].workflow_execution_started_event_attributes
+    assert started.workflow_type.name == "GreetWorkflow"
+    assert len(started.input.payloads) == 1
+    assert len(history.events) == 3
+
+
+def test_first_task_history_takes_a_workflow_name():
+    history = first_task_history(GreetWorkflow, ["World"], name="Greet")
+    started = history.events[0].workflow_execution_started_event_attributes
+    assert started.workflow_type.name == "Greet"
+    assert history.workflow_id == "warm-up-Greet"
+
+
+async def test_warm_up_is_skipped_without_the_workflow_definition(caplog, monkeypatch):
+    # As if a later SDK renamed its private Workflow definition
+    monkeypatch.delattr(temporalio.workflow, "_Definition")
+    with caplog.at_level(logging.WARNING, logger="shared.warmup"):
+        await warm_up({GreetWorkflow: ["World"]})
+    assert "Skipping warm-up of GreetWorkflow" in caplog.text
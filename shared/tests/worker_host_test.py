@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+from shared.worker_host import REGISTRY, ROOT
+
+
+def _in_new_process(code: str) -> subprocess.CompletedProcess:
+    # Loading changes sys.path and sys.modules, so it gets a process of its own
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def _load_in_new_process(*groups: str) -> subprocess.CompletedProcess:
+    entries = " + ".join(f"REGISTRY[{group!r}]" for group in groups)
+    return _in_new_process(
+        "from shared.worker_host import REGISTRY, load_workers\n"
+        f"print(sorted(w['task_queue'] for w in load_workers({entries})))"
+    )
+
+
+def test_task_queues_are_hosted_once():
+    task_queues = [entry.task_queue for group in REGISTRY.values() for entry in group]
+    assert len(task_queues) == len(set(task_queues))
+
+
+def test_group_loads():
+    result = _load_in_new_process("money-transfer")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "['money-transfer', 'my-task-queue']"
+
+
+def test_default_group_loads():
+    result = _load_in_new_process("default")
+    assert result.returncode == 0, result.stderr
+    for entry in REGISTRY["default"]:
+        # Samples that do not load with the installed SDK are named and left out
+        assert (
+            repr(entry.task_queue) in result.stdout
+            or f"Not running {entry.task_queue}:" in result.stderr
+        )
+    assert "'signal-tq'" in result.stdout
+
+
+def test_clashing_groups_fail_before_importing():
+    result = _load_in_new_process("money-transfer", "backgroundcheck")
+    assert result.returncode != 0
+    assert "must be in different groups" in result.stderr
+    assert "activities.ssntraceactivity_dacx" in result.stderr
+
+
+def test_workers_drain_activities_within_drain_timeout():
+    # Runs the host with Worker and run_until_signalled replaced, to see the options each Worker gets
+    result = _in_new_process(
+        "import asyncio\n"
+        "from shared import worker_host\n"
+        "created = []\n"
+        "worker_host.Worker = lambda client, **options: created.append(options)\n"
+        "async def run(*workers, drain_timeout): pass\n"
+        "worker_host.run_until_signalled = run\n"
+        "asyncio.run(worker_host.run_host(None, worker_host.REGISTRY['money-transfer'], 10))\n"
+        "print(sorted({o['graceful_shutdown_timeout'].total_seconds() for o in created}))"
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[8.0]"
@@ -0,0 +1,59 @@
+import inspect
+import json
+from datetime import timedelta
+
+import pytest
+from temporalio.worker import Worker
+
+from shared.worker_profile import OPTIONS, PRESETS, load_profile, worker_options
+
+
+def test_default_profile_keeps_sdk_defaults():
+    assert worker_options(environ={}) == {}
+
+
+def test_preset_from_environment_with_override():
+    options = worker_options(
+        environ={
+            "TEMPORAL_WORKER_PROFILE": "throughput",
+            "TEMPORAL_WORKER_MAX_CACHED_WORKFLOWS": "500",
+        }
+    )
+    assert options["max_concurrent_activities"] == 1000
+    assert options["max_cached_workflows"] == 500
+
+
+def test_profile_file_extends_preset(tmp_path):
+    path = tmp_path / "profile.json"
+    path.write_text(
+        json.dumps(
+            {
+                "extends": "latency",
+                "max_concurrent_activities": 5,
+                "graceful_shutdown_timeout": 30,
+            }
+        )
+    )
+    options = load_profile(str(path))
+    assert options["max_concurrent_workflow_task_polls"] == 10
+    assert options["max_concurrent_activities"] == 5
+    assert options["graceful_shutdown_timeout"] == timedelta(seconds=30)
+
+
+def test_unknown_options_and_profiles_are_rejected(tmp_path):
+    path = tmp_path / "profile.json"
+    path.write_text(json.dumps({"max_cached_workflow": 5}))
+    with pytest.raises(ValueError, match="max_cached_workflow"):
+        load_profile(str(path))
+    with pytest.raises(ValueError, match="fastest"):
+        worker_options("fastest")
+
+
+@pytest.mark.parametrize("preset", sorted(PRESETS))
+def test_presets_are_valid(preset):
+    load_profile(preset)
+
+
+def test_options_are_worker_arguments():
+    parameters = inspect.signature(Worker).parameters
+    assert set(OPTIONS) <= set(parameters)
@@ -0,0 +1,102 @@
+"""
+Pay a Worker's one-time Workflow costs before it starts polling.
+
+`Worker()` validates each Workflow in the sandbox when it is created, which takes a few milliseconds.
+The first Workflow task in a process costs far more: the first activation loads and initializes the Workflow
+machinery and the modules it imports, and this delays the first task of every new Worker process.
+`warm_up()` replays a one-task History of each Workflow with the Worker's runner so that this happens at startup:
+
+    runner = sandbox_runner()
+    await warm_up({YourWorkflow: ["World"]}, workflow_runner=runner)
+    worker = Worker(client, ..., workflow_runner=runner)
+
+Replay runs no Activities and sends nothing to the server, so warming up has no side effects.
+The SDK has no public way to read the name a Workflow class was defined with, so it is read from the SDK's
+private Workflow definition; if a later SDK changes that, warm-up is logged and skipped rather than failing the Worker.
+"""
+
+import logging
+import time
+from typing import Any, Mapping, Optional, Sequence
+
+import temporalio.workflow
+from temporalio.api.enums.v1 import EventType
+from temporalio.api.history.v1 import HistoryEvent
+from temporalio.client import WorkflowHistory
+from temporalio.converter import DataConverter
+from temporalio.worker import Replayer, WorkflowRunner
+
+from shared.sandbox import sandbox_runner
+
+logger = logging.getLogger(__name__)
+
+
+def _workflow_name(workflow: type) -> str:
+    # Raises AttributeError if the SDK no longer has this private definition
+    return temporalio.workflow._Definition.must_from_class(workflow).name or ""
+
+
+def first_task_history(
+    workflow: type, args: Sequence[Any], name: Optional[str] = None
+) -> WorkflowHistory:
+    """A History that ends as the first Workflow task of `workflow`, called with `args`, starts.
+
+    `name` is the Workflow Type name, read from the class if not given.
+    """
+    if name is None:
+        name = _workflow_name(workflow)
+    workflow_id = f"warm-up-{name}"
+    events = [
+        HistoryEvent(event_id=event_id, event_type=event_type)
+        for event_id, event_type in enumerate(
+            [
+                EventType.EVENT_TYPE_WORKFLOW_EXECUTION_STARTED,
+                EventType.EVENT_TYPE_WORKFLOW_TASK_SCHEDULED,
+                EventType.EVENT_TYPE_WORKFLOW_TASK_STARTED,
+            ],
+            start=1,
+        )
+    ]
+    for event in events:
+        event.event_time.GetCurrentTime()
+    started = events[0].workflow_execution_started_event_attributes
+    started.workflow_type.name = name
+    started.task_queue.name = "warm-up"
+    started.original_execution_run_id = workflow_id
+    started.first_execution_run_id = workflow_id
+    started.attempt = 1
+    if args:
+        started.input.payloads.extend(
+            DataConverter.default.payload_converter.to_payloads(args)
+        )
+    task = events[1].workflow_task_scheduled_event_attributes
+    task.task_queue.name = "warm-up"
+    task.start_to_close_timeout.FromSeconds(10)
+    task.attempt = 1
+    events[2].workflow_task_started_event_attributes.scheduled_event_id = 2
+    return WorkflowHistory(workflow_id, events)
+
+
+async def warm_up(
+    workflows: Mapping[type, Sequence[Any]],
+    workflow_runner: Optional[WorkflowRunner] = None,
+) -> float:
+    """Run the first task of each Workflow, called with the given arguments, and return the seconds it took."""
+    start = time.perf_counter()
+    histories = []
+    for workflow, args in workflows.items():
+        try:
+            histories.append(first_task_history(workflow, args))
+        except AttributeError as err:
+            logger.warning("Skipping warm-up of %s: %s", workflow.__name__, err)
+    if histories:
+        replayer = Replayer(
+            workflows=list(workflows),
+            workflow_runner=workflow_runner or sandbox_runner(),
+        )
+        for history in histories:
+            # A task that fails, such as on wrong arguments, is logged by the SDK and does not stop the Worker
+            await replayer.replay_workflow(history, raise_on_replay_failure=False)
+    seconds = time.perf_counter() - start
+    logger.info("Warmed up %d Workflows in %.0fms", len(histories), seconds * 1000)
+    return seconds
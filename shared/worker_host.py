@@ -0,0 +1,307 @@
+"""
+Run the Workers of many samples in one process, sharing one Client.
+
+Each sample Worker script connects its own Client and polls one Task Queue, which costs a process,
+a connection and an SDK runtime per Task Queue.
+The host connects once and runs one Worker per Task Queue from `REGISTRY`, with the usual
+`worker_options()`, sandbox runner and metrics, and drains all of them on SIGTERM or Ctrl+C:
+
+    python -m shared.worker_host
+    python -m shared.worker_host --group money-transfer --target localhost:7233
+
+The samples import their modules by flat name from their own directory, and the sandbox imports
+a Workflow's module again by that name for every run.
+Samples with modules of the same name, such as the `activities` of several samples, cannot share a
+process, so `REGISTRY` groups them and each group runs in its own process.
+Loading a group fails if one of its samples would import another sample's module.
+A sample whose modules fail to import is logged with its Task Queue and left out, and the rest of the group runs.
+"""
+
+import argparse
+import asyncio
+import importlib
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from importlib.machinery import PathFinder
+from typing import Any, Dict, List, Optional, Sequence
+
+from temporalio.client import Client
+from temporalio.worker import Worker
+
+from shared.client_pool import get_client
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.shutdown import run_until_signalled, set_graceful_shutdown
+from shared.worker_profile import worker_options
+
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True)
+class HostedWorker:
+    """One Worker of the host: a Task Queue and the `module:name` of its Workflows and Activities."""
+
+    task_queue: str
+    # Sample directory, relative to the repository root, that the sample runs from
+    directory: str
+    workflows: Sequence[str] = ()
+    activities: Sequence[str] = ()
+
+
+REGISTRY: Dict[str, List[HostedWorker]] = {
+    "default": [
+        HostedWorker(
+            "signal-tq",
+            "signal_your_workflow",
+            workflows=[
+                "wf_signal_dacx:GreetingWorkflow",
+                "signal_external_wf_dacx:WorkflowA",
+                "signal_external_wf_dacx:WorkflowB",
+                "wf_signal_compact:CompactGreetingWorkflow",
+            ],
+            activities=["greeting_activities:store_greetings"],
+        ),
+        HostedWorker(
+            "query-tq",
+            "query_your_workflow",
+            workflows=["wf_query_dacx:GreetingWorkflow"],
+        ),
+        HostedWorker(
+            "dynamic-query-task-queue",
+            "dynamic_handlers",
+            workflows=["your_dynamic_query_dacx:GreetingWorkflow"],
+        ),
+        HostedWorker(
+            "dynamic-signal-task-queue",
+            "dynamic_handlers",
+            workflows=["your_dynamic_signal_dacx:GreetingWorkflow"],
+        ),
+        HostedWorker(
+            "dynamic-activity-task-queue",
+            "dynamic_handlers",
+            workflows=["your_dynamic_activity_dacx:GreetingWorkflow"],
+            activities=[
+                "your_dynamic_activity_dacx:dynamic_greeting",
+                "your_dynamic_activity_dacx:default_greeting",
+            ],
+        ),
+        HostedWorker(
+            "dynamic-workflow-task-queue",
+            "dynamic_handlers",
+            workflows=["your_dynamic_workflow_dacx:DynamicWorkflow"],
+            activities=["your_dynamic_workflow_dacx:default_greeting"],
+        ),
+        HostedWorker(
+            "search-attributes-task-queue",
+            "your_visibility",
+            workflows=["workflow_dacx:GreetingWorkflow"],
+        ),
+        HostedWorker(
+            "logging-task-queue",
+            "your_loggers",
+            workflows=["your_workflow_dacx:GreetingWorkflow"],
+        ),
+        HostedWorker(
+            "hello-child-workflow-task-queue",
+            "your_child_workflow",
+            workflows=[
+                "your_child_workflow_dacx:GreetingWorkflow",
+                "your_child_workflow_dacx:ComposeGreetingWorkflow",
+            ],
+        ),
+        HostedWorker(
+            "replay-task-queue",
+            "replay_your_workflow",
+            workflows=["your_workflow:YourWorkflow"],
+            activities=["your_activities:your_activity"],
+        ),
+        # your_cron_job, continue_as_new and the timeouts samples also poll your-task-queue,
+        # with other Workflows, so they run on their own
+        HostedWorker(
+            "your-task-queue",
+            "your_app",
+            workflows=["your_workflows_dacx:YourWorkflow"],
+            activities=["your_activities_dacx:your_activity"],
+        ),
+        # The patched stage runs Workflows started before and after the patch
+        HostedWorker(
+            "patching-task-queue",
+            "version_your_workflows",
+            workflows=["version_your_workflows.workflow_2_patched_dacx:MyWorkflow"],
+            activities=[
+                "activities:pre_patch_activity",
+                "activities:post_patch_activity",
+            ],
+        ),
+        HostedWorker(
+            "backgroundcheck-boilerplate-task-queue-local",
+            "backgroundcheck_replay",
+            workflows=[
+                "backgroundcheck_replay.backgroundcheck_dacx:BackgroundCheck",
+                "backgroundcheck_replay.backgroundcheck_non_deterministic_code_dacx:BackgroundCheckNonDeterministic",
+            ],
+            activities=["ssntraceactivity:ssn_trace_activity"],
+        ),
+    ],
+    # Has its own activities and workflow_dacx modules
+    "money-transfer": [
+        HostedWorker(
+            "money-transfer",
+            "workflow_failures",
+            workflows=["workflow_dacx:MoneyTransferWorkflow"],
+            activities=[
+                "activities:withdraw",
+                "activities:deposit",
+                "activities:refund",
+            ],
+        ),
+        HostedWorker(
+            "my-task-queue",
+            "schedule_your_workflow",
+            workflows=["your_workflows:YourSchedulesWorkflow"],
+            activities=["your_activities:your_activity"],
+        ),
+    ],
+    # Has an activities package
+    "backgroundcheck": [
+        HostedWorker(
+            "backgroundcheck-boilerplate-task-queue",
+            "backgroundcheck_boilerplate",
+            workflows=["workflows.backgroundcheck_dacx:BackgroundCheck"],
+            activities=["activities.ssntraceactivity_dacx:ssn_trace_activity"],
+        ),
+    ],
+}
+
+
+def _location(path: Optional[str], package_paths: Optional[Sequence[str]]) -> str:
+    # The file of a module, or the directory of a package
+    if path is None:
+        return list(package_paths or [""])[0]
+    if os.path.basename(path) == "__init__.py":
+        return os.path.dirname(path)
+    return path
+
+
+def _check_reference(reference: str, directory: str) -> None:
+    # Checked before importing anything, as a module may import another sample's module
+    name = reference.partition(":")[0].split(".")[0]
+    spec = PathFinder.find_spec(name, sys.path)
+    found = spec and _location(spec.origin, spec.submodule_search_locations)
+    if not found or not (found == directory or found.startswith(directory + os.sep)):
+        raise ValueError(
+            f"{reference} of {directory} is imported from {found or 'nowhere'}, "
+            "so the samples importing it must be in different groups"
+        )
+
+
+def _load(reference: str) -> Any:
+    name, _, attribute = reference.partition(":")
+    return getattr(importlib.import_module(name), attribute)
+
+
+def _check_imports(directories: Sequence[str]) -> None:
+    """Fail if a module loaded from one of `directories` would be imported from somewhere else by name."""
+    for name, module in list(sys.modules.items()):
+        if "." in name:
+            continue
+        location = _location(
+            getattr(module, "__file__", None), getattr(module, "__path__", None)
+        )
+        if os.path.dirname(location) not in directories:
+            continue
+        spec = PathFinder.find_spec(name, sys.path)
+        found = spec and _location(spec.origin, spec.submodule_search_locations)
+        if found != location:
+            raise ValueError(
+                f"Module {name!r} from {location} is imported from {found or 'nowhere'} by name, "
+                "so the samples importing it must be in different groups"
+            )
+
+
+def load_workers(entries: Sequence[HostedWorker]) -> List[Dict[str, Any]]:
+    """Import the Workflows and Activities of `entries` and return `Worker()` arguments for each that loads."""
+    directories = [os.path.join(ROOT, entry.directory) for entry in entries]
+    for directory in directories:
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+    if ROOT not in sys.path:
+        sys.path.append(ROOT)
+    for entry, directory in zip(entries, directories):
+        for reference in [*entry.workflows, *entry.activities]:
+            _check_reference(reference, directory)
+    workers = []
+    for entry in entries:
+        try:
+            workers.append(
+                {
+                    "task_queue": entry.task_queue,
+                    "workflows": [_load(reference) for reference in entry.workflows],
+                    "activities": [_load(reference) for reference in entry.activities],
+                }
+            )
+        except Exception:
+            # Such as a sample written for another SDK version; the other Task Queues still run
+            logger.exception(
+                "Not running %s: its Workflows or Activities failed to load",
+                entry.task_queue,
+            )
+    _check_imports(directories)
+    return workers
+
+
+async def run_host(
+    client: Client, entries: Sequence[HostedWorker], drain_timeout: float = 30.0
+) -> None:
+    """Run a Worker for each of `entries` on `client` until SIGTERM or Ctrl+C."""
+    runner = sandbox_runner()
+    options = worker_options()
+    set_graceful_shutdown(options, drain_timeout)
+    workers = [
+        Worker(client, workflow_runner=runner, **arguments, **options)
+        for arguments in load_workers(entries)
+    ]
+    logger.info(
+        "Running Workers for %s", ", ".join(entry.task_queue for entry in entries)
+    )
+    await run_until_signalled(*workers, drain_timeout=drain_timeout)
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Run the Workers of many samples in one process"
+    )
+    parser.add_argument(
+        "--group", choices=sorted(REGISTRY), default="default", help="Samples to run"
+    )
+    parser.add_argument(
+        "--task-queues", nargs="+", help="Run only these Task Queues of the group"
+    )
+    parser.add_argument("--target", default="localhost:7233")
+    parser.add_argument("--namespace", default="default")
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds the Workers have to finish in-flight tasks after SIGTERM",
+    )
+    args = parser.parse_args()
+
+    entries = REGISTRY[args.group]
+    if args.task_queues:
+        unknown = set(args.task_queues) - {entry.task_queue for entry in entries}
+        if unknown:
+            parser.error(f"Task Queues not in group {args.group}: {sorted(unknown)}")
+        entries = [entry for entry in entries if entry.task_queue in args.task_queues]
+    client = await get_client(args.target, namespace=args.namespace)
+    await run_host(client, entries, drain_timeout=args.drain_timeout)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    install_metrics()
+    asyncio.run(main())
@@ -0,0 +1,132 @@
+"""
+Worker tuning profiles shared by every sample Worker.
+
+A profile is a set of `Worker()` keyword arguments for slot counts, pollers and the sticky cache.
+Pass the result of `worker_options()` to each Worker, then choose the profile when starting the process:
+
+    TEMPORAL_WORKER_PROFILE=throughput python run_worker_dacx.py
+    TEMPORAL_WORKER_PROFILE=./my_profile.json python run_worker_dacx.py
+
+A profile file is a JSON object of Worker options. It can start from a preset with `"extends"`:
+
+    {"extends": "throughput", "max_cached_workflows": 5000}
+
+Single options can also be overridden with `TEMPORAL_WORKER_<OPTION>`, such as `TEMPORAL_WORKER_MAX_CACHED_WORKFLOWS=500`.
+Durations are given in seconds.
+Without any of these variables, Workers keep the SDK defaults.
+
+When `TEMPORAL_METRICS_ADDRESS` is set, the options also include the interceptors from `shared/metrics.py`.
+"""
+
+import json
+import os
+from datetime import timedelta
+from typing import Any, Dict, Mapping, Optional
+
+from shared.metrics import metrics_interceptors
+
+PROFILE_ENV = "TEMPORAL_WORKER_PROFILE"
+OPTION_ENV_PREFIX = "TEMPORAL_WORKER_"
+
+# Worker options a profile may set, and how to read them from JSON or the environment
+OPTIONS = {
+    "max_cached_workflows": int,
+    "max_concurrent_workflow_tasks": int,
+    "max_concurrent_activities": int,
+    "max_concurrent_local_activities": int,
+    "max_concurrent_workflow_task_polls": int,
+    "max_concurrent_activity_task_polls": int,
+    "nonsticky_to_sticky_poll_ratio": float,
+    "max_activities_per_second": float,
+    "max_task_queue_activities_per_second": float,
+    "sticky_queue_schedule_to_start_timeout": timedelta,
+    "max_heartbeat_throttle_interval": timedelta,
+    "default_heartbeat_throttle_interval": timedelta,
+    "graceful_shutdown_timeout": timedelta,
+}
+
+PRESETS: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    # More pollers than slots are ever likely to need, so a task never waits for a poll,
+    # and a short sticky timeout so a busy Worker hands tasks to another one quickly
+    "latency": {
+        "max_concurrent_workflow_tasks": 100,
+        "max_concurrent_activities": 100,
+        "max_concurrent_workflow_task_polls": 10,
+        "max_concurrent_activity_task_polls": 10,
+        "max_cached_workflows": 2000,
+        "sticky_queue_schedule_to_start_timeout": 2,
+    },
+    # Many slots and pollers and a large sticky cache, so the same process can take 10x the load
+    "throughput": {
+        "max_concurrent_workflow_tasks": 500,
+        "max_concurrent_activities": 1000,
+        "max_concurrent_local_activities": 1000,
+        "max_concurrent_workflow_task_polls": 20,
+        "max_concurrent_activity_task_polls": 20,
+        "nonsticky_to_sticky_poll_ratio": 0.5,
+        "max_cached_workflows": 10000,
+    },
+    # Few slots and a small cache for small containers, at the cost of more replays
+    "memory-constrained": {
+        "max_concurrent_workflow_tasks": 10,
+        "max_concurrent_activities": 10,
+        "max_concurrent_local_activities": 10,
+        "max_concurrent_workflow_task_polls": 2,
+        "max_concurrent_activity_task_polls": 2,
+        "max_cached_workflows": 100,
+    },
+}
+
+
+def _convert(name: str, value: Any) -> Any:
+    kind = OPTIONS.get(name)
+    if kind is None:
+        raise ValueError(
+            f"Unknown Worker option {name!r} in profile, expected one of {sorted(OPTIONS)}"
+        )
+    if kind is timedelta:
+        return (
+            value if isinstance(value, timedelta) else timedelta(seconds=float(value))
+        )
+    return kind(value)
+
+
+def load_profile(profile: str) -> Dict[str, Any]:
+    """Return the options of a preset name or a JSON profile file."""
+    if profile in PRESETS:
+        options = dict(PRESETS[profile])
+    elif os.path.isfile(profile):
+        with open(profile) as f:
+            options = json.load(f)
+        extends = options.pop("extends", None)
+        if extends is not None:
+            if extends not in PRESETS:
+                raise ValueError(
+                    f"Profile {profile} extends unknown preset {extends!r}"
+                )
+            options = {**PRESETS[extends], **options}
+    else:
+        raise ValueError(
+            f"Worker profile {profile!r} is neither a file nor one of {sorted(PRESETS)}"
+        )
+    return {name: _convert(name, value) for name, value in options.items()}
+
+
+def worker_options(
+    profile: Optional[str] = None, environ: Optional[Mapping[str, str]] = None
+) -> Dict[str, Any]:
+    """Keyword arguments for `Worker()` from `profile`, or from the environment if not given."""
+    if environ is None:
+        environ = os.environ
+    if profile is None:
+        profile = environ.get(PROFILE_ENV, "default")
+    options = load_profile(profile)
+    for name in OPTIONS:
+        value = environ.get(OPTION_ENV_PREFIX + name.upper())
+        if value is not None:
+            options[name] = _convert(name, value)
+    interceptors = metrics_interceptors(environ)
+    if interceptors:
+        options["interceptors"] = interceptors
+    return options
@@ -0,0 +1,169 @@
+"""
+Find the smallest sticky cache that keeps GreetingWorkflow Signals from causing replays.
+
+For each `max_cached_workflows` value, the benchmark starts `--workflows` GreetingWorkflows on one Worker,
+sends them `--signals` Signals each in round-robin order, the worst case for an LRU cache,
+and reports sticky cache hits, misses and evictions with the Signal throughput.
+Every miss replays a whole History, so misses per Signal is the replay amplification.
+
+    python benchmark_sticky_cache.py --workflows 1000 --signals 20 --cache-sizes 100 500 1000 2000
+    python benchmark_sticky_cache.py --target localhost:7233
+
+Reading the cache metrics requires temporalio 1.5 or later.
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from temporalio.client import Client
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import Worker
+
+from shared.cache_stats import CacheStats
+
+from wf_signal_dacx import GreetingWorkflow
+
+# The SDK's default, which must not be larger than the cache
+MAX_CONCURRENT_WORKFLOW_TASKS = 100
+
+
+async def _run_size(
+    client: Client,
+    cache_stats: CacheStats,
+    cache_size: int,
+    workflows: int,
+    signals: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    task_queue = f"sticky-cache-benchmark-{cache_size}-{uuid.uuid4()}"
+    limit = asyncio.Semaphore(concurrency)
+
+    async def bounded(coro: Any) -> Any:
+        async with limit:
+            return await coro
+
+    async with Worker(
+        client,
+        task_queue=task_queue,
+        workflows=[GreetingWorkflow],
+        max_cached_workflows=cache_size,
+        max_concurrent_workflow_tasks=min(cache_size, MAX_CONCURRENT_WORKFLOW_TASKS),
+    ):
+        handles = await asyncio.gather(
+            *(
+                bounded(
+                    client.start_workflow(
+                        GreetingWorkflow.run,
+                        id=f"{task_queue}-{i}",
+                        task_queue=task_queue,
+                    )
+                )
+                for i in range(workflows)
+            )
+        )
+        # Only count the Signals, not starting the Workflows
+        cache_stats.reset()
+        start = time.perf_counter()
+        for n in range(signals):
+            await asyncio.gather(
+                *(
+                    bounded(handle.signal(GreetingWorkflow.submit_greeting, f"{n}"))
+                    for handle in handles
+                )
+            )
+        await asyncio.gather(
+            *(bounded(handle.signal(GreetingWorkflow.exit)) for handle in handles)
+        )
+        await asyncio.gather(*(bounded(handle.result()) for handle in handles))
+        seconds = time.perf_counter() - start
+    cache_stats.update()
+    sent = workflows * (signals + 1)
+    return {
+        "cache_size": cache_size,
+        **cache_stats.snapshot(),
+        "misses_per_signal": cache_stats.misses / sent,
+        "signals_per_second": sent / seconds,
+    }
+
+
+def recommend(results: List[Dict[str, Any]], min_hit_ratio: float) -> Optional[int]:
+    """The smallest cache size whose hit ratio is at least `min_hit_ratio`."""
+    for result in sorted(results, key=lambda r: r["cache_size"]):
+        if result["hit_ratio"] >= min_hit_ratio:
+            return result["cache_size"]
+    return None
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark sticky cache sizes")
+    parser.add_argument(
+        "--target",
+        help="Temporal Server to use. By default a local dev server is started.",
+    )
+    parser.add_argument(
+        "--workflows", type=int, default=1000, help="Workflows open at the same time"
+    )
+    parser.add_argument(
+        "--signals", type=int, default=20, help="Signals sent to each Workflow"
+    )
+    parser.add_argument(
+        "--cache-sizes",
+        type=int,
+        nargs="+",
+        default=[100, 250, 500, 1000, 2000],
+        help="max_cached_workflows values to try",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=200, help="Client calls in flight"
+    )
+    parser.add_argument(
+        "--min-hit-ratio",
+        type=float,
+        default=0.95,
+        help="Hit ratio the recommended cache size must reach",
+    )
+    args = parser.parse_args()
+
+    cache_stats = CacheStats()
+    if args.target:
+        client = await Client.connect(args.target, runtime=cache_stats.runtime)
+        env = WorkflowEnvironment.from_client(client)
+    else:
+        env = await WorkflowEnvironment.start_local(runtime=cache_stats.runtime)
+    try:
+        print(f"{args.workflows} Workflows, {args.signals} Signals each")
+        print(
+            f"{'cache':>8}{'hits':>10}{'misses':>10}{'evictions':>11}"
+            f"{'hit ratio':>11}{'misses/signal':>15}{'signals/s':>11}"
+        )
+        results = []
+        for cache_size in args.cache_sizes:
+            result = await _run_size(
+                env.client,
+                cache_stats,
+                cache_size,
+                args.workflows,
+                args.signals,
+                args.concurrency,
+            )
+            results.append(result)
+            print(
+                f"{result['cache_size']:>8}{result['hits']:>10}{result['misses']:>10}"
+                f"{result['evictions']:>11}{result['hit_ratio']:>11.2f}"
+                f"{result['misses_per_signal']:>15.2f}{result['signals_per_second']:>11.1f}"
+            )
+    finally:
+        await env.shutdown()
+
+    size = recommend(results, args.min_hit_ratio)
+    if size is None:
+        print(f"No cache size reached a hit ratio of {args.min_hit_ratio}")
+    else:
+        print(f"Recommended max_cached_workflows: {size}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,15 +2,27 @@ import asyncio
 
 from temporalio.client import Client
 from temporalio.worker import Worker
+
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
 from signal_external_wf_dacx import WorkflowA, WorkflowB
 
 
 async def main():
     # Start client
     client = await Client.connect("localhost:7233")
-    worker = Worker(client, task_queue="signal-tq", workflows=[WorkflowA, WorkflowB])
+    worker = Worker(
+        client,
+        task_queue="signal-tq",
+        workflows=[WorkflowA, WorkflowB],
+        workflow_runner=sandbox_runner(),
+        **worker_options(),
+    )
     await worker.run()
 
 
 if __name__ == "__main__":
+    install_metrics()
     asyncio.run(main())
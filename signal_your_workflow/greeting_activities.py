@@ -0,0 +1,10 @@
+from typing import List
+
+from temporalio import activity
+
+
+@activity.defn
+async def store_greetings(greetings: List[str]) -> None:
+    """Stand-in for writing a batch of greetings to a database or another service."""
+    for greeting in greetings:
+        activity.logger.info(greeting)
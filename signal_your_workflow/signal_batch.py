@@ -0,0 +1,81 @@
+"""
+Send many greetings to a GreetingWorkflow, one Signal each or coalesced into batches, and compare the History.
+
+    python signal_batch.py --greetings 1000
+    python signal_batch.py --greetings 1000 --max-items 100 --max-delay 0.005
+
+With `--max-items 1` every greeting is its own `submit_greeting` Signal.
+Otherwise `SignalBatcher` sends them with `submit_greetings`, up to `--max-items` a Signal.
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from temporalio.api.enums.v1 import EventType
+from temporalio.client import Client
+
+from shared.signal_batcher import SignalBatcher
+
+from wf_signal_dacx import GreetingWorkflow
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Signal a GreetingWorkflow in batches")
+    parser.add_argument("--greetings", type=int, default=1000)
+    parser.add_argument(
+        "--max-items",
+        type=int,
+        default=100,
+        help="Greetings a Signal, 1 for no batching",
+    )
+    parser.add_argument(
+        "--max-delay",
+        type=float,
+        default=0.005,
+        help="Seconds a greeting waits for its batch to fill",
+    )
+    parser.add_argument("--target", default="localhost:7233")
+    args = parser.parse_args()
+
+    client = await Client.connect(args.target)
+    handle = await client.start_workflow(
+        GreetingWorkflow.run,
+        id=f"greeting-batch-{uuid.uuid4()}",
+        task_queue="signal-tq",
+    )
+    start = time.perf_counter()
+    if args.max_items == 1:
+        for i in range(args.greetings):
+            await handle.signal(GreetingWorkflow.submit_greeting, f"User {i}")
+        signals = args.greetings
+    else:
+        async with SignalBatcher(
+            handle, GreetingWorkflow.submit_greetings, args.max_items, args.max_delay
+        ) as batcher:
+            for i in range(args.greetings):
+                await batcher.add(f"User {i}")
+        signals = batcher.signals_sent
+    seconds = time.perf_counter() - start
+    await handle.signal(GreetingWorkflow.exit)
+    greetings = await handle.result()
+    if greetings != [f"Hello, User {i}" for i in range(args.greetings)]:
+        raise RuntimeError(
+            f"Expected {args.greetings} greetings in the order they were sent, "
+            f"got {len(greetings)}"
+        )
+
+    history = await handle.fetch_history()
+    workflow_tasks = sum(
+        event.event_type == EventType.EVENT_TYPE_WORKFLOW_TASK_COMPLETED
+        for event in history.events
+    )
+    print(
+        f"{args.greetings} greetings in {signals} Signals, {seconds:.2f}s: "
+        f"{len(history.events)} History events, {workflow_tasks} Workflow Tasks"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+"""
+Send many greetings to a CompactGreetingWorkflow and report the History length of its last run.
+
+    python signal_compact.py --greetings 100000 --max-history-events 2000
+"""
+
+import argparse
+import asyncio
+import uuid
+
+from temporalio.client import Client
+
+from shared.signal_batcher import SignalBatcher
+
+from wf_signal_compact import CompactGreetingInput, CompactGreetingWorkflow
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Signal a CompactGreetingWorkflow until it continues as new"
+    )
+    parser.add_argument("--greetings", type=int, default=10_000)
+    parser.add_argument(
+        "--batch-size", type=int, default=100, help="Greetings stored an Activity"
+    )
+    parser.add_argument("--max-history-events", type=int, default=10_000)
+    parser.add_argument("--target", default="localhost:7233")
+    args = parser.parse_args()
+
+    client = await Client.connect(args.target)
+    handle = await client.start_workflow(
+        CompactGreetingWorkflow.run,
+        CompactGreetingInput(
+            batch_size=args.batch_size, max_history_events=args.max_history_events
+        ),
+        id=f"compact-greeting-{uuid.uuid4()}",
+        task_queue="signal-tq",
+    )
+    # The handle has no Run Id, so Signals go to whichever run is the latest when they arrive
+    async with SignalBatcher(
+        handle, CompactGreetingWorkflow.submit_greetings
+    ) as batcher:
+        for i in range(args.greetings):
+            await batcher.add(f"User {i}")
+    await handle.signal(CompactGreetingWorkflow.exit)
+    stored = await handle.result()
+
+    # A handle without a Run Id reads the History of the last run
+    history = await client.get_workflow_handle(handle.id).fetch_history()
+    print(
+        f"Stored {stored} of {args.greetings} greetings, "
+        f"{len(history.events)} History events in the last run"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
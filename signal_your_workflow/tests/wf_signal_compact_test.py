@@ -0,0 +1,119 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Tuple
+
+import pytest
+from temporalio import activity
+from temporalio.client import Client, WorkflowHandle
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import Worker
+
+from wf_signal_compact import CompactGreetingInput, CompactGreetingWorkflow
+
+
+class _Store:
+    """Replaces the store_greetings Activity, keeping every batch it is given."""
+
+    def __init__(self, seconds: float = 0) -> None:
+        self.seconds = seconds
+        self.batches: List[List[str]] = []
+
+    @property
+    def greetings(self) -> List[str]:
+        return [greeting for batch in self.batches for greeting in batch]
+
+    def activity(self):
+        @activity.defn(name="store_greetings")
+        async def store_greetings(greetings: List[str]) -> None:
+            await asyncio.sleep(self.seconds)
+            self.batches.append(greetings)
+
+        return store_greetings
+
+
+@asynccontextmanager
+async def _started(
+    store: _Store, input: CompactGreetingInput
+) -> AsyncIterator[Tuple[Client, WorkflowHandle]]:
+    task_queue = str(uuid.uuid4())
+    async with await WorkflowEnvironment.start_local() as env:
+        async with Worker(
+            env.client,
+            task_queue=task_queue,
+            workflows=[CompactGreetingWorkflow],
+            activities=[store.activity()],
+        ):
+            handle = await env.client.start_workflow(
+                CompactGreetingWorkflow.run,
+                input,
+                id=str(uuid.uuid4()),
+                task_queue=task_queue,
+            )
+            yield env.client, handle
+
+
+async def _continued_as_new(client: Client, handle: WorkflowHandle) -> bool:
+    latest = await client.get_workflow_handle(handle.id).describe()
+    return latest.run_id != handle.first_execution_run_id
+
+
+def _names(start: int, stop: int) -> List[str]:
+    return [f"User {i}" for i in range(start, stop)]
+
+
+def _hellos(stop: int) -> List[str]:
+    return [f"Hello, User {i}" for i in range(stop)]
+
+
+@pytest.mark.asyncio
+async def test_order_is_kept_across_batches():
+    store = _Store()
+    async with _started(store, CompactGreetingInput(batch_size=3)) as (_, handle):
+        await handle.signal(CompactGreetingWorkflow.submit_greeting, "User 0")
+        await handle.signal(CompactGreetingWorkflow.submit_greetings, _names(1, 8))
+        await handle.signal(CompactGreetingWorkflow.submit_greeting, "User 8")
+        await handle.signal(CompactGreetingWorkflow.submit_greetings, _names(9, 10))
+        await handle.signal("Custom Signal Name", "User 10")
+        await handle.signal(CompactGreetingWorkflow.exit)
+        assert 11 == await handle.result()
+    assert store.greetings == _hellos(11)
+    assert all(len(batch) <= 3 for batch in store.batches)
+
+
+@pytest.mark.asyncio
+async def test_pending_greetings_are_carried_over():
+    # A slow Activity leaves greetings pending when the History limit is reached
+    store = _Store(seconds=0.2)
+    input = CompactGreetingInput(batch_size=5, max_history_events=30)
+    async with _started(store, input) as (client, handle):
+        for start in range(0, 100, 10):
+            await handle.signal(
+                CompactGreetingWorkflow.submit_greetings, _names(start, start + 10)
+            )
+        await handle.signal(CompactGreetingWorkflow.exit)
+        assert 100 == await handle.result()
+        assert await _continued_as_new(client, handle)
+    assert store.greetings == _hellos(100)
+
+
+@pytest.mark.asyncio
+async def test_continues_as_new_under_a_steady_stream():
+    # A greeting arrives during every Activity, so the buffer is never empty
+    store = _Store(seconds=0.1)
+    input = CompactGreetingInput(
+        batch_size=2, flush_interval=0.05, max_history_events=50
+    )
+    async with _started(store, input) as (client, handle):
+        sent = 0
+        for _ in range(200):
+            await handle.signal(CompactGreetingWorkflow.submit_greeting, f"User {sent}")
+            sent += 1
+            if await _continued_as_new(client, handle):
+                break
+            await asyncio.sleep(0.02)
+        # Continued as new while greetings were still arriving
+        assert await _continued_as_new(client, handle)
+        await handle.signal(CompactGreetingWorkflow.exit)
+        assert sent == await handle.result()
+    assert store.greetings == _hellos(sent)
@@ -0,0 +1,128 @@
+"""
+A GreetingWorkflow for long-running use: it keeps only the greetings not yet stored, and its History stays bounded.
+
+`GreetingWorkflow` keeps every greeting it has received in memory and in its result, and never continues as new,
+so its memory and History grow for as long as it runs.
+`CompactGreetingWorkflow` has the same Signals, but:
+
+- Stores greetings with the `store_greetings` Activity in full batches of `batch_size`, or whatever is pending
+  after `flush_interval` seconds, and then forgets them.
+- Continues as new once its History has `max_history_events` events, or the server suggests it, carrying over
+  the greetings it has not stored yet and the number it has.
+
+Greetings are stored in the order their Signals were received, across batches and runs:
+Signal handlers only append to the buffer, one batch is stored at a time from its front, and the next run
+starts with the greetings that were still pending.
+It returns the number of greetings stored once it is told to exit and has stored everything.
+"""
+
+import asyncio
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Deque, List
+
+from temporalio import workflow
+
+with workflow.unsafe.imports_passed_through():
+    from greeting_activities import store_greetings
+
+
+@dataclass
+class CompactGreetingInput:
+    # Greetings received by an earlier run and not stored yet
+    pending: List[str] = field(default_factory=list)
+    stored: int = 0
+    batch_size: int = 100
+    flush_interval: float = 1.0
+    max_history_events: int = 10_000
+    # Set when an earlier run was told to exit before it stored everything
+    exit: bool = False
+
+
+@workflow.defn
+class CompactGreetingWorkflow:
+    def __init__(self) -> None:
+        self._pending: Deque[str] = deque()
+        self._exit = False
+
+    @workflow.run
+    async def run(self, input: CompactGreetingInput) -> int:
+        # Signals to this run can be handled before it starts, and come after the carried-over greetings
+        self._pending.extendleft(reversed(input.pending))
+        self._exit = self._exit or input.exit
+        stored = input.stored
+        while True:
+            # No Timer while there is nothing to store, so an idle Workflow adds no events
+            await workflow.wait_condition(lambda: bool(self._pending) or self._exit)
+            timed_out = False
+            try:
+                await workflow.wait_condition(
+                    lambda: len(self._pending) >= input.batch_size or self._exit,
+                    timeout=input.flush_interval,
+                )
+            except asyncio.TimeoutError:
+                timed_out = True
+
+            # Only the greetings pending now are stored, so Signals arriving while the Activity runs cannot
+            # keep this loop from checking the History. A partial batch waits for the interval or exit.
+            pending = len(self._pending)
+            batches = (
+                math.ceil(pending / input.batch_size)
+                if timed_out or self._exit
+                else pending // input.batch_size
+            )
+            for _ in range(batches):
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(input.batch_size, len(self._pending)))
+                ]
+                await workflow.execute_activity(
+                    store_greetings,
+                    batch,
+                    start_to_close_timeout=timedelta(seconds=30),
+                )
+                stored += len(batch)
+                if self._history_is_long(input.max_history_events):
+                    break
+
+            if self._exit and not self._pending:
+                return stored
+            if self._history_is_long(input.max_history_events):
+                # Greetings not stored yet, including Signals received while storing, are carried over in order
+                workflow.continue_as_new(
+                    CompactGreetingInput(
+                        pending=list(self._pending),
+                        stored=stored,
+                        batch_size=input.batch_size,
+                        flush_interval=input.flush_interval,
+                        max_history_events=input.max_history_events,
+                        exit=self._exit,
+                    )
+                )
+
+    @staticmethod
+    def _history_is_long(max_history_events: int) -> bool:
+        info = workflow.info()
+        if info.get_current_history_length() >= max_history_events:
+            return True
+        # Added in later SDK versions, and set by the server from its own History limits
+        suggested = getattr(info, "is_continue_as_new_suggested", None)
+        return bool(suggested and suggested())
+
+    @workflow.signal
+    def submit_greeting(self, name: str) -> None:
+        self._pending.append(f"Hello, {name}")
+
+    @workflow.signal
+    def submit_greetings(self, names: List[str]) -> None:
+        self._pending.extend(f"Hello, {name}" for name in names)
+
+    @workflow.signal
+    def exit(self) -> None:
+        self._exit = True
+
+    @workflow.signal(name="Custom Signal Name")
+    def custom_signal(self, name: str) -> None:
+        self._pending.append(f"Hello, {name}")
@@ -53,6 +53,12 @@ class GreetingWorkflow:
     async def custom_signal(self, name: str) -> None:
         await self._pending_greetings.put(name)
 
+    # One Signal for many names adds one event and at most one Workflow Task instead of one per name
+    @workflow.signal
+    async def submit_greetings(self, names: List[str]) -> None:
+        for name in names:
+            await self._pending_greetings.put(name)
+
 
 """ @dacx
 id: how-to-define-a-signal-in-python
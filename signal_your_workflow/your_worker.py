@@ -1,15 +1,44 @@
 import asyncio
+import logging
 
 from temporalio.client import Client
 from temporalio.worker import Worker
+
+from shared.cache_stats import cache_stats_from_env
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
+from greeting_activities import store_greetings
+from wf_signal_compact import CompactGreetingWorkflow
 from wf_signal_dacx import GreetingWorkflow
 
 
 async def main():
-    client = await Client.connect("localhost:7233")
-    worker = Worker(client, task_queue="signal-tq", workflows=[GreetingWorkflow])
-    await worker.run()
+    # Set TEMPORAL_CACHE_STATS_INTERVAL to log sticky cache hits, misses and evictions
+    cache_stats = cache_stats_from_env()
+    client = await Client.connect(
+        "localhost:7233", runtime=cache_stats.runtime if cache_stats else None
+    )
+    worker = Worker(
+        client,
+        task_queue="signal-tq",
+        workflows=[GreetingWorkflow, CompactGreetingWorkflow],
+        activities=[store_greetings],
+        workflow_runner=sandbox_runner(),
+        **worker_options(),
+    )
+    log_task = None
+    if cache_stats:
+        log_task = asyncio.create_task(cache_stats.log_forever())
+    try:
+        await worker.run()
+    finally:
+        if log_task:
+            log_task.cancel()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    install_metrics()
     asyncio.run(main())
@@ -1,11 +1,21 @@
 import argparse
 import asyncio
+import logging
+import sys
+from datetime import timedelta
 
-from activities import post_patch_activity, pre_patch_activity
 from temporalio.client import Client
 from temporalio.worker import Worker
 
-interrupt_event = asyncio.Event()
+from shared.metrics import install_metrics
+from shared.shutdown import run_until_signalled
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
+from activities import post_patch_activity, pre_patch_activity
+
+# How much longer than the grace timeout to wait for cancelled Activities before exiting anyway
+CANCEL_WAIT_SECONDS = 5
 
 
 async def main():
@@ -16,13 +26,18 @@ async def main():
         help="Which workflow. Can be 'initial', 'patched', 'patch-deprecated', or 'patch-complete'",
         required=True,
     )
+    parser.add_argument(
+        "--grace-timeout",
+        type=float,
+        help="Seconds in-flight Activities may run after SIGTERM before they are cancelled (default 30, or the Worker profile's graceful_shutdown_timeout)",
+    )
     args = parser.parse_args()
     if args.workflow == "initial":
         from version_your_workflows.workflow_1_initial_dacx import MyWorkflow
     elif args.workflow == "patched":
-        from workflow_2_patched import MyWorkflow  # type: ignore
+        from version_your_workflows.workflow_2_patched_dacx import MyWorkflow  # type: ignore
     elif args.workflow == "patch-deprecated":
-        from workflow_3_patch_deprecated import MyWorkflow  # type: ignore
+        from version_your_workflows.workflow_3_patch_deprecated_dacx import MyWorkflow  # type: ignore
     elif args.workflow == "patch-complete":
         from version_your_workflows.workflow_4_patch_complete_dacx import MyWorkflow  # type: ignore
     else:
@@ -31,23 +46,34 @@ async def main():
     # Connect client
     client = await Client.connect("localhost:7233")
 
+    options = worker_options()
+    if args.grace_timeout is not None:
+        options["graceful_shutdown_timeout"] = timedelta(seconds=args.grace_timeout)
+    options.setdefault("graceful_shutdown_timeout", timedelta(seconds=30))
+
     # Run a worker for the workflow
-    async with Worker(
+    worker = Worker(
         client,
         task_queue="patching-task-queue",
         workflows=[MyWorkflow],
         activities=[pre_patch_activity, post_patch_activity],
-    ):
-        # Wait until interrupted
-        print("Worker started")
-        await interrupt_event.wait()
-        print("Shutting down")
+        workflow_runner=sandbox_runner(),
+        **options,
+    )
+    # Stop polling on SIGTERM or Ctrl+C and let in-flight tasks finish, so rolling deploys
+    # do not leave tasks to time out and be retried on another Worker
+    print("Worker started")
+    await run_until_signalled(
+        worker,
+        drain_timeout=options["graceful_shutdown_timeout"].total_seconds()
+        + CANCEL_WAIT_SECONDS,
+    )
 
 
 if __name__ == "__main__":
-    loop = asyncio.new_event_loop()
-    try:
-        loop.run_until_complete(main())
-    except KeyboardInterrupt:
-        interrupt_event.set()
-        loop.run_until_complete(loop.shutdown_asyncgens())
+    logging.basicConfig(level=logging.INFO)
+    install_metrics()
+    asyncio.run(main())
+    # Flush output before exiting, in case stdout is a pipe to a log collector
+    logging.shutdown()
+    sys.stdout.flush()
@@ -0,0 +1,32 @@
+import logging
+
+from temporalio import activity
+
+from shared.cpu_work import hash_rounds
+
+from data_obj import MoneyTransfer
+
+# Synchronous, CPU-bound versions of the Activities in activities.py, run by sync_worker.py
+# on a thread or process pool. They keep the Activity names, so MoneyTransferWorkflow calls them unchanged.
+
+
+@activity.defn(name="withdraw")
+def withdraw(details: MoneyTransfer):
+    hash_rounds(details.reference_id)
+    logging.info(f"Withdrew {details.amount} from {details.sender}'s account.")
+    return details
+
+
+@activity.defn(name="deposit")
+def deposit(details: MoneyTransfer):
+    hash_rounds(details.reference_id)
+    logging.info(f"Deposited {details.amount} to {details.receiver}'s account.")
+    # Fails like the asynchronous deposit, so the Workflow refunds the transfer.
+    raise Exception("This deposit has failed.")
+
+
+@activity.defn(name="refund")
+def refund(details: MoneyTransfer):
+    hash_rounds(details.reference_id)
+    logging.info(f"Refunded {details.amount} to {details.sender}'s account.")
+    return details
@@ -0,0 +1,33 @@
+import asyncio
+
+from temporalio.client import Client
+from temporalio.worker import Worker
+
+from shared.activity_executor import activity_executor
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
+from activities_sync import deposit, refund, withdraw
+from workflow_dacx import MoneyTransferWorkflow
+
+
+async def main():
+    client = await Client.connect("localhost:7233")
+    options = worker_options()
+    with activity_executor(options=options) as executor_options:
+        worker = Worker(
+            client,
+            task_queue="money-transfer",
+            workflows=[MoneyTransferWorkflow],
+            activities=[withdraw, deposit, refund],
+            workflow_runner=sandbox_runner(),
+            **options,
+            **executor_options,
+        )
+        await worker.run()
+
+
+if __name__ == "__main__":
+    install_metrics()
+    asyncio.run(main())
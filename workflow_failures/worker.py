@@ -1,10 +1,15 @@
 import asyncio
 
-from activities import deposit, refund, withdraw
 from temporalio.client import Client
 from temporalio.worker import Worker
 from workflow import MoneyTransferWorkflow
 
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
+from activities import deposit, refund, withdraw
+
 
 async def main():
     client = await Client.connect("localhost:7233")
@@ -13,9 +18,12 @@ async def main():
         task_queue="money-transfer",
         workflows=[MoneyTransferWorkflow],
         activities=[withdraw, deposit, refund],
+        workflow_runner=sandbox_runner(),
+        **worker_options(),
     )
     await worker.run()
 
 
 if __name__ == "__main__":
+    install_metrics()
     asyncio.run(main())
@@ -2,6 +2,11 @@ import asyncio
 
 from temporalio.client import Client
 from temporalio.worker import Worker
+
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
 from activities import your_activity
 from your_workflows import YourWorkflow
 
@@ -13,9 +18,12 @@ async def main():
         task_queue="your-task-queue",
         workflows=[YourWorkflow],
         activities=[your_activity],
+        workflow_runner=sandbox_runner(),
+        **worker_options(),
     )
     await worker.run()
 
 
 if __name__ == "__main__":
+    install_metrics()
     asyncio.run(main())
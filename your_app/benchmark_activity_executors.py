@@ -0,0 +1,104 @@
+"""
+Compare YourWorkflow throughput when its Activity runs as async code, on a thread pool, or on a process pool.
+
+Every mode does the same CPU-bound work per Activity (see shared/cpu_work.py).
+The async Activity blocks the event loop while it works, and the thread pool is limited by the GIL,
+so only the process pool should scale with the number of cores.
+
+    python benchmark_activity_executors.py --workflows 200
+    python benchmark_activity_executors.py --target localhost:7233 --modes thread process
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from contextlib import nullcontext
+
+from temporalio import activity
+from temporalio.client import Client
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import Worker
+
+from shared.activity_executor import activity_executor
+from shared.cpu_work import ROUNDS_ENV, hash_rounds
+
+from your_activities_sync import your_activity as sync_your_activity
+from your_dataobject_dacx import YourParams
+from your_workflows_dacx import YourWorkflow
+
+MODES = ["async", "thread", "process"]
+
+
+@activity.defn(name="your_activity")
+async def async_your_activity(input: YourParams) -> str:
+    hash_rounds(input.name)
+    return f"{input.greeting}, {input.name}!"
+
+
+async def _run_mode(client: Client, mode: str, workflows: int) -> float:
+    task_queue = f"activity-executor-benchmark-{mode}-{uuid.uuid4()}"
+    if mode == "async":
+        activities = [async_your_activity]
+        executor = nullcontext({})
+    else:
+        activities = [sync_your_activity]
+        executor = activity_executor(mode)
+    with executor as executor_options:
+        async with Worker(
+            client,
+            task_queue=task_queue,
+            workflows=[YourWorkflow],
+            activities=activities,
+            **executor_options,
+        ):
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    client.execute_workflow(
+                        YourWorkflow.run,
+                        f"user-{i}",
+                        id=f"{task_queue}-{i}",
+                        task_queue=task_queue,
+                    )
+                    for i in range(workflows)
+                )
+            )
+            return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark Activity executors")
+    parser.add_argument(
+        "--target",
+        help="Temporal Server to use. By default a local dev server is started.",
+    )
+    parser.add_argument(
+        "--workflows", type=int, default=200, help="Workflows to run per mode"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=100_000, help="Hash rounds per Activity"
+    )
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    args = parser.parse_args()
+
+    # Set before any process pool is created, so its processes inherit it
+    os.environ[ROUNDS_ENV] = str(args.rounds)
+
+    if args.target:
+        env = WorkflowEnvironment.from_client(await Client.connect(args.target))
+    else:
+        env = await WorkflowEnvironment.start_local()
+    try:
+        print(f"{os.cpu_count()} cores, {args.workflows} Workflows per mode")
+        print(f"{'mode':<10}{'seconds':>10}{'activities/s':>15}")
+        for mode in args.modes:
+            seconds = await _run_mode(env.client, mode, args.workflows)
+            print(f"{mode:<10}{seconds:>10.2f}{args.workflows / seconds:>15.1f}")
+    finally:
+        await env.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
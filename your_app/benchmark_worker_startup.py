@@ -0,0 +1,114 @@
+"""
+Measure how long a new Worker process takes to complete its first Workflow, with and without warming up.
+
+Each run starts a fresh process, as an autoscaler would, which imports the Workflow code, connects,
+optionally calls `shared.warmup.warm_up()`, starts a Worker and executes one YourWorkflow.
+All times are measured from the moment the process was launched:
+
+- ready: the Worker is about to start polling
+- first result: the first Workflow completed
+- first task: the time between the two, which is what a Workflow waiting on a new Worker sees
+
+    python benchmark_worker_startup.py --runs 5
+    python benchmark_worker_startup.py --target localhost:7233
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import multiprocessing
+import statistics
+import time
+import uuid
+from typing import Dict, List
+
+from temporalio.client import Client
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import Worker
+
+from shared.sandbox import sandbox_runner
+from shared.warmup import warm_up
+
+from your_activities_dacx import your_activity
+from your_workflows_dacx import YourWorkflow
+
+
+async def _cold_start(target: str, warm: bool, launched_at: float) -> Dict[str, float]:
+    runner = sandbox_runner()
+    if warm:
+        await warm_up({YourWorkflow: ["warm-up"]}, workflow_runner=runner)
+    client = await Client.connect(target)
+    task_queue = f"startup-benchmark-{uuid.uuid4()}"
+    async with Worker(
+        client,
+        task_queue=task_queue,
+        workflows=[YourWorkflow],
+        activities=[your_activity],
+        workflow_runner=runner,
+    ):
+        ready = time.time()
+        await client.execute_workflow(
+            YourWorkflow.run, "World", id=task_queue, task_queue=task_queue
+        )
+        first_result = time.time()
+    return {
+        "ready": ready - launched_at,
+        "first_result": first_result - launched_at,
+        "first_task": first_result - ready,
+    }
+
+
+def _cold_start_sync(target: str, warm: bool, launched_at: float) -> Dict[str, float]:
+    return asyncio.run(_cold_start(target, warm, launched_at))
+
+
+def _run_process(target: str, warm: bool) -> Dict[str, float]:
+    with concurrent.futures.ProcessPoolExecutor(
+        1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_cold_start_sync, target, warm, time.time()).result()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark Worker cold starts")
+    parser.add_argument(
+        "--target",
+        help="Temporal Server to use. By default a local dev server is started.",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Processes to start for each mode"
+    )
+    args = parser.parse_args()
+
+    if args.target:
+        env = WorkflowEnvironment.from_client(await Client.connect(args.target))
+    else:
+        env = await WorkflowEnvironment.start_local()
+    target = env.client.service_client.config.target_host
+    try:
+        results: Dict[bool, List[Dict[str, float]]] = {False: [], True: []}
+        for _ in range(args.runs):
+            # Alternate the modes so both see the same server load
+            for warm in (False, True):
+                results[warm].append(
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, _run_process, target, warm
+                    )
+                )
+    finally:
+        await env.shutdown()
+
+    print(f"Median of {args.runs} cold starts, in milliseconds")
+    print(f"{'mode':<10}{'ready':>10}{'first task':>12}{'first result':>14}")
+    for warm, runs in results.items():
+        median = {
+            key: statistics.median(run[key] for run in runs) * 1000 for key in runs[0]
+        }
+        print(
+            f"{'warm-up' if warm else 'cold':<10}{median['ready']:>10.0f}"
+            f"{median['first_task']:>12.0f}{median['first_result']:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
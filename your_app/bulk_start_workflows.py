@@ -0,0 +1,176 @@
+"""
+Start many YourWorkflow Executions from a stream of inputs, with a bounded number of starts in flight.
+
+This is the bulk version of run_workflow_dacx.py. Each input line is a name, or a JSON object with a "name"
+and optionally an "id":
+
+    Alice
+    {"id": "greeting-bob", "name": "Bob"}
+
+A line without an id gets `<id prefix>-<line number>`, and Workflow Ids are never reused, so running the same
+input again only starts the Workflows that were not started before.
+The others raise WorkflowAlreadyStartedError and are counted as already started.
+
+    python bulk_start_workflows.py names.txt --concurrency 200
+    seq 1000000 | python bulk_start_workflows.py - --id-prefix batch-7
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import sys
+import time
+from typing import AsyncIterator, Dict, Iterator, TextIO, Tuple
+
+from temporalio.client import Client
+from temporalio.common import WorkflowIDReusePolicy
+from temporalio.exceptions import WorkflowAlreadyStartedError
+from temporalio.service import RPCError
+
+from shared.client_pool import get_client
+from shared.latency import LatencyHistogram
+
+from your_workflows_dacx import YourWorkflow
+
+logger = logging.getLogger(__name__)
+
+# Lines read from the input at a time, off the event loop so a slow pipe does not stall the starts in flight
+READ_BATCH = 1000
+
+
+def parse_inputs(lines: Iterator[str], id_prefix: str) -> Iterator[Tuple[str, str]]:
+    """(Workflow Id, name) of every non-empty line."""
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            value = json.loads(line)
+            yield value.get("id") or f"{id_prefix}-{number}", value["name"]
+        else:
+            yield f"{id_prefix}-{number}", line
+
+
+async def _read_batches(
+    inputs: Iterator[Tuple[str, str]],
+) -> AsyncIterator[Tuple[str, str]]:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = await loop.run_in_executor(
+            None, list, itertools.islice(inputs, READ_BATCH)
+        )
+        if not batch:
+            return
+        for item in batch:
+            yield item
+
+
+class BulkStarter:
+    def __init__(self, client: Client, task_queue: str, concurrency: int = 100) -> None:
+        self.client = client
+        self.task_queue = task_queue
+        self.concurrency = concurrency
+        self.counts: Dict[str, int] = {"started": 0, "already_started": 0, "failed": 0}
+        self.latency = LatencyHistogram()
+
+    async def _start(self, workflow_id: str, name: str) -> None:
+        start = time.perf_counter()
+        try:
+            await self.client.start_workflow(
+                YourWorkflow.run,
+                name,
+                id=workflow_id,
+                task_queue=self.task_queue,
+                # A closed Workflow with the same Id is not started again either
+                id_reuse_policy=WorkflowIDReusePolicy.REJECT_DUPLICATE,
+            )
+        except WorkflowAlreadyStartedError:
+            self.counts["already_started"] += 1
+            return
+        except RPCError as err:
+            self.counts["failed"] += 1
+            logger.warning("Could not start %s: %s", workflow_id, err)
+            return
+        self.latency.record(time.perf_counter() - start)
+        self.counts["started"] += 1
+
+    async def run(
+        self, inputs: Iterator[Tuple[str, str]], progress_interval: float = 10.0
+    ) -> float:
+        """Start a Workflow for each input and return the seconds it took."""
+        start = time.perf_counter()
+        # On its own task, so progress is logged even while every start is waiting on the server
+        progress = asyncio.create_task(self._log_progress(progress_interval))
+        in_flight = set()
+        try:
+            async for workflow_id, name in _read_batches(inputs):
+                if len(in_flight) >= self.concurrency:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        # Errors other than the RPC errors counted as failures stop the run
+                        task.result()
+                in_flight.add(asyncio.create_task(self._start(workflow_id, name)))
+            await asyncio.gather(*in_flight)
+        finally:
+            progress.cancel()
+        return time.perf_counter() - start
+
+    async def _log_progress(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            logger.info("%s", self.counts)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Start many YourWorkflow Executions")
+    parser.add_argument(
+        "inputs", type=argparse.FileType("r"), help="File of inputs, or - for stdin"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=100, help="Starts in flight at once"
+    )
+    parser.add_argument(
+        "--id-prefix",
+        default="your-workflow",
+        help="Workflow Id prefix for lines without an id",
+    )
+    parser.add_argument("--task-queue", default="your-task-queue")
+    parser.add_argument("--target", default="localhost:7233")
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=10.0,
+        help="Seconds between progress logs",
+    )
+    args = parser.parse_args()
+
+    client = await get_client(args.target)
+    starter = BulkStarter(client, args.task_queue, args.concurrency)
+    inputs: TextIO = args.inputs
+    with inputs:
+        seconds = await starter.run(
+            parse_inputs(inputs, args.id_prefix), args.progress_interval
+        )
+
+    counts = starter.counts
+    print(
+        f"Started {counts['started']}, already started {counts['already_started']}, "
+        f"failed {counts['failed']} in {seconds:.1f}s"
+    )
+    print(f"Starts/s: {counts['started'] / seconds:.0f}" if seconds else "Starts/s: -")
+    summary = starter.latency.percentiles([50, 99])
+    print(
+        f"Start latency: p50 {summary['p50']:.1f}ms, p99 {summary['p99']:.1f}ms, "
+        f"max {summary['max']:.1f}ms"
+    )
+    if counts["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""
+Get the results of many Workflow Executions, printed as they complete.
+
+This is the bulk version of get_workflow_results_dacx.py. It reads one Workflow Id a line, from a file or stdin
+with `-`, and prints a JSON line for each Workflow as soon as its result is available, whatever its place in the
+input:
+
+    {"workflow_id": "your-workflow-7", "status": "completed", "result": "Hello, 7!", "error": null, "seconds": 0.012}
+
+A Workflow that failed, was not found, or did not complete within `--timeout` seconds is printed with its
+status and error, and the others continue.
+
+    python get_workflow_results.py ids.txt --concurrency 500 --timeout 30 > results.jsonl
+    seq -f "your-workflow-%g" 100000 | python get_workflow_results.py -
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import itertools
+import json
+import logging
+import sys
+from typing import AsyncIterator, Dict, TextIO
+
+from shared.client_pool import get_client
+from shared.results import gather_results
+
+logger = logging.getLogger(__name__)
+
+# Lines read from the input at a time, off the event loop
+READ_BATCH = 1000
+
+
+async def _read_ids(inputs: TextIO) -> AsyncIterator[str]:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = await loop.run_in_executor(
+            None, list, itertools.islice(inputs, READ_BATCH)
+        )
+        if not batch:
+            return
+        for line in batch:
+            workflow_id = line.strip()
+            if workflow_id:
+                yield workflow_id
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Get the results of many Workflow Executions"
+    )
+    parser.add_argument(
+        "inputs",
+        type=argparse.FileType("r"),
+        help="File of Workflow Ids, or - for stdin",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=100, help="Results awaited at once"
+    )
+    parser.add_argument("--timeout", type=float, help="Seconds to wait for each result")
+    parser.add_argument("--target", default="localhost:7233")
+    parser.add_argument("--namespace", default="default")
+    args = parser.parse_args()
+
+    client = await get_client(args.target, args.namespace)
+    counts: Dict[str, int] = {}
+    inputs: TextIO = args.inputs
+    with inputs:
+        async for result in gather_results(
+            client, _read_ids(inputs), args.concurrency, args.timeout
+        ):
+            counts[result.status] = counts.get(result.status, 0) + 1
+            print(json.dumps(dataclasses.asdict(result), default=str), flush=True)
+
+    logger.info("%s", counts)
+    if set(counts) - {"completed"}:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+"""
+The Worker of run_worker_dacx.py, set up for running under load rather than for the docs:
+it warms up YourWorkflow before polling, and uses the shared sandbox runner, Worker profile and metrics.
+
+    TEMPORAL_WORKER_PROFILE=throughput poetry run python run_worker.py
+"""
+
+import asyncio
+
+from temporalio.client import Client
+from temporalio.worker import Worker
+
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.warmup import warm_up
+from shared.worker_profile import worker_options
+
+from your_activities_dacx import your_activity
+from your_workflows_dacx import YourWorkflow
+
+
+async def main():
+    # Pay the first Workflow task's one-time costs before polling, not on the first real task
+    runner = sandbox_runner()
+    await warm_up({YourWorkflow: ["warm-up"]}, workflow_runner=runner)
+    client = await Client.connect("localhost:7233")
+    worker = Worker(
+        client,
+        task_queue="your-task-queue",
+        workflows=[YourWorkflow],
+        activities=[your_activity],
+        workflow_runner=runner,
+        **worker_options(),
+    )
+    await worker.run()
+
+
+if __name__ == "__main__":
+    install_metrics()
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+import asyncio
+from typing import Set
+
+from temporalio.exceptions import WorkflowAlreadyStartedError
+
+from bulk_start_workflows import BulkStarter, parse_inputs
+
+LINES = ["Alice\n", "\n", '{"id": "greeting-bob", "name": "Bob"}\n', "Carol\n"]
+
+
+class _FakeClient:
+    """Starts Workflows in memory, rejecting an Id that was started before."""
+
+    def __init__(self) -> None:
+        self.started: Set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def start_workflow(self, workflow, arg, *, id, task_queue, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if id in self.started:
+                raise WorkflowAlreadyStartedError(id, "YourWorkflow")
+            self.started.add(id)
+        finally:
+            self.in_flight -= 1
+
+
+def test_parse_inputs_ids_are_stable():
+    inputs = list(parse_inputs(iter(LINES), "batch"))
+    assert inputs == [
+        ("batch-1", "Alice"),
+        ("greeting-bob", "Bob"),
+        ("batch-4", "Carol"),
+    ]
+    assert list(parse_inputs(iter(LINES), "batch")) == inputs
+
+
+async def test_starts_in_flight_stay_within_concurrency():
+    client = _FakeClient()
+    starter = BulkStarter(client, "your-task-queue", concurrency=5)
+    inputs = ((f"id-{i}", f"User {i}") for i in range(200))
+    await starter.run(inputs)
+    assert starter.counts == {"started": 200, "already_started": 0, "failed": 0}
+    assert client.max_in_flight == 5
+
+
+async def test_rerun_counts_already_started():
+    client = _FakeClient()
+    await BulkStarter(client, "your-task-queue").run(parse_inputs(iter(LINES), "batch"))
+    rerun = BulkStarter(client, "your-task-queue")
+    await rerun.run(parse_inputs(iter(LINES + ["Dave\n"]), "batch"))
+    assert rerun.counts == {"started": 1, "already_started": 3, "failed": 0}
+    assert "batch-5" in client.started
@@ -0,0 +1,14 @@
+from temporalio import activity
+
+from shared.cpu_work import hash_rounds
+
+from your_dataobject_dacx import YourParams
+
+# Synchronous, CPU-bound version of your_activity, run by run_sync_worker.py on a thread or process pool.
+# It keeps the Activity name, so YourWorkflow calls it unchanged.
+
+
+@activity.defn(name="your_activity")
+def your_activity(input: YourParams) -> str:
+    hash_rounds(input.name)
+    return f"{input.greeting}, {input.name}!"
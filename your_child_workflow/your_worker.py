@@ -2,6 +2,11 @@ import asyncio
 
 from temporalio.client import Client
 from temporalio.worker import Worker
+
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
 from your_child_workflow_dacx import GreetingWorkflow, ComposeGreetingWorkflow
 
 
@@ -11,6 +16,8 @@ async def main():
         client,
         task_queue="hello-child-workflow-task-queue",
         workflows=[GreetingWorkflow, ComposeGreetingWorkflow],
+        workflow_runner=sandbox_runner(),
+        **worker_options(),
     ):
         result = await client.execute_workflow(
             GreetingWorkflow.run,
@@ -22,4 +29,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_metrics()
     asyncio.run(main())
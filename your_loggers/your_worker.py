@@ -3,6 +3,11 @@ import logging
 
 from temporalio.client import Client
 from temporalio.worker import Worker
+
+from shared.metrics import install_metrics
+from shared.sandbox import sandbox_runner
+from shared.worker_profile import worker_options
+
 from your_workflow_dacx import GreetingWorkflow
 
 
@@ -10,10 +15,15 @@ async def main():
     logging.basicConfig(level=logging.INFO)
     client = await Client.connect("localhost:7233")
     worker = Worker(
-        client, task_queue="logging-task-queue", workflows=[GreetingWorkflow]
+        client,
+        task_queue="logging-task-queue",
+        workflows=[GreetingWorkflow],
+        workflow_runner=sandbox_runner(),
+        **worker_options(),
     )
     await worker.run()
 
 
 if __name__ == "__main__":
+    install_metrics()
     asyncio.run(main())